@@ -0,0 +1,190 @@
+import asyncio
+import collections
+from typing import TypeVar, Generic, List, Optional, Iterable, Deque
+
+from Lab1.storage import FifoStorage, LifoStorage
+
+V = TypeVar('V')
+
+
+class _AsyncContainer(Generic[V]):
+    """Общая часть asyncio-контейнеров.
+
+    Ожидающие корутины стоят в очередях futures и будятся по одной.
+    maxsize = 0 означает отсутствие ограничения по емкости.
+    """
+
+    def __init__(self, maxsize: int = 0) -> None:
+        self.maxsize = maxsize
+        self._getters: Deque[asyncio.Future] = collections.deque()
+        self._putters: Deque[asyncio.Future] = collections.deque()
+        # Счетчик для join/task_done
+        self._unfinished = 0
+        self._finished = asyncio.Event()
+        self._finished.set()
+
+    # Работа с хранилищем (_count, _put_item(s), _take_item(s))
+    # приходит из примесей FifoStorage / LifoStorage
+
+    def _has_room(self) -> bool:
+        return self.maxsize <= 0 or self._count() < self.maxsize
+
+    @staticmethod
+    def _wakeup_next(waiters: Deque[asyncio.Future]) -> None:
+        """Будит первую из еще ожидающих корутин"""
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                break
+
+    async def _wait(self, waiters: Deque[asyncio.Future]) -> None:
+        waiter = asyncio.get_running_loop().create_future()
+        waiters.append(waiter)
+        try:
+            await waiter
+        except BaseException:
+            waiter.cancel()
+            try:
+                waiters.remove(waiter)
+            except ValueError:
+                pass
+            # Нас уже разбудили, но отменили - передаем пробуждение следующему
+            if not waiter.cancelled():
+                self._wakeup_next(waiters)
+            raise
+
+    def _added(self, count: int) -> None:
+        self._unfinished += count
+        self._finished.clear()
+        self._wakeup_next(self._getters)
+
+    def _taken(self, count: int) -> None:
+        # Освободилось count мест - будим столько же производителей
+        for _ in range(count):
+            if not self._putters:
+                break
+            self._wakeup_next(self._putters)
+        # Если что-то осталось, эстафету получает следующий потребитель
+        if self._count():
+            self._wakeup_next(self._getters)
+
+    def put_nowait(self, value: V) -> bool:
+        """Кладет элемент без ожидания. Вернет False, если места нет"""
+        if not self._has_room():
+            return False
+        self._put_item(value)
+        self._added(1)
+        return True
+
+    async def put(self, value: V) -> None:
+        """Кладет элемент, дожидаясь свободного места"""
+        while not self._has_room():
+            await self._wait(self._putters)
+        self.put_nowait(value)
+
+    async def put_many(self, values: Iterable[V]) -> None:
+        """Кладет пачку элементов. Потребитель будится один раз на каждую записанную порцию"""
+        items = list(values)
+        done = 0
+        while done < len(items):
+            while not self._has_room():
+                await self._wait(self._putters)
+            room = len(items) - done
+            if self.maxsize > 0:
+                room = min(room, self.maxsize - self._count())
+            self._put_items(items[done:done + room])
+            done += room
+            self._added(room)
+
+    def get_nowait(self) -> Optional[V]:
+        """Забирает элемент без ожидания. Вернет None, если пусто"""
+        if not self._count():
+            return None
+        value = self._take_item()
+        self._taken(1)
+        return value
+
+    async def get(self) -> V:
+        """Забирает элемент, дожидаясь его появления"""
+        while not self._count():
+            await self._wait(self._getters)
+        value = self._take_item()
+        self._taken(1)
+        return value
+
+    async def get_batch(self, n: int) -> List[V]:
+        """Ждет появления элементов и забирает до n штук за одно пробуждение"""
+        while not self._count():
+            await self._wait(self._getters)
+        items = self._take_items(n)
+        self._taken(len(items))
+        return items
+
+    def task_done(self, count: int = 1) -> None:
+        """Отмечает count полученных элементов как обработанные"""
+        if count > self._unfinished:
+            raise ValueError("task_done() вызван больше раз, чем было элементов")
+        self._unfinished -= count
+        if self._unfinished == 0:
+            self._finished.set()
+
+    async def join(self) -> None:
+        """Ждет, пока все положенные элементы не будут обработаны (task_done)"""
+        await self._finished.wait()
+
+    def is_empty(self) -> bool:
+        """Вернет True, если элементов нет"""
+        return not self._count()
+
+    def size(self) -> int:
+        """Текущее количество элементов"""
+        return self._count()
+
+
+class AsyncQueue(FifoStorage[V], _AsyncContainer[V]):
+    """Очередь (FIFO) для asyncio: не блокирует цикл событий"""
+
+    def __init__(self, maxsize: int = 0) -> None:
+        super().__init__(maxsize)
+        self._init_storage()
+
+    def __repr__(self) -> str:
+        return f"<AsyncQueue: {self._snapshot()}>"
+
+
+class AsyncStack(LifoStorage[V], _AsyncContainer[V]):
+    """Стек (LIFO) для asyncio: не блокирует цикл событий"""
+
+    def __init__(self, maxsize: int = 0) -> None:
+        super().__init__(maxsize)
+        self._init_storage()
+
+    def __repr__(self) -> str:
+        return f"<AsyncStack: {self._snapshot()}>"
+
+
+if __name__ == "__main__":
+    async def demo() -> None:
+        print("Тест asyncio-структур")
+        q = AsyncQueue[int](maxsize=4)
+
+        async def consumer() -> None:
+            while True:
+                batch = await q.get_batch(3)
+                print(f"Потребитель получил пачку: {batch}")
+                q.task_done(len(batch))
+
+        worker = asyncio.create_task(consumer())
+        # 10 элементов не влезут в maxsize=4 - производитель подождет потребителя
+        await q.put_many(range(10))
+        await q.join()
+        worker.cancel()
+        print(f"Все обработано, очередь: {q}")
+
+        s = AsyncStack[str]()
+        await s.put("низ")
+        await s.put("верх")
+        print(f"\nСтек: {s}, get -> {await s.get()}")
+
+    asyncio.run(demo())
@@ -0,0 +1,109 @@
+import sys
+import threading
+import time
+from typing import Callable, List
+
+from Lab1.oop_structures import Queue
+from Lab1.concurrent_structures import BlockingQueue
+
+# Маркер остановки потребителя
+STOP = object()
+
+
+class LockedQueue:
+    """Базовая линия: обычная Queue, обернутая в собственный Lock (как делали раньше)"""
+
+    def __init__(self) -> None:
+        self._queue: Queue[object] = Queue()
+        self._lock = threading.Lock()
+
+    def put(self, value: object) -> None:
+        with self._lock:
+            self._queue.enqueue(value)
+
+    def get(self) -> object:
+        # Условий нет - остается только опрашивать очередь
+        while True:
+            with self._lock:
+                if not self._queue.is_empty():
+                    return self._queue.dequeue()
+            time.sleep(0)
+
+
+def run(producers: int, consumers: int, items: int,
+        put: Callable[[object], None], consume: Callable[[], int]) -> float:
+    """Запускает производителей и потребителей, возвращает пропускную способность (элементов/сек)"""
+    per_producer = items // producers
+
+    def produce() -> None:
+        for i in range(per_producer):
+            put(i)
+
+    producer_threads = [threading.Thread(target=produce) for _ in range(producers)]
+    consumer_threads = [threading.Thread(target=consume) for _ in range(consumers)]
+
+    start = time.perf_counter()
+    for t in producer_threads + consumer_threads:
+        t.start()
+    for t in producer_threads:
+        t.join()
+    for _ in range(consumers):
+        put(STOP)
+    for t in consumer_threads:
+        t.join()
+    return per_producer * producers / (time.perf_counter() - start)
+
+
+def bench_locked(producers: int, consumers: int, items: int) -> float:
+    q = LockedQueue()
+
+    def consume() -> int:
+        count = 0
+        while q.get() is not STOP:
+            count += 1
+        return count
+
+    return run(producers, consumers, items, q.put, consume)
+
+
+def bench_blocking(producers: int, consumers: int, items: int, maxsize: int) -> float:
+    q = BlockingQueue[object](maxsize)
+
+    def consume() -> int:
+        count = 0
+        while q.get() is not STOP:
+            count += 1
+        return count
+
+    return run(producers, consumers, items, q.put, consume)
+
+
+def bench_batch(producers: int, consumers: int, items: int, maxsize: int, batch: int) -> float:
+    q = BlockingQueue[object](maxsize)
+
+    def consume() -> int:
+        count = 0
+        while True:
+            chunk: List[object] = q.get_batch(batch)
+            for value in chunk:
+                if value is STOP:
+                    # Остальные маркеры в пачке принадлежат другим потребителям
+                    for _ in range(chunk.count(STOP) - 1):
+                        q.put(STOP)
+                    return count
+                count += 1
+
+    return run(producers, consumers, items, q.put, consume)
+
+
+if __name__ == "__main__":
+    items = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    maxsize = 1024
+
+    print(f"Элементов: {items}, maxsize = {maxsize}")
+    print(f"{'P x C':>6} | {'Lock+Queue':>12} | {'get()':>12} | {'get_batch(64)':>14}   (элементов/сек)")
+    for producers, consumers in [(1, 1), (2, 2), (4, 4), (8, 2)]:
+        locked = bench_locked(producers, consumers, items)
+        blocking = bench_blocking(producers, consumers, items, maxsize)
+        batched = bench_batch(producers, consumers, items, maxsize, 64)
+        print(f"{producers:>2} x {consumers:<2} | {locked:12.0f} | {blocking:12.0f} | {batched:14.0f}")
@@ -0,0 +1,55 @@
+import sys
+import tracemalloc
+from typing import Callable
+
+from Lab1.oop_structures import Queue, Stack
+from Lab1.typed_structures import TypedQueue, TypedStack
+
+
+def bytes_per_element(build: Callable[[int], object], n: int) -> float:
+    """Сколько байт памяти в среднем занимает один элемент заполненной структуры"""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    container = build(n)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del container
+    return (after - before) / n
+
+
+def list_queue(n: int) -> Queue:
+    q = Queue[int]()
+    q.enqueue_many(range(n))
+    return q
+
+
+def typed_queue(n: int) -> TypedQueue:
+    q = TypedQueue('q')
+    q.enqueue_many(range(n))
+    return q
+
+
+def list_stack(n: int) -> Stack:
+    s = Stack[float]()
+    for i in range(n):
+        s.push(i * 0.5)
+    return s
+
+
+def typed_stack(n: int) -> TypedStack:
+    s = TypedStack('d')
+    s.push_many(i * 0.5 for i in range(n))
+    return s
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000
+    print(f"Элементов: {n}")
+    print(f"{'структура':<22} | {'байт/элемент':>12}")
+    for title, build in [
+        ("Queue (int)", list_queue),
+        ("TypedQueue('q')", typed_queue),
+        ("Stack (float)", list_stack),
+        ("TypedStack('d')", typed_stack),
+    ]:
+        print(f"{title:<22} | {bytes_per_element(build, n):12.1f}")
@@ -0,0 +1,52 @@
+import sys
+import time
+from typing import Callable
+
+from Lab1.oop_structures import Queue, Stack
+from Lab1.metrics import InstrumentedQueue, InstrumentedStack, enable_metrics, disable_metrics
+
+
+def queue_cycle(q: Queue, n: int) -> float:
+    """n добавлений и n извлечений, возвращает нс на пару операций"""
+    start = time.perf_counter()
+    for i in range(n):
+        q.enqueue(i)
+    for _ in range(n):
+        q.dequeue()
+    return (time.perf_counter() - start) / n * 1e9
+
+
+def stack_cycle(s: Stack, n: int) -> float:
+    start = time.perf_counter()
+    for i in range(n):
+        s.push(i)
+    for _ in range(n):
+        s.pop()
+    return (time.perf_counter() - start) / n * 1e9
+
+
+def best_of(runs: int, measure: Callable[[], float]) -> float:
+    return min(measure() for _ in range(runs))
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+
+    def switched_off() -> Queue:
+        # Метрики включили и выключили - объект должен вернуться к исходной скорости
+        q = Queue[int]()
+        enable_metrics(q)
+        disable_metrics(q)
+        return q
+
+    print(f"Операций: {n} x 2")
+    print(f"{'вариант':<34} | {'нс/пара':>8}")
+    rows = [
+        ("Queue (метрики выключены)", lambda: queue_cycle(Queue[int](), n)),
+        ("Queue после enable+disable", lambda: queue_cycle(switched_off(), n)),
+        ("InstrumentedQueue", lambda: queue_cycle(InstrumentedQueue[int](), n)),
+        ("Stack (метрики выключены)", lambda: stack_cycle(Stack[int](), n)),
+        ("InstrumentedStack", lambda: stack_cycle(InstrumentedStack[int](), n)),
+    ]
+    for title, measure in rows:
+        print(f"{title:<34} | {best_of(3, measure):8.0f}")
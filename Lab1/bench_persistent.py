@@ -0,0 +1,69 @@
+import sys
+import time
+import tracemalloc
+from typing import Callable, List, Tuple
+
+from Lab1.persistent_structures import init_pqueue, pqueue_add, pqueue_take, init_pstack, pstack_push
+
+
+def keep_versions(make: Callable[[], list]) -> Tuple[float, float]:
+    """Строит и хранит все версии. Возвращает (время, МБ занятой памяти)"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    versions = make()
+    elapsed = time.perf_counter() - start
+    memory = tracemalloc.get_traced_memory()[0] / 2 ** 20
+    tracemalloc.stop()
+    del versions
+    return elapsed, memory
+
+
+def persistent_queue_versions(n: int) -> Callable[[], list]:
+    def make() -> list:
+        # Добавляем n элементов, затем половину забираем - каждую версию сохраняем
+        versions = [init_pqueue()]
+        for i in range(n):
+            versions.append(pqueue_add(versions[-1], i))
+        for _ in range(n // 2):
+            versions.append(pqueue_take(versions[-1])[1])
+        return versions
+    return make
+
+
+def persistent_stack_versions(n: int) -> Callable[[], list]:
+    def make() -> list:
+        versions = [init_pstack()]
+        for i in range(n):
+            versions.append(pstack_push(versions[-1], i))
+        return versions
+    return make
+
+
+def copied_list_versions(n: int) -> Callable[[], list]:
+    def make() -> list:
+        # Снимок через копирование: O(n) времени и памяти на каждую версию
+        versions: List[list] = [[]]
+        for i in range(n):
+            versions.append(versions[-1] + [i])
+        for _ in range(n // 2):
+            versions.append(versions[-1][1:])
+        return versions
+    return make
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    # Копирование квадратично по памяти - для него берем не больше 5000 версий
+    copy_limit = 5_000
+
+    print(f"{'версий':>8} | {'структура':<22} | {'время, с':>9} | {'память, МБ':>10} | {'байт/версия':>11}")
+    for count in sorted({min(n, copy_limit), n}):
+        rows = [
+            ("PQueue (персист.)", persistent_queue_versions(count), count + count // 2),
+            ("PStack (персист.)", persistent_stack_versions(count), count),
+        ]
+        if count <= copy_limit:
+            rows.append(("list + копирование", copied_list_versions(count), count + count // 2))
+        for title, make, total in rows:
+            elapsed, memory = keep_versions(make)
+            print(f"{total:>8} | {title:<22} | {elapsed:9.3f} | {memory:10.1f} | {memory * 2 ** 20 / total:11.0f}")
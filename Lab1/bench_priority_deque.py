@@ -0,0 +1,91 @@
+import collections
+import heapq
+import random
+import sys
+import time
+from typing import Callable
+
+from Lab1.oop_structures import PriorityQueue, Deque
+
+
+def timed(action: Callable[[], None]) -> float:
+    start = time.perf_counter()
+    action()
+    return time.perf_counter() - start
+
+
+def heap_ours(priorities: list) -> None:
+    pq = PriorityQueue[int]()
+    for i, p in enumerate(priorities):
+        pq.push(i, p)
+    while pq.pop() is not None:
+        pass
+
+
+def heap_stdlib(priorities: list) -> None:
+    heap: list = []
+    for i, p in enumerate(priorities):
+        heapq.heappush(heap, (p, i))
+    while heap:
+        heapq.heappop(heap)
+
+
+def decrease_ours(priorities: list) -> None:
+    # decrease_key по ссылке: элемент сдвигается на месте
+    pq = PriorityQueue[int]()
+    handles = [pq.push(i, p) for i, p in enumerate(priorities)]
+    for h in handles[::2]:
+        pq.decrease_key(h, h.priority - 1000)
+    while pq.pop() is not None:
+        pass
+
+
+def decrease_stdlib(priorities: list) -> None:
+    # Для heapq обычный прием - ленивое удаление: кладем новую запись, старую помечаем
+    heap: list = []
+    current = {}
+    for i, p in enumerate(priorities):
+        current[i] = p
+        heapq.heappush(heap, (p, i))
+    for i in range(0, len(priorities), 2):
+        current[i] -= 1000
+        heapq.heappush(heap, (current[i], i))
+    while heap:
+        p, i = heapq.heappop(heap)
+        if current.get(i) == p:
+            del current[i]
+
+
+def deque_ours(n: int) -> None:
+    d = Deque[int]()
+    for i in range(n):
+        d.push_back(i)
+        d.push_front(i)
+    while not d.is_empty():
+        d.pop_front()
+        d.pop_back()
+
+
+def deque_stdlib(n: int) -> None:
+    d: collections.deque = collections.deque()
+    for i in range(n):
+        d.append(i)
+        d.appendleft(i)
+    while d:
+        d.popleft()
+        d.pop()
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    priorities = [random.random() * 1000 for _ in range(n)]
+
+    print(f"Элементов: {n}")
+    print(f"{'операция':<28} | {'наша, с':>9} | {'stdlib, с':>9} | {'отношение':>9}")
+    for title, ours, stdlib in [
+        ("push + pop (vs heapq)", lambda: heap_ours(priorities), lambda: heap_stdlib(priorities)),
+        ("decrease_key (vs heapq)", lambda: decrease_ours(priorities), lambda: decrease_stdlib(priorities)),
+        ("оба конца (vs deque)", lambda: deque_ours(n), lambda: deque_stdlib(n)),
+    ]:
+        t_ours, t_std = timed(ours), timed(stdlib)
+        print(f"{title:<28} | {t_ours:9.3f} | {t_std:9.3f} | {t_ours / t_std:8.1f}x")
@@ -0,0 +1,48 @@
+import sys
+import time
+
+from Lab1.oop_structures import Queue
+from Lab1.functional_structures import init_queue, queue_add_many, queue_take
+
+
+def drain_oop(n: int) -> float:
+    """Время (сек) на полное опустошение ООП-очереди из n элементов"""
+    q = Queue[int]()
+    q.enqueue_many(range(n))
+    start = time.perf_counter()
+    while q.dequeue() is not None:
+        pass
+    return time.perf_counter() - start
+
+
+def drain_functional(n: int) -> float:
+    """Время (сек) на полное опустошение функциональной очереди из n элементов"""
+    q = init_queue()
+    queue_add_many(q, range(n))
+    start = time.perf_counter()
+    while queue_take(q) is not None:
+        pass
+    return time.perf_counter() - start
+
+
+def drain_list(n: int) -> float:
+    """Старое поведение: list.pop(0) для сравнения"""
+    q = list(range(n))
+    start = time.perf_counter()
+    while q:
+        q.pop(0)
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    # Максимальная степень десятки можно передать аргументом: python -m Lab1.bench_queue 6
+    max_power = int(sys.argv[1]) if len(sys.argv) > 1 else 7
+
+    print(f"{'n':>10} | {'ООП, с':>9} | {'функц., с':>9} | {'нс/элемент':>10} | {'list.pop(0), с':>14}")
+    for power in range(3, max_power + 1):
+        n = 10 ** power
+        t_oop = drain_oop(n)
+        t_func = drain_functional(n)
+        # list.pop(0) квадратичен - дальше 10^5 ждать бессмысленно
+        t_list = f"{drain_list(n):14.4f}" if power <= 5 else f"{'-':>14}"
+        print(f"{n:>10} | {t_oop:9.4f} | {t_func:9.4f} | {t_oop / n * 1e9:10.1f} | {t_list}")
@@ -0,0 +1,78 @@
+import multiprocessing as mp
+import sys
+import time
+from typing import Any
+
+from Lab1.shm_queue import SharedMemoryQueue
+
+# Маркер конца потока (пустая запись)
+STOP = b''
+
+
+def shm_producer(q: SharedMemoryQueue, items: int, payload: bytes) -> None:
+    for _ in range(items):
+        q.enqueue(payload)
+    q.enqueue(STOP)
+    q.close()
+
+
+def shm_consumer(q: SharedMemoryQueue) -> None:
+    delay = 0.0
+    while True:
+        value = q.dequeue()
+        if value is None:
+            # Пусто - немного уступаем процессор производителю
+            time.sleep(delay)
+            delay = min(delay * 2 or 1e-6, 1e-3)
+            continue
+        delay = 0.0
+        if value == STOP:
+            break
+    q.close()
+
+
+def mp_producer(q: Any, items: int, payload: bytes) -> None:
+    for _ in range(items):
+        q.put(payload)
+    q.put(STOP)
+
+
+def mp_consumer(q: Any) -> None:
+    while q.get() != STOP:
+        pass
+
+
+def run_pairs(pairs: int, items: int, payload: bytes, shared: bool) -> float:
+    """Запускает pairs пар производитель/потребитель, возвращает суммарные записей/сек"""
+    queues = [SharedMemoryQueue(capacity=1 << 20) if shared else mp.Queue() for _ in range(pairs)]
+    producer, consumer = (shm_producer, shm_consumer) if shared else (mp_producer, mp_consumer)
+    processes = []
+    for q in queues:
+        processes.append(mp.Process(target=consumer, args=(q,)))
+        processes.append(mp.Process(target=producer, args=(q, items, payload)))
+
+    start = time.perf_counter()
+    for p in processes:
+        p.start()
+    for p in processes:
+        p.join()
+    elapsed = time.perf_counter() - start
+
+    if shared:
+        for q in queues:
+            q.close()
+            q.unlink()
+    return pairs * items / elapsed
+
+
+if __name__ == "__main__":
+    max_pairs = int(sys.argv[1]) if len(sys.argv) > 1 else mp.cpu_count()
+    items = int(sys.argv[2]) if len(sys.argv) > 2 else 100_000
+    payload = b'x' * 64
+
+    print(f"Записей на пару: {items}, размер записи: {len(payload)} байт")
+    print(f"{'пар':>4} | {'SharedMemoryQueue':>18} | {'multiprocessing.Queue':>22}   (записей/сек)")
+    for pairs in range(1, max_pairs + 1):
+        shm_rate = run_pairs(pairs, items, payload, shared=True)
+        mp_rate = run_pairs(pairs, items, payload, shared=False)
+        print(f"{pairs:>4} | {shm_rate:18.0f} | {mp_rate:22.0f}")
@@ -0,0 +1,121 @@
+from typing import TypeVar, Generic, List, Iterator, Union
+
+V = TypeVar('V')
+
+# Приоритет - любое число, меньше значит раньше
+Priority = Union[int, float]
+
+
+class HeapHandle(Generic[V]):
+    """Ссылка на элемент кучи. Нужна, чтобы потом понизить его приоритет (decrease_key)"""
+
+    __slots__ = ('value', '_key', '_index')
+
+    def __init__(self, priority: Priority, value: V, order: int, index: int) -> None:
+        self.value = value
+        # Ключ сравнения: при равных приоритетах раньше выходит добавленный раньше.
+        # Кортежи сравниваются на уровне C, это заметно быстрее своего __lt__
+        self._key = (priority, order)
+        # Позиция в массиве кучи; -1 - элемент уже извлечен
+        self._index = index
+
+    @property
+    def priority(self) -> Priority:
+        return self._key[0]
+
+    def __repr__(self) -> str:
+        return f"HeapHandle({self.priority!r}, {self.value!r})"
+
+
+class BinaryHeap(Generic[V]):
+    """Двоичная min-куча на массиве (хранилище для очереди с приоритетом).
+
+    push / pop - O(log n), peek - O(1). Каждый элемент помнит свою позицию,
+    поэтому decrease_key по ссылке тоже O(log n), без поиска по куче.
+    """
+
+    __slots__ = ('_heap', '_counter')
+
+    def __init__(self) -> None:
+        self._heap: List[HeapHandle[V]] = []
+        self._counter = 0
+
+    def _place(self, handle: HeapHandle[V], index: int) -> None:
+        self._heap[index] = handle
+        handle._index = index
+
+    def _sift_up(self, index: int) -> None:
+        heap = self._heap
+        handle = heap[index]
+        key = handle._key
+        while index > 0:
+            parent = (index - 1) // 2
+            if not key < heap[parent]._key:
+                break
+            self._place(heap[parent], index)
+            index = parent
+        self._place(handle, index)
+
+    def _sift_down(self, index: int) -> None:
+        heap = self._heap
+        size = len(heap)
+        handle = heap[index]
+        key = handle._key
+        while True:
+            child = 2 * index + 1
+            if child >= size:
+                break
+            if child + 1 < size and heap[child + 1]._key < heap[child]._key:
+                child += 1
+            if not heap[child]._key < key:
+                break
+            self._place(heap[child], index)
+            index = child
+        self._place(handle, index)
+
+    def push(self, value: V, priority: Priority) -> HeapHandle[V]:
+        """Добавляет элемент с приоритетом, возвращает ссылку на него"""
+        handle = HeapHandle(priority, value, self._counter, len(self._heap))
+        self._counter += 1
+        self._heap.append(handle)
+        self._sift_up(handle._index)
+        return handle
+
+    def peek(self) -> HeapHandle[V]:
+        """Элемент с наименьшим приоритетом (без извлечения)"""
+        if not self._heap:
+            raise IndexError("peek из пустой кучи")
+        return self._heap[0]
+
+    def pop(self) -> HeapHandle[V]:
+        """Извлекает элемент с наименьшим приоритетом"""
+        if not self._heap:
+            raise IndexError("pop из пустой кучи")
+        heap = self._heap
+        top = heap[0]
+        last = heap.pop()
+        if heap:
+            self._place(last, 0)
+            self._sift_down(0)
+        top._index = -1
+        return top
+
+    def decrease_key(self, handle: HeapHandle[V], priority: Priority) -> None:
+        """Понижает приоритет элемента по ссылке"""
+        index = handle._index
+        if index < 0 or index >= len(self._heap) or self._heap[index] is not handle:
+            raise ValueError("Элемент не находится в этой куче")
+        if priority > handle.priority:
+            raise ValueError(f"Новый приоритет {priority} больше текущего {handle.priority}")
+        handle._key = (priority, handle._key[1])
+        self._sift_up(index)
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def __iter__(self) -> Iterator[HeapHandle[V]]:
+        """Элементы в порядке извлечения (без изменения кучи)"""
+        return iter(sorted(self._heap, key=lambda h: h._key))
+
+    def __repr__(self) -> str:
+        return f"BinaryHeap({[(h.priority, h.value) for h in self]})"
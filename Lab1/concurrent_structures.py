@@ -0,0 +1,127 @@
+import threading
+from typing import TypeVar, Generic, List, Optional
+
+from Lab1.storage import FifoStorage, LifoStorage
+
+V = TypeVar('V')
+
+
+class _BlockingContainer(Generic[V]):
+    """Общая часть потокобезопасных контейнеров.
+
+    Одна блокировка и два условия на ней: "появился элемент" и "освободилось место".
+    maxsize = 0 означает отсутствие ограничения по емкости.
+    """
+
+    def __init__(self, maxsize: int = 0) -> None:
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+
+    # Работа с хранилищем (_count, _put_item, _take_item, _take_items)
+    # приходит из примесей FifoStorage / LifoStorage и вызывается под блокировкой
+
+    def _has_room(self) -> bool:
+        return self.maxsize <= 0 or self._count() < self.maxsize
+
+    def put(self, value: V, block: bool = True, timeout: Optional[float] = None) -> bool:
+        """Кладет элемент. Если места нет - ждет (не дольше timeout). Вернет False, если не дождались"""
+        with self._not_full:
+            if not self._not_full.wait_for(self._has_room, timeout if block else 0):
+                return False
+            self._put_item(value)
+            self._not_empty.notify()
+            return True
+
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> Optional[V]:
+        """Забирает элемент. Если пусто - ждет (не дольше timeout). Вернет None, если не дождались"""
+        with self._not_empty:
+            if not self._not_empty.wait_for(self._count, timeout if block else 0):
+                return None
+            value = self._take_item()
+            self._not_full.notify()
+            return value
+
+    def get_batch(self, n: int, timeout: Optional[float] = None) -> List[V]:
+        """Забирает до n элементов за один захват блокировки.
+
+        Ждет только появления первого элемента, остальные забирает сколько есть.
+        """
+        with self._not_empty:
+            if not self._not_empty.wait_for(self._count, timeout):
+                return []
+            items = self._take_items(n)
+            self._not_full.notify(len(items))
+            return items
+
+    def is_empty(self) -> bool:
+        """Вернет True, если элементов нет"""
+        with self._lock:
+            return not self._count()
+
+    def size(self) -> int:
+        """Текущее количество элементов"""
+        with self._lock:
+            return self._count()
+
+
+class BlockingQueue(FifoStorage[V], _BlockingContainer[V]):
+    """Потокобезопасная очередь (FIFO) с ограничением емкости"""
+
+    def __init__(self, maxsize: int = 0) -> None:
+        super().__init__(maxsize)
+        self._init_storage()
+
+    # Совместимость с интерфейсом Queue
+    def enqueue(self, value: V) -> None:
+        """Добавление в конец очереди (ждет свободного места)"""
+        self.put(value)
+
+    def dequeue(self) -> Optional[V]:
+        """Извлечение из начала очереди без ожидания"""
+        return self.get(block=False)
+
+    def __repr__(self) -> str:
+        with self._lock:
+            return f"<BlockingQueue: {self._snapshot()}>"
+
+
+class BlockingStack(LifoStorage[V], _BlockingContainer[V]):
+    """Потокобезопасный стек (LIFO) с ограничением емкости"""
+
+    def __init__(self, maxsize: int = 0) -> None:
+        super().__init__(maxsize)
+        self._init_storage()
+
+    # Совместимость с интерфейсом Stack
+    def push(self, value: V) -> None:
+        """Кладем элемент на вершину (ждет свободного места)"""
+        self.put(value)
+
+    def pop(self) -> Optional[V]:
+        """Забираем элемент с вершины без ожидания"""
+        return self.get(block=False)
+
+    def __repr__(self) -> str:
+        with self._lock:
+            return f"<BlockingStack: {self._snapshot()}>"
+
+
+if __name__ == "__main__":
+    print("Тест потокобезопасных структур")
+
+    q = BlockingQueue[int](maxsize=2)
+    print(f"put 1: {q.put(1)}, put 2: {q.put(2)}")
+    print(f"put 3 с таймаутом (очередь полна): {q.put(3, timeout=0.1)}")
+    print(f"Очередь: {q}")
+
+    consumer = threading.Thread(target=lambda: print(f"Потребитель забрал пачку: {q.get_batch(10)}"))
+    consumer.start()
+    consumer.join()
+    print(f"get с таймаутом (очередь пуста): {q.get(timeout=0.1)}")
+
+    s = BlockingStack[str]()
+    s.push("низ")
+    s.push("верх")
+    print(f"\nСтек: {s}, pop -> {s.pop()}")
@@ -1,33 +1,46 @@
-from typing import TypeVar, List, Optional, NoReturn
+from typing import TypeVar, List, Optional, NoReturn, Iterable
+
+from Lab1.ring_buffer import RingBuffer
+from Lab1.binary_heap import BinaryHeap, HeapHandle, Priority
 
 E = TypeVar('E')
 
 # Логика Очереди (Queue)
 
-def init_queue() -> List[E]:
-    """Инициализирует пустую очередь"""
-    return []
+def init_queue() -> RingBuffer[E]:
+    """Инициализирует пустую очередь (кольцевой буфер)"""
+    return RingBuffer()
 
 
-def queue_add(q: List[E], value: E) -> None:
-    """Добавляет элемент в очередь. Изменяет переданный список напрямую (без копирования)"""
+def queue_add(q: RingBuffer[E], value: E) -> None:
+    """Добавляет элемент в очередь. Изменяет переданный буфер напрямую (без копирования)"""
     q.append(value)
 
 
-def queue_take(q: List[E]) -> Optional[E]:
+def queue_add_many(q: RingBuffer[E], values: Iterable[E]) -> None:
+    """Добавляет в очередь сразу пачку элементов"""
+    q.extend(values)
+
+
+def queue_take(q: RingBuffer[E]) -> Optional[E]:
     """Извлекает первый элемент из очереди. Возвращает None, если очередь пуста"""
     if not q:
         return None
-    # Удаляем нулевой элемент.
-    return q.pop(0)
+    # Сдвигается только голова буфера, элементы остаются на месте
+    return q.popleft()
+
 
+def queue_take_many(q: RingBuffer[E], n: int) -> List[E]:
+    """Извлекает до n первых элементов из очереди"""
+    return q.popleft_many(n)
 
-def queue_check_empty(q: List[E]) -> bool:
+
+def queue_check_empty(q: RingBuffer[E]) -> bool:
     """Возвращает True, если очередь пуста"""
     return not q
 
 
-def queue_length(q: List[E]) -> int:
+def queue_length(q: RingBuffer[E]) -> int:
     """Возвращает текущую длину очереди"""
     return len(q)
 
@@ -61,12 +74,87 @@ def stack_height(s: List[E]) -> int:
     return len(s)
 
 
+# Логика Очереди с приоритетом (Heap)
+
+def init_heap() -> BinaryHeap[E]:
+    """Инициализирует пустую очередь с приоритетом (двоичная куча)"""
+    return BinaryHeap()
+
+
+def heap_push(h: BinaryHeap[E], value: E, priority: Priority) -> HeapHandle[E]:
+    """Добавляет элемент с приоритетом. Возвращает ссылку для heap_decrease_key"""
+    return h.push(value, priority)
+
+
+def heap_pop(h: BinaryHeap[E]) -> Optional[E]:
+    """Извлекает элемент с наименьшим приоритетом. Возвращает None, если куча пуста"""
+    if not h:
+        return None
+    return h.pop().value
+
+
+def heap_decrease_key(h: BinaryHeap[E], handle: HeapHandle[E], priority: Priority) -> None:
+    """Понижает приоритет элемента по ссылке"""
+    h.decrease_key(handle, priority)
+
+
+def heap_check_empty(h: BinaryHeap[E]) -> bool:
+    """Возвращает True, если куча пуста"""
+    return not h
+
+
+def heap_length(h: BinaryHeap[E]) -> int:
+    """Возвращает количество элементов в куче"""
+    return len(h)
+
+
+# Логика Дека (Deque)
+
+def init_deque() -> RingBuffer[E]:
+    """Инициализирует пустой дек (кольцевой буфер)"""
+    return RingBuffer()
+
+
+def deque_push_front(d: RingBuffer[E], value: E) -> None:
+    """Добавляет элемент в начало дека"""
+    d.appendleft(value)
+
+
+def deque_push_back(d: RingBuffer[E], value: E) -> None:
+    """Добавляет элемент в конец дека"""
+    d.append(value)
+
+
+def deque_pop_front(d: RingBuffer[E]) -> Optional[E]:
+    """Извлекает элемент из начала дека. Возвращает None, если дек пуст"""
+    if not d:
+        return None
+    return d.popleft()
+
+
+def deque_pop_back(d: RingBuffer[E]) -> Optional[E]:
+    """Извлекает элемент из конца дека. Возвращает None, если дек пуст"""
+    if not d:
+        return None
+    return d.pop()
+
+
+def deque_check_empty(d: RingBuffer[E]) -> bool:
+    """Возвращает True, если дек пуст"""
+    return not d
+
+
+def deque_length(d: RingBuffer[E]) -> int:
+    """Возвращает длину дека"""
+    return len(d)
+
+
 # Демонстрация
 if __name__ == "__main__":
     print("Функциональная реализация (Mutable/In-Place)\n")
 
     # 1. Тест Очереди
-    my_queue: List[str] = init_queue()
+    my_queue: RingBuffer[str] = init_queue()
     print(f"Очередь создана: {my_queue}")
 
     queue_add(my_queue, "Первый")
@@ -90,3 +178,19 @@ if __name__ == "__main__":
     print(f"Сняли верхушку: {top_val}")
     print(f"Стек после pop: {my_stack}")
     print(f"Пустой ли стек? -> {stack_check_empty(my_stack)}")
+
+    # 3. Тест Кучи
+    print("\nТест Очереди с приоритетом\n")
+    my_heap: BinaryHeap[str] = init_heap()
+    heap_push(my_heap, "Обычная задача", 5)
+    late = heap_push(my_heap, "Поздняя задача", 9)
+    heap_decrease_key(my_heap, late, 1)
+    print(f"Куча: {my_heap}")
+    print(f"Первой взята: {heap_pop(my_heap)}")
+
+    # 4. Тест Дека
+    print("\nТест Дека\n")
+    my_deque: RingBuffer[int] = init_deque()
+    deque_push_back(my_deque, 2)
+    deque_push_front(my_deque, 1)
+    print(f"Дек: {my_deque} | с конца -> {deque_pop_back(my_deque)}")
@@ -0,0 +1,228 @@
+import time
+from bisect import bisect_left
+from typing import TypeVar, Dict, Any, List, Optional, Iterable, Union
+
+from Lab1.oop_structures import Queue, Stack
+from Lab1.ring_buffer import RingBuffer
+
+V = TypeVar('V')
+
+# Инструментирование включается явно: обычные Queue / Stack не меняются и
+# ничего не платят. Метрики есть только у Instrumented* классов
+# (или у объекта, переключенного через enable_metrics).
+
+
+class WaitHistogram:
+    """Гистограмма времени ожидания элемента в контейнере (секунды)"""
+
+    # Верхние границы корзин (le в терминах Prometheus), последняя корзина - +Inf
+    BOUNDS = (1e-5, 1e-4, 1e-3, 1e-2, 0.1, 1.0, 10.0)
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(self.BOUNDS) + 1)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect_left(self.BOUNDS, seconds)] += 1
+        self.total += seconds
+        self.count += 1
+
+    def cumulative(self) -> List[int]:
+        """Накопленные счетчики по корзинам (как в формате Prometheus)"""
+        result, running = [], 0
+        for c in self.counts:
+            running += c
+            result.append(running)
+        return result
+
+
+class QueueMetrics:
+    """Счетчики, пиковый размер и гистограмма ожидания для одного контейнера"""
+
+    def __init__(self) -> None:
+        self.started = time.perf_counter()
+        self.enqueued = 0
+        self.dequeued = 0
+        self.size = 0
+        self.peak_size = 0
+        self.wait = WaitHistogram()
+
+    def on_put(self, count: int, size: int) -> None:
+        self.enqueued += count
+        self.size = size
+        if size > self.peak_size:
+            self.peak_size = size
+
+    def on_take(self, stamps: Iterable[float], size: int) -> None:
+        now = time.perf_counter()
+        for stamp in stamps:
+            self.wait.observe(now - stamp)
+            self.dequeued += 1
+        self.size = size
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Снимок метрик в виде словаря"""
+        elapsed = max(time.perf_counter() - self.started, 1e-9)
+        return {
+            "size": self.size,
+            "peak_size": self.peak_size,
+            "enqueued_total": self.enqueued,
+            "dequeued_total": self.dequeued,
+            "enqueue_rate": self.enqueued / elapsed,
+            "dequeue_rate": self.dequeued / elapsed,
+            "wait_seconds": {
+                "buckets": dict(zip([*map(str, WaitHistogram.BOUNDS), "+Inf"], self.wait.cumulative())),
+                "sum": self.wait.total,
+                "count": self.wait.count,
+            },
+        }
+
+    def to_prometheus(self, name: str = "queue") -> str:
+        """Метрики в текстовом формате Prometheus"""
+        lines = [
+            f"# TYPE {name}_size gauge",
+            f"{name}_size {self.size}",
+            f"# TYPE {name}_peak_size gauge",
+            f"{name}_peak_size {self.peak_size}",
+            f"# TYPE {name}_enqueued_total counter",
+            f"{name}_enqueued_total {self.enqueued}",
+            f"# TYPE {name}_dequeued_total counter",
+            f"{name}_dequeued_total {self.dequeued}",
+            f"# TYPE {name}_wait_seconds histogram",
+        ]
+        bounds = [*map(str, WaitHistogram.BOUNDS), "+Inf"]
+        for bound, count in zip(bounds, self.wait.cumulative()):
+            lines.append(f'{name}_wait_seconds_bucket{{le="{bound}"}} {count}')
+        lines.append(f"{name}_wait_seconds_sum {self.wait.total}")
+        lines.append(f"{name}_wait_seconds_count {self.wait.count}")
+        return "\n".join(lines) + "\n"
+
+
+class InstrumentedQueue(Queue[V]):
+    """Очередь с метриками. Рядом с элементами хранится время их добавления"""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._start_metrics()
+
+    def _start_metrics(self) -> None:
+        self.metrics = QueueMetrics()
+        # Метки времени идут в том же порядке, что и элементы
+        self._stamps: RingBuffer[float] = RingBuffer()
+        self._stamps.extend([time.perf_counter()] * self.size())
+        self.metrics.on_put(0, self.size())
+
+    def enqueue(self, value: V) -> None:
+        super().enqueue(value)
+        self._stamps.append(time.perf_counter())
+        self.metrics.on_put(1, len(self._storage))
+
+    def enqueue_many(self, values: Iterable[V]) -> None:
+        before = len(self._storage)
+        super().enqueue_many(values)
+        added = len(self._storage) - before
+        self._stamps.extend([time.perf_counter()] * added)
+        self.metrics.on_put(added, len(self._storage))
+
+    def dequeue(self) -> Optional[V]:
+        if self.is_empty():
+            return None
+        value = super().dequeue()
+        self.metrics.on_take((self._stamps.popleft(),), len(self._storage))
+        return value
+
+    def dequeue_many(self, n: int) -> List[V]:
+        items = super().dequeue_many(n)
+        self.metrics.on_take(self._stamps.popleft_many(len(items)), len(self._storage))
+        return items
+
+
+class InstrumentedStack(Stack[V]):
+    """Стек с метриками. Рядом с элементами хранится время их добавления"""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._start_metrics()
+
+    def _start_metrics(self) -> None:
+        self.metrics = QueueMetrics()
+        self._stamps: List[float] = [time.perf_counter()] * self.size()
+        self.metrics.on_put(0, self.size())
+
+    def push(self, value: V) -> None:
+        super().push(value)
+        self._stamps.append(time.perf_counter())
+        self.metrics.on_put(1, len(self._container))
+
+    def pop(self) -> Optional[V]:
+        if self.is_empty():
+            return None
+        value = super().pop()
+        self.metrics.on_take((self._stamps.pop(),), len(self._container))
+        return value
+
+
+Instrumentable = Union[Queue, Stack]
+
+# Инструментированные двойники подклассов Queue/Stack: Instrumented* идет в MRO
+# перед подклассом, поэтому его переопределения сохраняются
+_instrumented_subclasses: Dict[type, type] = {}
+
+
+def _instrumented_class(cls: type) -> type:
+    if issubclass(cls, Queue):
+        base = InstrumentedQueue
+    elif issubclass(cls, Stack):
+        base = InstrumentedStack
+    else:
+        raise TypeError(f"Метрики есть только у Queue и Stack (и их подклассов), а не у {cls.__name__}")
+    if cls in (Queue, Stack):
+        return base
+    instrumented = _instrumented_subclasses.get(cls)
+    if instrumented is None:
+        instrumented = _instrumented_subclasses[cls] = type(f"Instrumented{cls.__name__}", (base, cls), {})
+    return instrumented
+
+
+def enable_metrics(container: Instrumentable) -> QueueMetrics:
+    """Включает метрики у уже существующей очереди/стека (без копирования данных).
+    Для других контейнеров - TypeError, объект при этом не меняется"""
+    if isinstance(container, (InstrumentedQueue, InstrumentedStack)):
+        return container.metrics
+    original = type(container)
+    container.__class__ = _instrumented_class(original)
+    # Класс, который вернет disable_metrics
+    container._plain_class = original
+    container._start_metrics()
+    return container.metrics
+
+
+def disable_metrics(container: Instrumentable) -> None:
+    """Выключает метрики: объект снова становится того класса, что был до enable_metrics
+    (созданный сразу как Instrumented* - обычной Queue/Stack)"""
+    if isinstance(container, InstrumentedQueue):
+        plain = Queue
+    elif isinstance(container, InstrumentedStack):
+        plain = Stack
+    else:
+        return
+    container.__class__ = container.__dict__.pop('_plain_class', plain)
+    del container.metrics, container._stamps
+
+
+if __name__ == "__main__":
+    print("Тест метрик очереди")
+    q = Queue[str]()
+    q.enqueue("до включения")
+    metrics = enable_metrics(q)
+
+    q.enqueue_many(["А", "Б", "В"])
+    time.sleep(0.01)
+    q.dequeue_many(2)
+    print(f"Очередь: {q}")
+    print(f"Словарь: {metrics.as_dict()}")
+    print(f"\nPrometheus:\n{metrics.to_prometheus('jobs_queue')}")
+
+    disable_metrics(q)
+    print(f"После выключения: {type(q).__name__}, {q}")
@@ -1,4 +1,7 @@
-from typing import TypeVar, Generic, List, Optional
+from typing import TypeVar, Generic, List, Optional, Iterable
+
+from Lab1.ring_buffer import RingBuffer
+from Lab1.binary_heap import BinaryHeap, HeapHandle, Priority
 
 # Объявляем обобщенный тип
 V = TypeVar('V')
@@ -8,18 +11,26 @@ class Queue(Generic[V]):
     """Класс Очереди (First-In-First-Out)."""
 
     def __init__(self) -> None:
-        # Переименование внутреннее хранилище
-        self._storage: List[V] = []
+        # Кольцевой буфер: извлечение из начала за O(1), а не O(n) как list.pop(0)
+        self._storage: RingBuffer[V] = RingBuffer()
 
     def enqueue(self, value: V) -> None:
         """Добавление элемента в конец очереди"""
         self._storage.append(value)
 
+    def enqueue_many(self, values: Iterable[V]) -> None:
+        """Добавление пачки элементов в конец очереди"""
+        self._storage.extend(values)
+
     def dequeue(self) -> Optional[V]:
         """Извлечение элемента из начала очереди"""
         if self.is_empty():
             return None
-        return self._storage.pop(0)
+        return self._storage.popleft()
+
+    def dequeue_many(self, n: int) -> List[V]:
+        """Извлечение до n элементов из начала очереди"""
+        return self._storage.popleft_many(n)
 
     def is_empty(self) -> bool:
         """Вернет True, если очередь пуста"""
@@ -30,7 +41,7 @@ class Queue(Generic[V]):
         return len(self._storage)
 
     def __repr__(self) -> str:
-        return f"<Queue: {self._storage}>"
+        return f"<Queue: {list(self._storage)}>"
 
 
 class Stack(Generic[V]):
@@ -61,6 +72,82 @@ class Stack(Generic[V]):
         return f"<Stack: {self._container}>"
 
 
+class PriorityQueue(Generic[V]):
+    """Класс Очереди с приоритетом (первым выходит элемент с наименьшим приоритетом)"""
+
+    def __init__(self) -> None:
+        self._heap: BinaryHeap[V] = BinaryHeap()
+
+    def push(self, value: V, priority: Priority) -> HeapHandle[V]:
+        """Добавление элемента. Возвращает ссылку для decrease_key"""
+        return self._heap.push(value, priority)
+
+    def pop(self) -> Optional[V]:
+        """Извлечение элемента с наименьшим приоритетом"""
+        if self.is_empty():
+            return None
+        return self._heap.pop().value
+
+    def peek(self) -> Optional[V]:
+        """Элемент с наименьшим приоритетом (без извлечения)"""
+        if self.is_empty():
+            return None
+        return self._heap.peek().value
+
+    def decrease_key(self, handle: HeapHandle[V], priority: Priority) -> None:
+        """Понижение приоритета элемента по ссылке"""
+        self._heap.decrease_key(handle, priority)
+
+    def is_empty(self) -> bool:
+        """Вернет True, если очередь пуста"""
+        return not self._heap
+
+    def size(self) -> int:
+        """Текущее количество элементов"""
+        return len(self._heap)
+
+    def __repr__(self) -> str:
+        return f"<PriorityQueue: {[(h.priority, h.value) for h in self._heap]}>"
+
+
+class Deque(Generic[V]):
+    """Класс Двусторонней очереди: добавление и извлечение с обоих концов за O(1)"""
+
+    def __init__(self) -> None:
+        self._storage: RingBuffer[V] = RingBuffer()
+
+    def push_front(self, value: V) -> None:
+        """Добавление элемента в начало"""
+        self._storage.appendleft(value)
+
+    def push_back(self, value: V) -> None:
+        """Добавление элемента в конец"""
+        self._storage.append(value)
+
+    def pop_front(self) -> Optional[V]:
+        """Извлечение элемента из начала"""
+        if self.is_empty():
+            return None
+        return self._storage.popleft()
+
+    def pop_back(self) -> Optional[V]:
+        """Извлечение элемента из конца"""
+        if self.is_empty():
+            return None
+        return self._storage.pop()
+
+    def is_empty(self) -> bool:
+        """Вернет True, если дек пуст"""
+        return not self._storage
+
+    def size(self) -> int:
+        """Текущее количество элементов"""
+        return len(self._storage)
+
+    def __repr__(self) -> str:
+        return f"<Deque: {list(self._storage)}>"
+
+
 # Проверка работы
 if __name__ == "__main__":
     print("Тест измененной версии")
@@ -84,3 +171,19 @@ if __name__ == "__main__":
     top = s.pop()
     print(f"Достали сверху: {top}")
     print(f"Стек пустой? -> {s.is_empty()}")
+
+    # 3. Очередь с приоритетом
+    pq = PriorityQueue[str]()
+    pq.push("Обычный", 5)
+    vip = pq.push("Поздний VIP", 9)
+    pq.push("Срочный", 1)
+    pq.decrease_key(vip, 0)
+    print(f"\nОчередь с приоритетом: {pq}")
+    print(f"Первым обслужен: {pq.pop()}")
+
+    # 4. Дек
+    d = Deque[int]()
+    d.push_back(2)
+    d.push_front(1)
+    d.push_back(3)
+    print(f"\nДек: {d}, с начала -> {d.pop_front()}, с конца -> {d.pop_back()}")
@@ -0,0 +1,170 @@
+from typing import TypeVar, Optional, Tuple, NamedTuple, Callable, Any, List
+
+E = TypeVar('E')
+
+# Персистентные (неизменяемые) стек и очередь.
+# Каждая операция возвращает новую версию, старая остается рабочей и делит
+# с новой общую часть данных, поэтому "снимок" стоит O(1), а не копию всего списка.
+
+
+# Логика Стека (PStack)
+
+# Стек - односвязный список из кортежей (значение, остаток, высота). Пустой стек - None.
+PStack = Optional[Tuple[Any, Any, int]]
+
+
+def init_pstack() -> PStack:
+    """Возвращает пустой стек"""
+    return None
+
+
+def pstack_push(s: PStack, value: E) -> PStack:
+    """Новая версия стека с value на вершине. Старая версия не меняется"""
+    return value, s, pstack_height(s) + 1
+
+
+def pstack_pop(s: PStack) -> Tuple[Optional[E], PStack]:
+    """Возвращает (вершина, стек без вершины). Для пустого стека - (None, пустой стек)"""
+    if s is None:
+        return None, None
+    return s[0], s[1]
+
+
+def pstack_peek(s: PStack) -> Optional[E]:
+    """Возвращает вершину стека, не снимая ее"""
+    return None if s is None else s[0]
+
+
+def pstack_check_empty(s: PStack) -> bool:
+    """Возвращает True, если стек пуст"""
+    return s is None
+
+
+def pstack_height(s: PStack) -> int:
+    """Возвращает высоту стека (хранится в вершине, O(1))"""
+    return 0 if s is None else s[2]
+
+
+def pstack_to_list(s: PStack) -> List[E]:
+    """Содержимое стека от дна к вершине"""
+    items = []
+    while s is not None:
+        items.append(s[0])
+        s = s[1]
+    items.reverse()
+    return items
+
+
+# Логика Очереди (PQueue) - real-time очередь Окасаки
+
+class _Stream:
+    """Ленивый поток: ячейка (значение, хвост) вычисляется при первом обращении и запоминается.
+
+    Запоминание общее для всех версий очереди, поэтому повторные обращения
+    из старых версий не повторяют работу.
+    """
+
+    __slots__ = ('_thunk', '_cell')
+
+    def __init__(self, thunk: Optional[Callable[[], Any]] = None, cell: Any = None) -> None:
+        self._thunk = thunk
+        self._cell = cell
+
+    def force(self) -> Optional[Tuple[Any, '_Stream']]:
+        if self._thunk is not None:
+            self._cell = self._thunk()
+            self._thunk = None
+        return self._cell
+
+
+_EMPTY_STREAM = _Stream()
+
+
+class PQueue(NamedTuple):
+    """Версия очереди.
+
+    front - ленивый поток начала, rear - список конца (в обратном порядке),
+    schedule - еще не вычисленная часть front. Каждая операция вычисляет одну
+    ячейку schedule, поэтому перестройка размазана по операциям: O(1) в худшем случае.
+    """
+    front: _Stream
+    rear: Optional[Tuple[Any, Any]]
+    schedule: _Stream
+    length: int
+
+
+def _rotate(front: _Stream, rear: Tuple[Any, Any], acc: _Stream) -> _Stream:
+    """Лениво строит front ++ reversed(rear) ++ acc (при |rear| = |front| + 1)"""
+    def step() -> Tuple[Any, _Stream]:
+        cell = front.force()
+        last, rest = rear
+        if cell is None:
+            return last, acc
+        first, tail = cell
+        return first, _rotate(tail, rest, _Stream(cell=(last, acc)))
+    return _Stream(step)
+
+
+def _exec(front: _Stream, rear: Optional[Tuple[Any, Any]], schedule: _Stream, length: int) -> PQueue:
+    cell = schedule.force()
+    if cell is not None:
+        return PQueue(front, rear, cell[1], length)
+    # Расписание исчерпано (|rear| = |front| + 1) - запускаем новую ленивую перестройку
+    front = _rotate(front, rear, _EMPTY_STREAM)
+    return PQueue(front, None, front, length)
+
+
+def init_pqueue() -> PQueue:
+    """Возвращает пустую очередь"""
+    return PQueue(_EMPTY_STREAM, None, _EMPTY_STREAM, 0)
+
+
+def pqueue_add(q: PQueue, value: E) -> PQueue:
+    """Новая версия очереди с value в конце. Старая версия не меняется"""
+    return _exec(q.front, (value, q.rear), q.schedule, q.length + 1)
+
+
+def pqueue_take(q: PQueue) -> Tuple[Optional[E], PQueue]:
+    """Возвращает (первый элемент, очередь без него). Для пустой очереди - (None, та же очередь)"""
+    cell = q.front.force()
+    if cell is None:
+        return None, q
+    value, tail = cell
+    return value, _exec(tail, q.rear, q.schedule, q.length - 1)
+
+
+def pqueue_check_empty(q: PQueue) -> bool:
+    """Возвращает True, если очередь пуста"""
+    return q.length == 0
+
+
+def pqueue_length(q: PQueue) -> int:
+    """Возвращает текущую длину очереди"""
+    return q.length
+
+
+def pqueue_to_list(q: PQueue) -> List[E]:
+    """Содержимое очереди от начала к концу (сама очередь не меняется)"""
+    items = []
+    while not pqueue_check_empty(q):
+        value, q = pqueue_take(q)
+        items.append(value)
+    return items
+
+
+# Демонстрация
+if __name__ == "__main__":
+    print("Персистентные структуры (каждая операция - новая версия)\n")
+
+    q0 = init_pqueue()
+    q1 = pqueue_add(q0, "Первый")
+    q2 = pqueue_add(q1, "Второй")
+    taken, q3 = pqueue_take(q2)
+    print(f"Забрали: {taken}")
+    print(f"Версия 2: {pqueue_to_list(q2)} | Версия 3: {pqueue_to_list(q3)} | Версия 0 пуста? -> {pqueue_check_empty(q0)}")
+
+    s1 = pstack_push(pstack_push(init_pstack(), 100), 200)
+    s2 = pstack_push(s1, 300)
+    top, s3 = pstack_pop(s2)
+    print(f"\nСняли верхушку: {top}")
+    print(f"Стек s2: {pstack_to_list(s2)} | s3: {pstack_to_list(s3)} | s3 и s1 - один объект? -> {s3 is s1}")
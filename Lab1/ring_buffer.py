@@ -0,0 +1,192 @@
+from array import array
+from typing import TypeVar, Generic, List, Optional, Iterable, Iterator
+
+V = TypeVar('V')
+
+
+class RingBuffer(Generic[V]):
+    """Кольцевой буфер (хранилище для очереди).
+
+    Голова и хвост двигаются по кругу, элементы никогда не сдвигаются,
+    поэтому добавление в конец и извлечение из начала - амортизированное O(1).
+    При заполнении емкость удваивается, при заполненности меньше 1/4 - уменьшается вдвое.
+    """
+
+    __slots__ = ('_buf', '_head', '_size', '_min_capacity')
+
+    # Чем затираем освобожденные ячейки (чтобы не держать ссылки на объекты)
+    _blank = None
+
+    # Буфер сжимается, когда занято меньше 1/SHRINK_RATIO ячеек
+    SHRINK_RATIO = 4
+
+    def __init__(self, capacity: int = 8) -> None:
+        self._min_capacity = max(1, capacity)
+        self._buf = self._allocate(self._min_capacity)
+        self._head = 0
+        self._size = 0
+
+    def _allocate(self, capacity: int) -> List[Optional[V]]:
+        """Создает пустое хранилище заданной емкости"""
+        return [self._blank] * capacity
+
+    def _resize(self, capacity: int) -> None:
+        """Переносит элементы в новое хранилище, начиная с нулевой ячейки"""
+        buf, head, size = self._buf, self._head, self._size
+        tail = head + size
+        if tail <= len(buf):
+            items = buf[head:tail]
+        else:
+            items = buf[head:] + buf[:tail - len(buf)]
+        new_buf = self._allocate(capacity)
+        new_buf[:size] = items
+        self._buf = new_buf
+        self._head = 0
+
+    def _maybe_shrink(self) -> None:
+        capacity = len(self._buf)
+        if capacity > self._min_capacity and self._size * self.SHRINK_RATIO <= capacity:
+            self._resize(max(self._min_capacity, capacity // 2))
+
+    @property
+    def capacity(self) -> int:
+        """Текущая емкость хранилища"""
+        return len(self._buf)
+
+    def append(self, value: V) -> None:
+        """Добавляет элемент в конец"""
+        if self._size == len(self._buf):
+            self._resize(len(self._buf) * 2)
+        buf = self._buf
+        buf[(self._head + self._size) % len(buf)] = value
+        self._size += 1
+
+    def extend(self, values: Iterable[V]) -> None:
+        """Добавляет пачку элементов в конец. Емкость увеличивается не больше одного раза"""
+        items = values if isinstance(values, (list, tuple, array)) else list(values)
+        count = len(items)
+        if not count:
+            return
+        needed = self._size + count
+        if needed > len(self._buf):
+            capacity = len(self._buf)
+            while capacity < needed:
+                capacity *= 2
+            self._resize(capacity)
+
+        buf = self._buf
+        start = (self._head + self._size) % len(buf)
+        # Пишем двумя срезами: до конца хранилища и с его начала
+        first = min(count, len(buf) - start)
+        buf[start:start + first] = items[:first]
+        if first < count:
+            buf[:count - first] = items[first:]
+        self._size = needed
+
+    def appendleft(self, value: V) -> None:
+        """Добавляет элемент в начало"""
+        if self._size == len(self._buf):
+            self._resize(len(self._buf) * 2)
+        self._head = (self._head - 1) % len(self._buf)
+        self._buf[self._head] = value
+        self._size += 1
+
+    def pop(self) -> V:
+        """Извлекает элемент из конца"""
+        if not self._size:
+            raise IndexError("pop из пустого буфера")
+        buf = self._buf
+        tail = (self._head + self._size - 1) % len(buf)
+        value = buf[tail]
+        buf[tail] = self._blank
+        self._size -= 1
+        self._maybe_shrink()
+        return value
+
+    def popleft(self) -> V:
+        """Извлекает элемент из начала"""
+        if not self._size:
+            raise IndexError("popleft из пустого буфера")
+        buf, head = self._buf, self._head
+        value = buf[head]
+        buf[head] = self._blank
+        self._head = (head + 1) % len(buf)
+        self._size -= 1
+        self._maybe_shrink()
+        return value
+
+    def popleft_many(self, n: int) -> List[V]:
+        """Извлекает из начала до n элементов за одну операцию"""
+        count = min(n, self._size)
+        if count <= 0:
+            return []
+        buf, head = self._buf, self._head
+        first = min(count, len(buf) - head)
+        items = buf[head:head + first]
+        buf[head:head + first] = self._allocate(first)
+        if first < count:
+            items += buf[:count - first]
+            buf[:count - first] = self._allocate(count - first)
+        self._head = (head + count) % len(buf)
+        self._size -= count
+        self._maybe_shrink()
+        return items
+
+    def clear(self) -> None:
+        """Удаляет все элементы и возвращает минимальную емкость"""
+        self._buf = self._allocate(self._min_capacity)
+        self._head = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[V]:
+        buf, head = self._buf, self._head
+        capacity = len(buf)
+        for i in range(self._size):
+            yield buf[(head + i) % capacity]
+
+    def __repr__(self) -> str:
+        return f"RingBuffer({list(self)})"
+
+
+class TypedRingBuffer(RingBuffer[V]):
+    """Кольцевой буфер поверх array.array: числа хранятся без упаковки в объекты Python.
+
+    typecode - код типа модуля array ('q' - int64, 'd' - float64 и т.д.).
+    """
+
+    __slots__ = ('_typecode',)
+
+    _blank = 0
+
+    def __init__(self, typecode: str, capacity: int = 8) -> None:
+        self._typecode = typecode
+        super().__init__(capacity)
+
+    def _allocate(self, capacity: int) -> array:
+        return array(self._typecode, bytes(capacity * array(self._typecode).itemsize))
+
+    def extend(self, values: Iterable[V]) -> None:
+        # Срезы array принимают только array того же типа
+        super().extend(values if isinstance(values, array) and values.typecode == self._typecode
+                       else array(self._typecode, values))
+
+    @property
+    def typecode(self) -> str:
+        return self._typecode
+
+    def view(self) -> memoryview:
+        """Содержимое буфера как memoryview без копирования.
+
+        Если данные "перевалили" через конец хранилища, они один раз
+        выпрямляются, после чего отдается непрерывный срез.
+        Представление отражает память буфера до следующего изменения очереди.
+        """
+        if self._head + self._size > len(self._buf):
+            self._resize(len(self._buf))
+        return memoryview(self._buf)[self._head:self._head + self._size]
+
+    def __repr__(self) -> str:
+        return f"TypedRingBuffer({self._typecode!r}, {list(self)})"
@@ -0,0 +1,181 @@
+import os
+import struct
+import sys
+import time
+from multiprocessing import resource_tracker, shared_memory
+from typing import Optional, Tuple, Callable
+
+# Заголовок: емкость, позиция записи, позиция чтения, счетчики добавленных и извлеченных записей.
+# Позиции - монотонные счетчики байт, индекс в буфере получается взятием по модулю емкости.
+_HEADER = struct.Struct('<QQQQQ')
+_CAPACITY, _WRITE_POS, _READ_POS, _ENQUEUED, _DEQUEUED = range(0, 40, 8)
+# Данные начинаются с отдельной кэш-линии, чтобы не делить ее с заголовком
+_DATA_OFFSET = 64
+# Префикс длины записи
+_LENGTH = struct.Struct('<I')
+_U64 = struct.Struct('<Q')
+
+
+def _attach_segment(name: str) -> shared_memory.SharedMemory:
+    """Подключение к чужому сегменту без регистрации в resource tracker.
+
+    До Python 3.13 SharedMemory(name=...) регистрирует сегмент и в подключившемся
+    процессе: при его выходе tracker жалуется на утечку и удаляет сегмент, которым
+    владеет создатель очереди. Поэтому регистрация сразу снимается (в 3.13 - track=False).
+    """
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    shm = shared_memory.SharedMemory(name=name)
+    if os.name == 'posix':
+        resource_tracker.unregister(shm._name, 'shared_memory')
+    return shm
+
+
+class SharedMemoryQueue:
+    """Очередь байтовых записей в разделяемой памяти (один производитель, один потребитель).
+
+    Интерфейс повторяет Queue: enqueue / dequeue / size / is_empty.
+    Записи хранятся в кольце как [длина: uint32][данные], поэтому процессы обмениваются
+    данными напрямую через память, без pickle и канала.
+    Позицию записи двигает только производитель, позицию чтения - только потребитель,
+    так что блокировки не нужны. Больше одного производителя/потребителя не поддерживается.
+    """
+
+    def __init__(self, capacity: int = 1 << 20, name: Optional[str] = None) -> None:
+        if name is None:
+            self._shm = shared_memory.SharedMemory(create=True, size=_DATA_OFFSET + capacity)
+            self._buf = self._shm.buf
+            _HEADER.pack_into(self._buf, 0, capacity, 0, 0, 0, 0)
+        else:
+            self._shm = _attach_segment(name)
+            self._buf = self._shm.buf
+        self._capacity = self._read_u64(_CAPACITY)
+
+    @classmethod
+    def attach(cls, name: str) -> 'SharedMemoryQueue':
+        """Подключается к уже созданной очереди (например, в дочернем процессе).
+        Сегмент не удаляется при выходе подключившегося процесса - это дело создателя"""
+        return cls(name=name)
+
+    def __reduce__(self) -> Tuple[Callable[[str], 'SharedMemoryQueue'], Tuple[str]]:
+        # При передаче в другой процесс пересылается только имя сегмента
+        return self.attach, (self.name,)
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    def _read_u64(self, offset: int) -> int:
+        return _U64.unpack_from(self._buf, offset)[0]
+
+    def _write_u64(self, offset: int, value: int) -> None:
+        _U64.pack_into(self._buf, offset, value)
+
+    def _copy_in(self, pos: int, data: bytes) -> None:
+        """Пишет data в кольцо с позиции pos (с переходом через конец буфера)"""
+        start = pos % self._capacity
+        first = min(len(data), self._capacity - start)
+        self._buf[_DATA_OFFSET + start:_DATA_OFFSET + start + first] = data[:first]
+        if first < len(data):
+            self._buf[_DATA_OFFSET:_DATA_OFFSET + len(data) - first] = data[first:]
+
+    def _copy_out(self, pos: int, length: int) -> bytes:
+        """Читает length байт из кольца с позиции pos"""
+        start = pos % self._capacity
+        first = min(length, self._capacity - start)
+        data = bytes(self._buf[_DATA_OFFSET + start:_DATA_OFFSET + start + first])
+        if first < length:
+            data += bytes(self._buf[_DATA_OFFSET:_DATA_OFFSET + length - first])
+        return data
+
+    def enqueue(self, value: bytes, timeout: Optional[float] = None) -> bool:
+        """Добавление записи в конец очереди.
+
+        Если места нет - ждет, пока потребитель освободит его (не дольше timeout).
+        Вернет False, если не дождались.
+        """
+        record = _LENGTH.pack(len(value)) + bytes(value)
+        if len(record) > self._capacity:
+            raise ValueError(f"Запись ({len(record)} байт) больше емкости очереди ({self._capacity})")
+
+        write_pos = self._read_u64(_WRITE_POS)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        delay = 0.0
+        while self._capacity - (write_pos - self._read_u64(_READ_POS)) < len(record):
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(delay)
+            delay = min(delay * 2 or 1e-6, 1e-3)
+
+        self._copy_in(write_pos, record)
+        # Счетчик до публикации: иначе потребитель успеет забрать запись, и size() станет -1
+        self._write_u64(_ENQUEUED, self._read_u64(_ENQUEUED) + 1)
+        # Сначала данные, потом позиция: потребитель увидит только готовую запись
+        self._write_u64(_WRITE_POS, write_pos + len(record))
+        return True
+
+    def dequeue(self) -> Optional[bytes]:
+        """Извлечение записи из начала очереди. Вернет None, если очередь пуста"""
+        read_pos = self._read_u64(_READ_POS)
+        if read_pos == self._read_u64(_WRITE_POS):
+            return None
+        length = _LENGTH.unpack(self._copy_out(read_pos, _LENGTH.size))[0]
+        value = self._copy_out(read_pos + _LENGTH.size, length)
+        self._write_u64(_READ_POS, read_pos + _LENGTH.size + length)
+        self._write_u64(_DEQUEUED, self._read_u64(_DEQUEUED) + 1)
+        return value
+
+    def is_empty(self) -> bool:
+        """Вернет True, если очередь пуста"""
+        return self._read_u64(_READ_POS) == self._read_u64(_WRITE_POS)
+
+    def size(self) -> int:
+        """Текущее количество записей"""
+        # DEQUEUED читается первым: записи, извлеченные к этому моменту, уже учтены в ENQUEUED
+        dequeued = self._read_u64(_DEQUEUED)
+        return self._read_u64(_ENQUEUED) - dequeued
+
+    def close(self) -> None:
+        """Отключается от сегмента памяти в текущем процессе"""
+        self._buf = None
+        self._shm.close()
+
+    def unlink(self) -> None:
+        """Удаляет сегмент памяти (вызывает создатель очереди, когда она больше не нужна)"""
+        if sys.version_info < (3, 13) and os.name == 'posix':
+            # Дочерние процессы делят tracker с создателем, и unregister в _attach_segment
+            # снимает и его запись. Повторная регистрация не дублирует запись, а unlink ее снимет
+            resource_tracker.register(self._shm._name, 'shared_memory')
+        self._shm.unlink()
+
+    def __enter__(self) -> 'SharedMemoryQueue':
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"<SharedMemoryQueue {self.name}: {self.size()} записей>"
+
+
+def _demo_producer(q: SharedMemoryQueue) -> None:
+    # На уровне модуля: при запуске через spawn дочерний процесс находит функцию по имени
+    for word in ["Первый", "Второй", "Третий"]:
+        q.enqueue(word.encode('utf-8'))
+    q.close()
+
+
+if __name__ == "__main__":
+    import multiprocessing as mp
+
+    print("Тест очереди в разделяемой памяти")
+    queue = SharedMemoryQueue(capacity=64)
+    worker = mp.Process(target=_demo_producer, args=(queue,))
+    worker.start()
+    worker.join()
+
+    print(f"Очередь: {queue}")
+    while not queue.is_empty():
+        print(f"Забрали: {queue.dequeue().decode('utf-8')}")
+    queue.close()
+    queue.unlink()
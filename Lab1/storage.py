@@ -0,0 +1,66 @@
+from typing import TypeVar, Generic, List
+
+from Lab1.ring_buffer import RingBuffer
+
+V = TypeVar('V')
+
+
+class FifoStorage(Generic[V]):
+    """Хранилище очереди поверх кольцевого буфера (порядок FIFO).
+
+    Примесь для синхронных и асинхронных контейнеров: они отвечают за ожидание,
+    а работа с данными у всех одна и та же.
+    """
+
+    def _init_storage(self) -> None:
+        self._storage: RingBuffer[V] = RingBuffer()
+
+    def _count(self) -> int:
+        return len(self._storage)
+
+    def _put_item(self, value: V) -> None:
+        self._storage.append(value)
+
+    def _put_items(self, values: List[V]) -> None:
+        self._storage.extend(values)
+
+    def _take_item(self) -> V:
+        return self._storage.popleft()
+
+    def _take_items(self, n: int) -> List[V]:
+        return self._storage.popleft_many(n)
+
+    def _snapshot(self) -> List[V]:
+        return list(self._storage)
+
+
+class LifoStorage(Generic[V]):
+    """Хранилище стека поверх списка (порядок LIFO)"""
+
+    def _init_storage(self) -> None:
+        self._container: List[V] = []
+
+    def _count(self) -> int:
+        return len(self._container)
+
+    def _put_item(self, value: V) -> None:
+        self._container.append(value)
+
+    def _put_items(self, values: List[V]) -> None:
+        self._container.extend(values)
+
+    def _take_item(self) -> V:
+        return self._container.pop()
+
+    def _take_items(self, n: int) -> List[V]:
+        # Снимаем верхние n элементов в порядке pop (сверху вниз)
+        count = min(n, len(self._container))
+        if count <= 0:
+            return []
+        items = self._container[-count:]
+        del self._container[-count:]
+        items.reverse()
+        return items
+
+    def _snapshot(self) -> List[V]:
+        return self._container[:]
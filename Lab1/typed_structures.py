@@ -0,0 +1,119 @@
+from array import array
+from typing import List, Optional, Iterable, Union
+
+from Lab1.ring_buffer import TypedRingBuffer
+
+# Числовое содержимое типизированных структур
+Number = Union[int, float]
+
+
+class TypedQueue:
+    """Очередь (FIFO) для чисел одного типа.
+
+    Хранит значения в array.array по коду типа ('q' - int64, 'd' - float64, ...),
+    поэтому на элемент уходит itemsize байт вместо указателя и объекта Python.
+    """
+
+    __slots__ = ('_storage',)
+
+    def __init__(self, typecode: str = 'd') -> None:
+        self._storage = TypedRingBuffer[Number](typecode)
+
+    def enqueue(self, value: Number) -> None:
+        """Добавление элемента в конец очереди"""
+        self._storage.append(value)
+
+    def enqueue_many(self, values: Iterable[Number]) -> None:
+        """Добавление пачки элементов в конец очереди"""
+        self._storage.extend(values)
+
+    def dequeue(self) -> Optional[Number]:
+        """Извлечение элемента из начала очереди"""
+        if self.is_empty():
+            return None
+        return self._storage.popleft()
+
+    def dequeue_many(self, n: int) -> List[Number]:
+        """Извлечение до n элементов из начала очереди"""
+        return self._storage.popleft_many(n).tolist() if n > 0 and self._storage else []
+
+    def view(self) -> memoryview:
+        """Содержимое очереди (от начала к концу) как memoryview без копирования"""
+        return self._storage.view()
+
+    @property
+    def typecode(self) -> str:
+        return self._storage.typecode
+
+    def is_empty(self) -> bool:
+        """Вернет True, если очередь пуста"""
+        return not self._storage
+
+    def size(self) -> int:
+        """Текущее количество элементов"""
+        return len(self._storage)
+
+    def __repr__(self) -> str:
+        return f"<TypedQueue[{self.typecode}]: {list(self._storage)}>"
+
+
+class TypedStack:
+    """Стек (LIFO) для чисел одного типа поверх array.array.
+
+    Пока открыт memoryview из view(), массив нельзя менять в размере:
+    push/pop вызовут BufferError. Освобождайте представление (view.release()
+    или with) перед изменением стека.
+    """
+
+    __slots__ = ('_container',)
+
+    def __init__(self, typecode: str = 'd') -> None:
+        self._container = array(typecode)
+
+    def push(self, value: Number) -> None:
+        """Кладем элемент на вершину стека"""
+        self._container.append(value)
+
+    def push_many(self, values: Iterable[Number]) -> None:
+        """Кладем пачку элементов (последний окажется на вершине)"""
+        self._container.extend(values)
+
+    def pop(self) -> Optional[Number]:
+        """Забираем элемент с вершины стека"""
+        if not self._container:
+            return None
+        return self._container.pop()
+
+    def view(self) -> memoryview:
+        """Содержимое стека (от дна к вершине) как memoryview без копирования"""
+        return memoryview(self._container)
+
+    @property
+    def typecode(self) -> str:
+        return self._container.typecode
+
+    def is_empty(self) -> bool:
+        """Вернет True, если стек пуст"""
+        return len(self._container) == 0
+
+    def size(self) -> int:
+        """Количество элементов в стеке."""
+        return len(self._container)
+
+    def __repr__(self) -> str:
+        return f"<TypedStack[{self.typecode}]: {self._container.tolist()}>"
+
+
+if __name__ == "__main__":
+    print("Тест типизированных структур")
+
+    q = TypedQueue('q')
+    q.enqueue_many(range(5))
+    print(f"Очередь: {q}, dequeue -> {q.dequeue()}")
+    with q.view() as mv:
+        print(f"memoryview: формат {mv.format}, {mv.nbytes} байт, {mv.tolist()}")
+
+    s = TypedStack('d')
+    s.push(1.5)
+    s.push(2.5)
+    print(f"\nСтек: {s}, pop -> {s.pop()}")
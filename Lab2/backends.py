@@ -0,0 +1,133 @@
+from array import array
+from typing import Dict, Optional, Union
+
+from Lab2 import flat_storage, linalg, multiply
+from Lab2.flat_storage import FlatStorage
+
+# NumPy - необязательная зависимость: без нее работает чистый Python
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+Num = Union[int, float]
+
+
+class PythonBackend:
+    """Вычисления на чистом Python поверх плоского буфера (всегда доступен).
+
+    Все операции принимают out= - готовое хранилище (или представление) под результат:
+    тогда новая матрица не создается, а out возвращается.
+    """
+
+    name = 'python'
+    # Ускоренный бэкенд выгодно звать даже для списков списков (с переводом туда и обратно)
+    accelerated = False
+
+    def add(self, a: FlatStorage, b: FlatStorage, out: Optional[FlatStorage] = None) -> FlatStorage:
+        return flat_storage.add(a, b, out)
+
+    def scale(self, a: FlatStorage, k: Num, out: Optional[FlatStorage] = None) -> FlatStorage:
+        return flat_storage.scale(a, k, out)
+
+    def matmul(self, a: FlatStorage, b: FlatStorage, out: Optional[FlatStorage] = None) -> FlatStorage:
+        # Наивное, блочное или Штрассен - в зависимости от размера
+        return multiply.matmul_auto(a, b, out)
+
+    def transpose(self, a: FlatStorage, out: Optional[FlatStorage] = None) -> FlatStorage:
+        """Без out - представление без копирования; с out - значения копируются в out"""
+        if out is None:
+            return a.transpose()
+        source = a.transpose()
+        # Транспонирование на месте: строки out - это еще не прочитанные столбцы a
+        out.copy_from(source.copy() if out.data is a.data else source)
+        return out
+
+    def determinant(self, a: FlatStorage) -> float:
+        return linalg.determinant(a)
+
+
+class NumpyBackend(PythonBackend):
+    """Векторизованные вычисления через NumPy (матричное умножение уходит в BLAS).
+
+    Входной буфер не копируется: np.frombuffer + шаги дают ndarray поверх тех же данных.
+    Результат один раз копируется в новый array('d').
+    """
+
+    name = 'numpy'
+    accelerated = True
+
+    @staticmethod
+    def _view(a: FlatStorage, writeable: bool = False) -> 'np.ndarray':
+        if not a.size:
+            return np.zeros(a.shape)
+        # Буфер может быть и не float64 (например, float32 из файла через mmap)
+        code = getattr(a.data, 'typecode', None) or getattr(a.data, 'format', 'd')
+        base = np.frombuffer(a.data, dtype=np.dtype(code))
+        item = base.itemsize
+        return np.lib.stride_tricks.as_strided(
+            base[a.offset:], shape=a.shape,
+            strides=(a.row_stride * item, a.col_stride * item), writeable=writeable)
+
+    @staticmethod
+    def _wrap(result: 'np.ndarray') -> FlatStorage:
+        rows, cols = result.shape
+        data = array('d', bytes(8 * rows * cols))
+        if data:
+            np.frombuffer(data, dtype=np.float64)[:] = result.ravel()
+        return FlatStorage(data, rows, cols)
+
+    def _into(self, out: FlatStorage, compute) -> FlatStorage:
+        """Пишет результат прямо в буфер out (NumPy сам разбирается с перекрытием операндов)"""
+        compute(self._view(out, writeable=True))
+        out.mark_modified()
+        return out
+
+    def add(self, a: FlatStorage, b: FlatStorage, out: Optional[FlatStorage] = None) -> FlatStorage:
+        if out is not None:
+            return self._into(out, lambda target: np.add(self._view(a), self._view(b), out=target))
+        return self._wrap(self._view(a) + self._view(b))
+
+    def scale(self, a: FlatStorage, k: Num, out: Optional[FlatStorage] = None) -> FlatStorage:
+        if out is not None:
+            return self._into(out, lambda target: np.multiply(self._view(a), k, out=target))
+        return self._wrap(self._view(a) * k)
+
+    def matmul(self, a: FlatStorage, b: FlatStorage, out: Optional[FlatStorage] = None) -> FlatStorage:
+        if out is not None:
+            return self._into(out, lambda target: np.matmul(self._view(a), self._view(b), out=target))
+        return self._wrap(self._view(a) @ self._view(b))
+
+    def transpose(self, a: FlatStorage, out: Optional[FlatStorage] = None) -> FlatStorage:
+        if out is not None:
+            return self._into(out, lambda target: np.copyto(target, self._view(a).T))
+        return a.transpose()
+
+    def determinant(self, a: FlatStorage) -> float:
+        return float(np.linalg.det(self._view(a)))
+
+
+_BACKENDS: Dict[str, PythonBackend] = {'python': PythonBackend()}
+if np is not None:
+    _BACKENDS['numpy'] = NumpyBackend()
+
+# По умолчанию - самый быстрый из доступных
+_current: PythonBackend = _BACKENDS.get('numpy', _BACKENDS['python'])
+
+
+def available_backends() -> list[str]:
+    """Имена доступных бэкендов"""
+    return list(_BACKENDS)
+
+
+def get_backend() -> PythonBackend:
+    """Текущий бэкенд вычислений"""
+    return _current
+
+
+def set_backend(name: str) -> None:
+    """Переключает бэкенд ('python' или 'numpy')"""
+    global _current
+    if name not in _BACKENDS:
+        raise ValueError(f"Бэкенд {name!r} недоступен, есть: {available_backends()}")
+    _current = _BACKENDS[name]
@@ -0,0 +1,85 @@
+import random
+import sys
+import time
+from typing import Callable, Any, List
+
+from Lab2.backends import available_backends, set_backend, get_backend
+from Lab2.oop_matrix import Matrix
+from Lab2.functional_matrix import mat_add, mat_mul, mat_transpose, mat_det
+
+# Проверка согласованности бэкендов и сравнение скорости.
+# Без NumPy проверяется только чистый Python.
+
+TOLERANCE = 1e-9
+
+
+def random_grid(rows: int, cols: int, rng: random.Random) -> List[List[float]]:
+    return [[rng.uniform(-10, 10) for _ in range(cols)] for _ in range(rows)]
+
+
+def close(x: Any, y: Any) -> bool:
+    """Сравнение чисел и вложенных списков с относительной погрешностью"""
+    if isinstance(x, list):
+        return len(x) == len(y) and all(close(a, b) for a, b in zip(x, y))
+    return abs(x - y) <= TOLERANCE * max(1.0, abs(x), abs(y))
+
+
+def results_for(a: List[List[float]], b: List[List[float]], sq: List[List[float]]) -> list:
+    """Все проверяемые операции на текущем бэкенде (ООП и функциональный API)"""
+    ma, mb, msq = Matrix(a), Matrix(b), Matrix(sq)
+    return [
+        (ma + ma).to_list(),
+        (ma * 2.5).to_list(),
+        (ma * mb).to_list(),
+        (mb.transpose() * ma.transpose()).to_list(),
+        ma.transpose().to_list(),
+        msq.determinant(),
+        mat_add(a, a),
+        mat_mul(a, 2.5),
+        mat_mul(a, b),
+        mat_transpose(a),
+        mat_det(sq),
+    ]
+
+
+def check_correctness(cases: int = 50) -> None:
+    rng = random.Random(42)
+    backends = available_backends()
+    for case in range(cases):
+        n, m, k = rng.randint(1, 8), rng.randint(1, 8), rng.randint(1, 8)
+        a, b, sq = random_grid(n, m, rng), random_grid(m, k, rng), random_grid(n, n, rng)
+        reference = None
+        for name in backends:
+            set_backend(name)
+            got = results_for(a, b, sq)
+            if reference is None:
+                reference = got
+                continue
+            for idx, (x, y) in enumerate(zip(reference, got)):
+                if not close(x, y):
+                    raise AssertionError(f"Бэкенд {name}: расхождение в операции #{idx}, случай {case}")
+    print(f"Корректность: {cases} случаев, бэкенды {backends} согласованы")
+
+
+def timed(action: Callable[[], Any]) -> float:
+    start = time.perf_counter()
+    action()
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    print(f"Бэкенд по умолчанию: {get_backend().name}")
+    check_correctness()
+
+    rng = random.Random(0)
+    ma, mb = Matrix(random_grid(n, n, rng)), Matrix(random_grid(n, n, rng))
+    det_size = min(n, 8)  # разложение по строке в чистом Python - O(n!)
+    msq = Matrix(random_grid(det_size, det_size, rng))
+
+    print(f"\nМатрицы {n}x{n} (определитель {det_size}x{det_size})")
+    print(f"{'бэкенд':<8} | {'A + B':>8} | {'A * B':>8} | {'A.T':>8} | {'det':>8}   (секунды)")
+    for name in available_backends():
+        set_backend(name)
+        print(f"{name:<8} | {timed(lambda: ma + mb):8.4f} | {timed(lambda: ma * mb):8.4f} | "
+              f"{timed(lambda: ma.transpose()):8.4f} | {timed(lambda: msq.determinant()):8.4f}")
@@ -0,0 +1,52 @@
+import random
+import sys
+import time
+from typing import Callable, Any, List
+
+from Lab2 import linalg
+from Lab2.backends import available_backends, set_backend
+from Lab2.oop_matrix import Matrix
+
+
+def laplace(m: List[List[float]]) -> float:
+    """Прежний алгоритм: разложение по первой строке, O(n!)"""
+    if len(m) == 1:
+        return m[0][0]
+    det = 0.0
+    for i, val in enumerate(m[0]):
+        minor = [row[:i] + row[i + 1:] for row in m[1:]]
+        det += (1 if i % 2 == 0 else -1) * val * laplace(minor)
+    return det
+
+
+def timed(action: Callable[[], Any]) -> float:
+    start = time.perf_counter()
+    action()
+    return time.perf_counter() - start
+
+
+def cell(seconds: float) -> str:
+    return f"{seconds:10.4f}" if seconds >= 0 else f"{'-':>10}"
+
+
+if __name__ == "__main__":
+    max_n = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    sizes = [n for n in (3, 5, 8, 10, 25, 50, 100, 200, 300, 500) if n <= max_n]
+    rng = random.Random(0)
+    extra = [name for name in available_backends() if name != 'python']
+
+    header = f"{'n':>4} | {'Лаплас':>10} | {'LU':>10} | {'Барейс':>10}"
+    header += "".join(f" | {name:>10}" for name in extra)
+    print(header + "   (секунды)")
+    for n in sizes:
+        grid = [[rng.randint(-9, 9) for _ in range(n)] for _ in range(n)]
+        m = Matrix(grid)
+        # Лаплас дальше 8x8 считать бессмысленно, Барейс растит длинные числа
+        t_laplace = timed(lambda: laplace(grid)) if n <= 8 else -1
+        t_lu = timed(lambda: linalg.determinant(m._data))
+        t_bareiss = timed(lambda: m.determinant(exact=True)) if n <= 200 else -1
+        row = f"{n:>4} | {cell(t_laplace)} | {cell(t_lu)} | {cell(t_bareiss)}"
+        for name in extra:
+            set_backend(name)
+            row += f" | {cell(timed(lambda: m.determinant()))}"
+        print(row)
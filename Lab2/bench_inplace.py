@@ -0,0 +1,99 @@
+import gc
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Any, Dict
+
+from Lab2.backends import get_backend
+from Lab2.mapped import MatrixFile
+from Lab2.oop_matrix import Matrix
+
+# Итерационный метод Ричардсона X <- X + w * (B - A * X) (k правых частей сразу) двумя способами:
+# обычными операторами (каждая итерация создает новые матрицы) и через
+# +=, *= и out= (все буферы выделены до цикла).
+# GC: число сборок мусора и время в них (через gc.callbacks).
+
+
+class GcTimer:
+    """Считает сборки мусора и суммарное время в них"""
+
+    def __init__(self) -> None:
+        self.runs = 0
+        self.seconds = 0.0
+        self._start = 0.0
+
+    def __call__(self, phase: str, info: Dict[str, Any]) -> None:
+        if phase == 'start':
+            self._start = time.perf_counter()
+        else:
+            self.runs += 1
+            self.seconds += time.perf_counter() - self._start
+
+
+def measure(loop: Callable[..., Matrix], *args: Matrix) -> tuple:
+    timer = GcTimer()
+    gc.collect()
+    gc.callbacks.append(timer)
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = loop(*args)
+    seconds = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    gc.callbacks.remove(timer)
+    return result, seconds, peak, timer
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    k = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    iterations = int(sys.argv[3]) if len(sys.argv) > 3 else 100
+    rng = random.Random(0)
+    # Диагональное преобладание - итерации сходятся
+    a = Matrix([[rng.uniform(-1, 1) + (4 * n if i == j else 0) for j in range(n)] for i in range(n)])
+    b = Matrix([[rng.uniform(-1, 1) for _ in range(k)] for _ in range(n)])
+    w = 1 / (4 * n)
+
+    def operators(x: Matrix) -> Matrix:
+        for _ in range(iterations):
+            x = x + (b + (a * x) * -1) * w
+        return x
+
+    def in_place(x: Matrix, r: Matrix, wb: Matrix) -> Matrix:
+        for _ in range(iterations):
+            a.mul(x, out=r)     # r = A * x
+            r *= -w
+            r += wb             # r = w * (b - A * x)
+            x += r
+        return x
+
+    print(f"Бэкенд: {get_backend().name}; A {n}x{n}, X {n}x{k}, {iterations} итераций")
+    print(f"Операторы создают 5 матриц {n}x{k} за итерацию ({5 * iterations} всего), на месте - 0")
+    print(f"{'способ':<10} | {'время':>7} | {'пик, КБ':>8} | {'сборок GC':>9} | {'время GC':>8} | невязка")
+    def zeros() -> Matrix:
+        return Matrix([[0.0] * k for _ in range(n)])
+
+    # Начальные и рабочие матрицы создаются до замера
+    for label, loop, args in (("операторы", operators, (zeros(),)),
+                              ("на месте", in_place, (zeros(), zeros(), b * w))):
+        x, seconds, peak, timer = measure(loop, *args)
+        residual = max(abs(v) for row in (b + (a * x) * -1).to_list() for v in row)
+        print(f"{label:<10} | {seconds:7.3f} | {peak / 1024:8.1f} | {timer.runs:>9} | "
+              f"{timer.seconds * 1000:6.2f}мс | {residual:.2e}")
+
+    # Те же операции на месте над матрицей float32 поверх файла: значения приводятся к типу буфера
+    with tempfile.TemporaryDirectory() as tmp:
+        other = Matrix([[1.0, 2.0], [3.0, 4.0]])
+        expected = ((other * other) * other).transpose() * 2 + other
+        with MatrixFile.save(os.path.join(tmp, 'f32.lmat'), other, dtype='f') as f32:
+            m = f32.matrix()
+            m *= other
+            m.mul(other, out=m)
+            m.transpose(out=m)
+            m *= 2
+            m += other
+            ok = m.to_list() == expected.to_list()
+        print(f"float32 на месте (*=, out=, transpose(out=), +=): {'OK' if ok else 'ОШИБКА'}")
@@ -0,0 +1,80 @@
+import random
+import sys
+import time
+import tracemalloc
+from typing import Callable, Any, Tuple, Iterable
+
+from Lab2.backends import get_backend
+from Lab2.flat_storage import FlatStorage
+from Lab2.oop_matrix import Matrix
+
+# Обычные операторы против отложенного режима (Matrix.lazy()).
+# Память считается в "матрицах": пик tracemalloc, деленный на размер одного буфера n x n.
+# Промежуточные матрицы подсчитываются: новые буферы данных FlatStorage, созданные
+# за вычисление, кроме буфера результата (представления вроде транспонирования
+# делят буфер с исходной матрицей и не считаются).
+
+
+def measure(action: Callable[[], Any]) -> Tuple[float, float]:
+    """(секунды, пик памяти в байтах) одного вызова"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    action()
+    seconds = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return seconds, peak
+
+
+def count_temporaries(action: Callable[[], Any], inputs: Iterable[Matrix]) -> int:
+    """Сколько промежуточных буферов создано за вызов (без результата и без буферов входных матриц)"""
+    known = {id(m._data.data) for m in inputs}
+    created = {}
+    original = FlatStorage.__init__
+
+    def tracking(self: FlatStorage, data: Any, *args: Any, **kwargs: Any) -> None:
+        # Ссылка на буфер держится до конца подсчета, чтобы id не переиспользовались
+        created[id(data)] = data
+        original(self, data, *args, **kwargs)
+
+    FlatStorage.__init__ = tracking
+    try:
+        action()
+    finally:
+        FlatStorage.__init__ = original
+    return max(0, sum(1 for key in created if key not in known) - 1)
+
+
+def chain(first: Any, others: list) -> Any:
+    result = first
+    for m in others:
+        result = result + m * 0.5
+    return result
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    rng = random.Random(0)
+    a, b, c = (Matrix([[rng.random() for _ in range(n)] for _ in range(n)]) for _ in range(3))
+    extra = [Matrix([[rng.random() for _ in range(n)] for _ in range(n)]) for _ in range(6)]
+    matrix_bytes = 8 * n * n
+
+    cases = [
+        ("(A + B) * 2 + C",
+         lambda: (a + b) * 2 + c,
+         lambda: ((a.lazy() + b) * 2 + c).evaluate()),
+        ("(A + B.T) * 2 - C.T",
+         lambda: (a + b.transpose()) * 2 + c.transpose() * -1,
+         lambda: ((a.lazy() + b.lazy().transpose()) * 2 - c.lazy().transpose()).evaluate()),
+        ("A + 0.5 * X1 + ... + 0.5 * X6",
+         lambda: chain(a, extra),
+         lambda: chain(a.lazy(), [x.lazy() for x in extra]).evaluate()),
+    ]
+    print(f"Бэкенд: {get_backend().name}, матрицы {n}x{n}")
+    print(f"{'выражение':<30} | {'режим':<8} | {'время':>7} | {'пик, матриц':>11} | промежуточных")
+    inputs = [a, b, c, *extra]
+    for label, eager, lazy in cases:
+        for mode, action in (("обычный", eager), ("lazy", lazy)):
+            seconds, peak = measure(action)
+            temporaries = count_temporaries(action, inputs)
+            print(f"{label:<30} | {mode:<8} | {seconds:7.3f} | {peak / matrix_bytes:11.2f} | {temporaries}")
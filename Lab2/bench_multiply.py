@@ -0,0 +1,46 @@
+import sys
+import time
+from array import array
+from random import random
+from typing import Callable, Any, List, Tuple
+
+from Lab2 import multiply
+from Lab2.flat_storage import FlatStorage
+
+
+def random_storage(rows: int, cols: int) -> FlatStorage:
+    return FlatStorage(array('d', (random() for _ in range(rows * cols))), rows, cols)
+
+
+def timed(action: Callable[[], Any]) -> float:
+    start = time.perf_counter()
+    action()
+    return time.perf_counter() - start
+
+
+def shapes(max_n: int) -> List[Tuple[int, int, int]]:
+    """Формы (m, k, n): квадратные и вытянутые"""
+    square = [(n, n, n) for n in (32, 64, 128, 256, 384, 512, 768) if n <= max_n]
+    rect = [(max_n, max_n // 4, max_n), (max_n // 4, max_n, max_n // 4), (max_n, max_n, 16)]
+    return square + rect
+
+
+if __name__ == "__main__":
+    max_n = int(sys.argv[1]) if len(sys.argv) > 1 else 512
+    if "--tune" in sys.argv:
+        print(f"Подобранный порог Штрассена: {multiply.tune_crossover()}")
+
+    print(f"STRASSEN_THRESHOLD = {multiply.STRASSEN_THRESHOLD}, BLOCK_SIZE = {multiply.BLOCK_SIZE}")
+    print(f"{'m x k x n':>16} | {'наивное':>9} | {'блочное':>9} | {'Штрассен':>9} | {'auto':>9} | победитель")
+    for m, k, n in shapes(max_n):
+        a, b = random_storage(m, k), random_storage(k, n)
+        # Штрассен с одним уровнем рекурсии - чтобы было видно, где он начинает окупаться
+        times = {
+            "наивное": timed(lambda: multiply.matmul_naive(a, b)),
+            "блочное": timed(lambda: multiply.matmul_blocked(a, b)),
+            "Штрассен": timed(lambda: multiply.matmul_strassen(a, b, max(2, min(m, k, n)))),
+        }
+        t_auto = timed(lambda: multiply.matmul_auto(a, b))
+        winner = min(times, key=times.get)
+        print(f"{f'{m}x{k}x{n}':>16} | {times['наивное']:9.3f} | {times['блочное']:9.3f} | "
+              f"{times['Штрассен']:9.3f} | {t_auto:9.3f} | {winner}")
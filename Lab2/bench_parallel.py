@@ -0,0 +1,44 @@
+import os
+import random
+import sys
+import time
+from typing import Callable, Any, List
+
+from Lab2.functional_matrix import mat_mul, batch_mul
+from Lab2.parallel import ParallelExecutor
+
+# Масштабирование по числу процессов: одно большое произведение
+# (блоки строк) и пакет мелких. Ускорение - относительно последовательного счета.
+
+
+def random_grid(rows: int, cols: int, rng: random.Random) -> List[List[float]]:
+    return [[rng.uniform(-1, 1) for _ in range(cols)] for _ in range(rows)]
+
+
+def timed(action: Callable[[], Any]) -> float:
+    start = time.perf_counter()
+    action()
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    max_workers = int(sys.argv[2]) if len(sys.argv) > 2 else (os.cpu_count() or 1)
+    batch_size, small = 2000, 12
+    rng = random.Random(0)
+    a, b = random_grid(n, n, rng), random_grid(n, n, rng)
+    pairs = [(random_grid(small, small, rng), random_grid(small, small, rng)) for _ in range(batch_size)]
+
+    t_serial = timed(lambda: mat_mul(a, b))
+    t_batch = timed(lambda: batch_mul(pairs))
+    print(f"Ядер: {os.cpu_count()}; A * B {n}x{n}, пакет {batch_size} произведений {small}x{small}")
+    print(f"{'процессы':>8} | {'A * B':>8} | {'ускор.':>6} | {'пакет':>8} | {'ускор.':>6}   (секунды)")
+    print(f"{'-':>8} | {t_serial:8.3f} | {1.0:6.2f} | {t_batch:8.3f} | {1.0:6.2f}")
+    for workers in range(1, max_workers + 1):
+        with ParallelExecutor(workers) as executor:
+            # Запуск процессов не входит в замер
+            executor.start()
+            t_mul = timed(lambda: mat_mul(a, b, executor=executor))
+            t_many = timed(lambda: batch_mul(pairs, executor=executor))
+        print(f"{workers:>8} | {t_mul:8.3f} | {t_serial / t_mul:6.2f} | "
+              f"{t_many:8.3f} | {t_batch / t_many:6.2f}")
@@ -0,0 +1,73 @@
+import random
+import sys
+import time
+import tracemalloc
+from typing import Callable, Any, Tuple
+
+from Lab2.oop_matrix import Matrix
+from Lab2.sparse import SparseMatrix
+
+# Разреженные матрицы против плотных.
+# Плотная 10^4 x 10^4 - это 800 МБ float64, поэтому на большом размере
+# плотные операции не запускаются, а их объем памяти только оценивается.
+
+
+def random_sparse(n: int, density: float, rng: random.Random) -> SparseMatrix:
+    nnz = int(n * n * density)
+    return SparseMatrix.from_coo((n, n), (rng.randrange(n) for _ in range(nnz)),
+                                 (rng.randrange(n) for _ in range(nnz)),
+                                 (rng.uniform(-1, 1) for _ in range(nnz)))
+
+
+def timed(action: Callable[[], Any]) -> Tuple[Any, float]:
+    start = time.perf_counter()
+    result = action()
+    return result, time.perf_counter() - start
+
+
+def memory_of(build: Callable[[], Any]) -> Tuple[Any, float]:
+    """Строит объект и возвращает (объект, МБ памяти под него)"""
+    tracemalloc.start()
+    obj = build()
+    size = tracemalloc.get_traced_memory()[0] / 2 ** 20
+    tracemalloc.stop()
+    return obj, size
+
+
+def compare_with_dense(n: int, density: float, rng: random.Random) -> None:
+    sa, sb = random_sparse(n, density, rng), random_sparse(n, density, rng)
+    da, db = sa.to_dense(), sb.to_dense()
+    print(f"\nСравнение с Matrix: {n}x{n}, плотность {density:.1%}")
+    print(f"{'операция':<12} | {'Matrix':>9} | {'Sparse':>9}   (секунды)")
+    for label, dense_op, sparse_op in (
+            ("A + B", lambda: da + db, lambda: sa + sb),
+            ("A * B", lambda: da * db, lambda: sa * sb),
+            ("A.T", lambda: da.transpose().to_list(), lambda: sa.transpose())):
+        print(f"{label:<12} | {timed(dense_op)[1]:9.4f} | {timed(sparse_op)[1]:9.4f}")
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    density = float(sys.argv[2]) if len(sys.argv) > 2 else 0.001
+    rng = random.Random(0)
+
+    (a, t_build), mb = memory_of(lambda: timed(lambda: random_sparse(n, density, rng)))
+    b = random_sparse(n, density, rng)
+    print(f"{n}x{n}, плотность {density:.2%}: nnz = {a.nnz}")
+    print(f"Память: разреженная {mb:.2f} МБ, плотная была бы {8 * n * n / 2 ** 20:.0f} МБ")
+    print(f"Построение из COO: {t_build:.3f} с")
+
+    dense_cols = 16
+    x = Matrix([[rng.random() for _ in range(dense_cols)] for _ in range(n)])
+    for label, action in (
+            ("A + B", lambda: a + b),
+            ("A.T", lambda: a.transpose()),
+            ("A * B", lambda: a * b),
+            (f"A * X (X {n}x{dense_cols})", lambda: a * x),
+            ("to_csc", lambda: b.to_csc()),
+    ):
+        result, seconds = timed(action)
+        extra = f", nnz результата = {result.nnz}" if isinstance(result, SparseMatrix) else ""
+        print(f"{label:<24}: {seconds:.3f} с{extra}")
+
+    compare_with_dense(min(n, 300), 0.01, rng)
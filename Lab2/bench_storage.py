@@ -0,0 +1,57 @@
+import random
+import sys
+import time
+import tracemalloc
+from typing import Callable, List, Tuple, Any
+
+from Lab2.oop_matrix import Matrix
+
+
+# Прежняя реализация на списках списков - база для сравнения
+
+def nested_add(a: List[List[float]], b: List[List[float]]) -> List[List[float]]:
+    result = [[x + y for x, y in zip(row_a, row_b)] for row_a, row_b in zip(a, b)]
+    return [row[:] for row in result]  # копия, которую делал Matrix.__init__
+
+
+def nested_mul(a: List[List[float]], b: List[List[float]]) -> List[List[float]]:
+    b_t = list(zip(*b))
+    result = [[sum(x * y for x, y in zip(row, col)) for col in b_t] for row in a]
+    return [row[:] for row in result]
+
+
+def timed(action: Callable[[], Any]) -> float:
+    start = time.perf_counter()
+    action()
+    return time.perf_counter() - start
+
+
+def memory_of(build: Callable[[], Any]) -> Tuple[Any, float]:
+    """Строит объект и возвращает (объект, МБ памяти под него)"""
+    tracemalloc.start()
+    obj = build()
+    size = tracemalloc.get_traced_memory()[0] / 2 ** 20
+    tracemalloc.stop()
+    return obj, size
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    grid_a = [[random.random() for _ in range(n)] for _ in range(n)]
+    grid_b = [[random.random() for _ in range(n)] for _ in range(n)]
+
+    ma, mb = Matrix(grid_a), Matrix(grid_b)
+    # Память под результат сложения: новые float-объекты + списки против одного буфера
+    _, nested_mb = memory_of(lambda: nested_add(grid_a, grid_b))
+    _, flat_mb = memory_of(lambda: ma + mb)
+
+    print(f"Матрицы {n}x{n}")
+    print(f"Память: списки {nested_mb:.2f} МБ, плоский буфер {flat_mb:.2f} МБ")
+    print(f"{'операция':<14} | {'списки, с':>10} | {'flat, с':>10} | {'ускорение':>9}")
+    for title, old, new in [
+        ("сложение", lambda: nested_add(grid_a, grid_b), lambda: ma + mb),
+        ("транспонир.", lambda: [list(c) for c in zip(*grid_a)], lambda: ma.transpose()),
+        ("умножение", lambda: nested_mul(grid_a, grid_b), lambda: ma * mb),
+    ]:
+        t_old, t_new = timed(old), timed(new)
+        print(f"{title:<14} | {t_old:10.4f} | {t_new:10.4f} | {t_old / t_new:8.1f}x")
@@ -0,0 +1,160 @@
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import timeit
+import tracemalloc
+from typing import Any, Callable, Dict, List, Tuple
+
+from Lab2.backends import available_backends, get_backend, set_backend
+from Lab2.functional_matrix import mat_add, mat_mul, mat_transpose, mat_det
+from Lab2.oop_matrix import Matrix
+from Lab2.profiling import profiling
+
+# Набор замеров Lab2: mat_add, mat_mul, mat_transpose, mat_det в функциональном
+# и ООП API по ряду размеров. Для каждой точки:
+#   time_s          - лучшее время одного вызова (timeit: autorange, затем REPEAT повторов);
+#   peak_bytes      - пик памяти за вызов (tracemalloc);
+#   retained_blocks - сколько блоков памяти осталось выделено под результат
+#                     (sys.getallocatedblocks до и после, результат еще жив).
+# Результаты пишутся в JSON; с --baseline сравниваются с сохраненным прогоном,
+# и рост времени или пика памяти больше порога считается регрессией (код выхода 1).
+
+SIZES = (16, 32, 64, 128)
+REPEAT = 3
+# Время растет и от шума: для очень быстрых операций сравнение менее надежно
+MIN_COMPARABLE_TIME = 1e-5
+OPERATIONS = ('mat_add', 'mat_mul', 'mat_transpose', 'mat_det')
+APIS = ('functional', 'oop')
+
+Case = Callable[[], Any]
+
+
+def make_cases(n: int, rng: random.Random) -> Dict[Tuple[str, str], Case]:
+    """Вызовы для размера n: ключ - (api, операция)"""
+    a = [[rng.uniform(-1, 1) for _ in range(n)] for _ in range(n)]
+    b = [[rng.uniform(-1, 1) for _ in range(n)] for _ in range(n)]
+    ma, mb = Matrix(a), Matrix(b)
+    return {
+        ('functional', 'mat_add'): lambda: mat_add(a, b),
+        ('functional', 'mat_mul'): lambda: mat_mul(a, b),
+        ('functional', 'mat_transpose'): lambda: mat_transpose(a),
+        ('functional', 'mat_det'): lambda: mat_det(a),
+        ('oop', 'mat_add'): lambda: ma + mb,
+        ('oop', 'mat_mul'): lambda: ma * mb,
+        # Транспонирование в ООП - представление без копирования, замер показывает его цену
+        ('oop', 'mat_transpose'): lambda: ma.transpose(),
+        # Свежая матрица на каждый вызов, иначе сработает кэш LU
+        ('oop', 'mat_det'): lambda: Matrix._from_storage(ma._data.copy()).determinant(),
+    }
+
+
+def measure(case: Case) -> Dict[str, float]:
+    timer = timeit.Timer(case)
+    number, _ = timer.autorange()
+    best = min(timer.repeat(repeat=REPEAT, number=number)) / number
+
+    tracemalloc.start()
+    case()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    before = sys.getallocatedblocks()
+    result = case()
+    retained = sys.getallocatedblocks() - before
+    del result
+    return {'time_s': best, 'peak_bytes': peak, 'retained_blocks': retained}
+
+
+def run_suite(sizes: List[int], apis: List[str], operations: List[str]) -> Dict[str, Any]:
+    rng = random.Random(0)
+    results = []
+    for n in sizes:
+        cases = make_cases(n, rng)
+        for api in apis:
+            for op in operations:
+                results.append({'api': api, 'op': op, 'size': n, **measure(cases[api, op])})
+    return {
+        'meta': {
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'machine': platform.machine(),
+            'backend': get_backend().name,
+            'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        },
+        'results': results,
+    }
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[str]:
+    """Регрессии: рост time_s или peak_bytes больше чем в (1 + threshold) раз"""
+    old = {(r['api'], r['op'], r['size']): r for r in baseline['results']}
+    regressions = []
+    for r in current['results']:
+        base = old.get((r['api'], r['op'], r['size']))
+        if base is None:
+            continue
+        for metric in ('time_s', 'peak_bytes'):
+            if metric == 'time_s' and base[metric] < MIN_COMPARABLE_TIME:
+                continue
+            if base[metric] and r[metric] > base[metric] * (1 + threshold):
+                regressions.append(f"{r['api']}/{r['op']}/{r['size']}: {metric} "
+                                   f"{base[metric]:.6g} -> {r[metric]:.6g} (x{r[metric] / base[metric]:.2f})")
+    return regressions
+
+
+def print_table(report: Dict[str, Any]) -> None:
+    print(f"Бэкенд: {report['meta']['backend']}, Python {report['meta']['python']}")
+    print(f"{'api':<10} | {'операция':<13} | {'n':>4} | {'время, мс':>10} | {'пик, КБ':>9} | {'блоков':>7}")
+    for r in report['results']:
+        print(f"{r['api']:<10} | {r['op']:<13} | {r['size']:>4} | {r['time_s'] * 1000:10.4f} | "
+              f"{r['peak_bytes'] / 1024:9.1f} | {r['retained_blocks']:>7}")
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description="Замеры операций Lab2")
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(SIZES))
+    parser.add_argument('--api', choices=APIS, nargs='+', default=list(APIS))
+    parser.add_argument('--ops', choices=OPERATIONS, nargs='+', default=list(OPERATIONS))
+    parser.add_argument('--backend', choices=available_backends())
+    parser.add_argument('--output', help="куда записать JSON с результатами")
+    parser.add_argument('--baseline', help="JSON прошлого прогона для сравнения")
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help="допустимый рост времени/памяти (0.25 = +25%%)")
+    parser.add_argument('--profile', action='store_true',
+                        help="дополнительно профилировать методы Matrix во время прогона")
+    args = parser.parse_args(argv)
+
+    if args.backend:
+        set_backend(args.backend)
+    if args.profile:
+        with profiling() as profile:
+            report = run_suite(args.sizes, args.api, args.ops)
+        report['profile'] = profile.as_dict()
+    else:
+        report = run_suite(args.sizes, args.api, args.ops)
+
+    print_table(report)
+    if args.profile:
+        print(f"\nПрофиль методов Matrix:\n{profile.report()}")
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"\nРезультаты записаны в {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline, args.threshold)
+        if regressions:
+            print(f"\nРегрессии (порог +{args.threshold:.0%}):")
+            print('\n'.join(f"  {line}" for line in regressions))
+            return 1
+        print(f"\nРегрессий относительно {args.baseline} нет (порог +{args.threshold:.0%})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
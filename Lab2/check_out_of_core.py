@@ -0,0 +1,63 @@
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from Lab2.mapped import MatrixFile, ooc_add, ooc_matmul
+
+# Проверка вычислений вне памяти: матрицы на диске больше лимита памяти,
+# пик выделений Python (tracemalloc) должен остаться в пределах лимита,
+# а выборочные элементы результата - совпасть с прямым расчетом по файлам.
+# Страницы mmap выделяет ОС, tracemalloc их не видит - это и есть данные "на диске".
+# Время под tracemalloc в несколько раз больше обычного (трассируется каждый float).
+
+SAMPLES = 200
+
+
+def fill_random(path: str, rows: int, cols: int, rng: random.Random) -> MatrixFile:
+    """Файл со случайной матрицей, пишется по строке (целиком в памяти не бывает)"""
+    result = MatrixFile.create(path, rows, cols)
+    for i in range(rows):
+        result.write_block(i, 0, [[rng.uniform(-1, 1) for _ in range(cols)]])
+    return result
+
+
+def run(action):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = action()
+    seconds = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, seconds, peak
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 400
+    limit = int(float(sys.argv[2]) * 2 ** 20) if len(sys.argv) > 2 else 2 ** 20
+    rng = random.Random(0)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        a = fill_random(os.path.join(tmp, 'a.lmat'), n, n, rng)
+        b = fill_random(os.path.join(tmp, 'b.lmat'), n, n, rng)
+        print(f"A, B: {n}x{n}, по {a.nbytes / 2 ** 20:.2f} МБ на диске; лимит памяти {limit / 2 ** 20:.2f} МБ")
+        assert a.nbytes > limit, "матрицы должны быть больше лимита памяти"
+
+        av, bv = a.storage, b.storage
+        for label, action, expected in (
+                ("A * B", lambda: ooc_matmul(a, b, os.path.join(tmp, 'mul.lmat'), limit),
+                 lambda i, j: sum(av.get(i, t) * bv.get(t, j) for t in range(n))),
+                ("A + B", lambda: ooc_add(a, b, os.path.join(tmp, 'add.lmat'), limit),
+                 lambda i, j: av.get(i, j) + bv.get(i, j))):
+            out, seconds, peak = run(action)
+            cells = [(rng.randrange(n), rng.randrange(n)) for _ in range(SAMPLES)]
+            assert all(abs(out.storage.get(i, j) - expected(i, j)) < 1e-9 for i, j in cells), label
+            assert peak <= limit, f"{label}: пик {peak} байт больше лимита {limit}"
+            print(f"{label}: {seconds:.2f} с, пик памяти {peak / 2 ** 20:.2f} МБ, "
+                  f"{SAMPLES} выборочных элементов совпали")
+            out.close()
+        a.close()
+        b.close()
+    print("OK")
@@ -0,0 +1,249 @@
+import operator
+from array import array
+from itertools import repeat, islice
+from typing import List, Iterator, Iterable, Sequence, Union, Optional, Callable
+
+Num = Union[int, float]
+
+
+class FlatStorage:
+    """Плоское хранилище матрицы.
+
+    Все числа лежат в одном буфере float64 (array('d')) построчно, а форма задается
+    метаданными: rows, cols, шаги по строкам/столбцам и смещение начала.
+    Благодаря шагам транспонирование, строка, столбец и подматрица - это
+    представления (views) над тем же буфером, без копирования данных.
+
+    Конструктор внутренний: данные не проверяются, их формирует сам движок.
+    stamp - счетчик изменений буфера, общий для всех представлений над ним:
+    по нему кэши (например, разложения матрицы) узнают, что данные поменялись.
+    """
+
+    __slots__ = ('data', 'rows', 'cols', 'row_stride', 'col_stride', 'offset', 'stamp')
+
+    def __init__(self, data: Sequence[float], rows: int, cols: int,
+                 row_stride: int = -1, col_stride: int = 1, offset: int = 0,
+                 stamp: Optional[List[int]] = None) -> None:
+        self.data = data
+        self.rows = rows
+        self.cols = cols
+        self.row_stride = cols if row_stride < 0 else row_stride
+        self.col_stride = col_stride
+        self.offset = offset
+        self.stamp = [0] if stamp is None else stamp
+
+    @classmethod
+    def zeros(cls, rows: int, cols: int) -> 'FlatStorage':
+        """Новая нулевая матрица rows x cols"""
+        return cls(array('d', bytes(8 * rows * cols)), rows, cols)
+
+    @classmethod
+    def from_rows(cls, grid: List[List[Num]]) -> 'FlatStorage':
+        """Упаковывает список строк в плоский буфер (прямоугольность проверяет вызывающий)"""
+        data = array('d')
+        for row in grid:
+            data.extend(row)
+        return cls(data, len(grid), len(grid[0]) if grid else 0)
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return self.rows, self.cols
+
+    @property
+    def size(self) -> int:
+        return self.rows * self.cols
+
+    def is_contiguous(self) -> bool:
+        """True, если элементы идут в буфере подряд построчно (без пропусков)"""
+        return (self.col_stride == 1 or self.cols <= 1) and \
+            (self.row_stride == self.cols or self.rows <= 1)
+
+    def index(self, i: int, j: int) -> int:
+        """Позиция элемента (i, j) в буфере"""
+        return self.offset + i * self.row_stride + j * self.col_stride
+
+    def get(self, i: int, j: int) -> float:
+        return self.data[self.offset + i * self.row_stride + j * self.col_stride]
+
+    def set(self, i: int, j: int, value: Num) -> None:
+        self.data[self.offset + i * self.row_stride + j * self.col_stride] = value
+        self.stamp[0] += 1
+
+    def mark_modified(self) -> None:
+        """Сообщает кэшам, что буфер изменен (после записи в data напрямую)"""
+        self.stamp[0] += 1
+
+    # Представления (без копирования)
+
+    def transpose(self) -> 'FlatStorage':
+        """Транспонированное представление: строки и столбцы меняются шагами"""
+        return FlatStorage(self.data, self.cols, self.rows, self.col_stride, self.row_stride,
+                           self.offset, self.stamp)
+
+    def block(self, r0: int, r1: int, c0: int, c1: int) -> 'FlatStorage':
+        """Представление подматрицы [r0:r1, c0:c1]"""
+        return FlatStorage(self.data, r1 - r0, c1 - c0, self.row_stride, self.col_stride,
+                           self.index(r0, c0), self.stamp)
+
+    def row(self, i: int) -> 'FlatStorage':
+        """Представление i-й строки (1 x cols)"""
+        return self.block(i, i + 1, 0, self.cols)
+
+    def column(self, j: int) -> 'FlatStorage':
+        """Представление j-го столбца (rows x 1)"""
+        return self.block(0, self.rows, j, j + 1)
+
+    # Чтение данных
+
+    def row_values(self, i: int) -> Sequence[float]:
+        """Значения i-й строки одним срезом буфера"""
+        if not self.cols:
+            return self.data[0:0]
+        start = self.offset + i * self.row_stride
+        if self.col_stride == 1:
+            return self.data[start:start + self.cols]
+        return self.data[start:start + (self.cols - 1) * self.col_stride + 1:self.col_stride]
+
+    def iter_rows(self) -> Iterator[Sequence[float]]:
+        for i in range(self.rows):
+            yield self.row_values(i)
+
+    def flat_values(self) -> Sequence[float]:
+        """Все значения построчно. Для непрерывного хранилища - один срез без обхода"""
+        if self.is_contiguous():
+            return self.data[self.offset:self.offset + self.size]
+        values = array('d')
+        for row in self.iter_rows():
+            values.extend(row)
+        return values
+
+    def copy_from(self, src: 'FlatStorage') -> None:
+        """Записывает значения src (той же формы) в это хранилище или представление"""
+        # store_row приводит значения к типу буфера (float32 у MatrixFile)
+        for i, values in enumerate(src.iter_rows()):
+            store_row(self, i, values)
+        self.stamp[0] += 1
+
+    def contiguous(self) -> 'FlatStorage':
+        """Непрерывная копия (или само хранилище, если оно уже непрерывно и владеет буфером)"""
+        if self.is_contiguous() and self.offset == 0 and len(self.data) == self.size:
+            return self
+        return self.copy()
+
+    def copy(self) -> 'FlatStorage':
+        """Новое непрерывное хранилище с теми же значениями"""
+        values = self.flat_values()
+        return FlatStorage(values if isinstance(values, array) else array('d', values),
+                           self.rows, self.cols)
+
+    def to_rows(self) -> List[List[float]]:
+        """Обратно в список списков"""
+        return [list(row) for row in self.iter_rows()]
+
+    def __repr__(self) -> str:
+        return f"FlatStorage(shape={self.shape}, strides=({self.row_stride}, {self.col_stride}))"
+
+
+# Операции движка. Результаты создаются напрямую через FlatStorage(...) без повторной проверки.
+# С out= результат пишется в готовое хранилище (или представление) по строкам:
+# новых матриц не создается, временная - только одна строка
+
+def shares_buffer(out: FlatStorage, *sources: FlatStorage) -> bool:
+    """True, если out пишет в буфер одного из источников с другой раскладкой.
+
+    Тогда построчная запись испортит еще не прочитанные значения, и результат
+    надо сначала посчитать отдельно. Запись в тот же самый вид (a += b) безопасна.
+    """
+    layout = (out.offset, out.row_stride, out.col_stride)
+    return any(src.data is out.data and (src.offset, src.row_stride, src.col_stride) != layout
+               for src in sources)
+
+
+def store_row(out: FlatStorage, i: int, values: Iterable[float], col: int = 0) -> None:
+    """Записывает значения в i-ю строку out начиная со столбца col.
+
+    Штамп изменений не меняется - его один раз увеличивает вызывающий.
+    """
+    start = out.offset + i * out.row_stride + col * out.col_stride
+    if out.col_stride == 1:
+        data = out.data
+        values = array(data.typecode if isinstance(data, array) else data.format, values)
+        data[start:start + len(values)] = values
+    else:
+        for j, value in enumerate(values):
+            out.data[start + j * out.col_stride] = value
+
+
+def store_values(out: FlatStorage, values: Iterable[float]) -> None:
+    """Записывает все значения построчно в out: для непрерывного out - одним срезом"""
+    if out.is_contiguous():
+        data = out.data
+        typecode = data.typecode if isinstance(data, array) else data.format
+        if not (isinstance(values, array) and values.typecode == typecode):
+            values = array(typecode, values)
+        data[out.offset:out.offset + len(values)] = values
+        return
+    values = iter(values)
+    for i in range(out.rows):
+        store_row(out, i, islice(values, out.cols))
+
+
+def _elementwise(op: Callable[[float, float], float], a: FlatStorage, b: FlatStorage,
+                 out: Optional[FlatStorage]) -> FlatStorage:
+    if out is None:
+        return FlatStorage(array('d', map(op, a.flat_values(), b.flat_values())), a.rows, a.cols)
+    if shares_buffer(out, a, b):
+        out.copy_from(_elementwise(op, a, b, None))
+    elif out.is_contiguous():
+        store_values(out, map(op, a.flat_values(), b.flat_values()))
+    else:
+        for i in range(a.rows):
+            store_row(out, i, map(op, a.row_values(i), b.row_values(i)))
+    out.mark_modified()
+    return out
+
+
+def add(a: FlatStorage, b: FlatStorage, out: Optional[FlatStorage] = None) -> FlatStorage:
+    """Поэлементная сумма (формы проверяет вызывающий)"""
+    return _elementwise(operator.add, a, b, out)
+
+
+def sub(a: FlatStorage, b: FlatStorage, out: Optional[FlatStorage] = None) -> FlatStorage:
+    """Поэлементная разность (формы проверяет вызывающий)"""
+    return _elementwise(operator.sub, a, b, out)
+
+
+def scale(a: FlatStorage, k: Num, out: Optional[FlatStorage] = None) -> FlatStorage:
+    """Умножение на число"""
+    if out is None:
+        return FlatStorage(array('d', map(operator.mul, a.flat_values(), repeat(k))), a.rows, a.cols)
+    if shares_buffer(out, a):
+        out.copy_from(scale(a, k))
+    elif out.is_contiguous():
+        store_values(out, map(operator.mul, a.flat_values(), repeat(k)))
+    else:
+        for i in range(a.rows):
+            store_row(out, i, map(operator.mul, a.row_values(i), repeat(k)))
+    out.mark_modified()
+    return out
+
+
+def matmul(a: FlatStorage, b: FlatStorage, out: Optional[FlatStorage] = None) -> FlatStorage:
+    """Произведение матриц (a.cols == b.rows проверяет вызывающий)"""
+    if out is not None and (out.data is a.data or out.data is b.data):
+        # Строки A и B нужны до конца умножения - считаем отдельно
+        out.copy_from(matmul(a, b))
+        return out
+    # Столбцы B вынимаем один раз как непрерывные срезы транспонированного представления
+    b_cols = list(b.transpose().iter_rows())
+    if out is None:
+        result = array('d')
+        for row in a.iter_rows():
+            result.extend([sum(map(operator.mul, row, col)) for col in b_cols])
+        return FlatStorage(result, a.rows, b.cols)
+    result = array('d')
+    for row in a.iter_rows():
+        result.extend([sum(map(operator.mul, row, col)) for col in b_cols])
+    store_values(out, result)
+    out.mark_modified()
+    return out
@@ -1,12 +1,59 @@
-from typing import List, Union, TypeAlias
+from typing import List, Union, TypeAlias, Optional, Sequence, Tuple, Iterable
+
+from Lab2 import linalg
+from Lab2.backends import get_backend
+from Lab2.flat_storage import FlatStorage
+from Lab2.linalg import Exact
+from Lab2.parallel import ParallelExecutor
 
 # Объявляем синонимы типов для чистоты кода
 MatrixData = List[List[float]]
 Scalar = Union[int, float]
+# Все функции принимают и список списков, и плоское хранилище FlatStorage.
+# Результат - того же вида, что и аргументы; если аргументы разного вида,
+# список списков приводится к FlatStorage и результат - FlatStorage
+MatrixLike = Union[MatrixData, FlatStorage]
+
+
+def _use_engine(m: MatrixLike) -> bool:
+    """Считать ли через бэкенд: для FlatStorage всегда, для списков - если бэкенд ускоренный"""
+    return isinstance(m, FlatStorage) or get_backend().accelerated
+
+
+def _to_engine(m: MatrixLike) -> FlatStorage:
+    return m if isinstance(m, FlatStorage) else FlatStorage.from_rows(m)
+
+
+def _from_engine(result: FlatStorage, like: MatrixLike) -> MatrixLike:
+    return result if isinstance(like, FlatStorage) else result.to_rows()
+
+
+def _common(a: MatrixLike, b: MatrixLike) -> Tuple[MatrixLike, MatrixLike]:
+    """Смешанные аргументы (список списков и FlatStorage) приводятся к FlatStorage"""
+    if isinstance(a, FlatStorage) != isinstance(b, FlatStorage):
+        return _to_engine(a), _to_engine(b)
+    return a, b
+
+
+def _check_out(out: MatrixLike, like: MatrixLike, shape: tuple[int, int]) -> None:
+    """out= должен быть того же вида, что и аргумент, и нужной формы"""
+    if isinstance(out, FlatStorage) != isinstance(like, FlatStorage):
+        raise TypeError("out должен быть того же вида, что и аргументы (список списков или FlatStorage)")
+    if get_shape(out) != shape:
+        raise ValueError(f"Форма out {get_shape(out)} не совпадает с формой результата {shape}")
 
 
-def get_shape(m: MatrixData) -> tuple[int, int]:
+def _store(rows: Iterable[List[float]], out: MatrixData) -> MatrixData:
+    """Записывает строки результата в готовый список списков (сами строки out не пересоздаются)"""
+    for target, row in zip(out, rows):
+        target[:] = row
+    return out
+
+
+def get_shape(m: MatrixLike) -> tuple[int, int]:
     """Возвращает (строки, столбцы)"""
+    if isinstance(m, FlatStorage):
+        return m.shape
     return len(m), len(m[0]) if m else 0
 
 
@@ -21,65 +68,170 @@ def create_matrix(data: List[List[float]]) -> MatrixData:
     return [row[:] for row in data]
 
 
-def mat_add(a: MatrixData, b: MatrixData) -> MatrixData:
-    """Сложение двух матриц"""
+def create_flat(data: List[List[float]]) -> FlatStorage:
+    """Создает матрицу в плоском хранилище (валидация и упаковка в один буфер)"""
+    return FlatStorage.from_rows(create_matrix(data))
+
+
+def flat_to_data(m: FlatStorage) -> MatrixData:
+    """Переводит плоское хранилище обратно в список списков"""
+    return m.to_rows()
+
+
+def mat_add(a: MatrixLike, b: MatrixLike, out: Optional[MatrixLike] = None) -> MatrixLike:
+    """Сложение двух матриц.
+
+    out - готовая матрица под результат (можно сам a: mat_add(a, b, out=a)).
+    Она и возвращается, новая матрица не создается.
+    """
     if get_shape(a) != get_shape(b):
         raise ValueError("Размеры матриц должны совпадать")
+    a, b = _common(a, b)
+    if out is not None:
+        _check_out(out, a, get_shape(a))
+
+    if isinstance(out, FlatStorage):
+        return get_backend().add(a, b, out)
+    if _use_engine(a):
+        result = _from_engine(get_backend().add(_to_engine(a), _to_engine(b)), a)
+        return result if out is None else _store(result, out)
 
     # List comprehension для сложения
-    return [[x + y for x, y in zip(row_a, row_b)]
-            for row_a, row_b in zip(a, b)]
+    rows = ([x + y for x, y in zip(row_a, row_b)] for row_a, row_b in zip(a, b))
+    return list(rows) if out is None else _store(rows, out)
 
 
-def mat_transpose(m: MatrixData) -> MatrixData:
-    """Транспонирование матрицы"""
+def mat_transpose(m: MatrixLike, out: Optional[MatrixLike] = None) -> MatrixLike:
+    """Транспонирование матрицы (с out - запись в готовую матрицу cols x rows)"""
+    if out is not None:
+        rows, cols = get_shape(m)
+        _check_out(out, m, (cols, rows))
+    # Плоское хранилище транспонируется без копирования - меняются только шаги
+    if isinstance(m, FlatStorage):
+        return get_backend().transpose(m, out)
     # Functional magic: zip распаковывает столбцы в строки
-    return [list(col) for col in zip(*m)]
+    columns = [list(col) for col in zip(*m)]
+    return columns if out is None else _store(columns, out)
 
 
-def mat_mul(a: MatrixData, b: Union[MatrixData, Scalar]) -> MatrixData:
-    """Умножение: Матрица * Матрица ИЛИ Матрица * Число"""
+def mat_mul(a: MatrixLike, b: Union[MatrixLike, Scalar],
+            executor: Optional[ParallelExecutor] = None, out: Optional[MatrixLike] = None) -> MatrixLike:
+    """Умножение: Матрица * Матрица ИЛИ Матрица * Число.
+
+    executor - пул процессов: произведение матриц делится между ними по блокам строк.
+    out - готовая матрица под результат (может совпадать с a).
+    """
 
     # Вариант 1: Умножение на число
     if isinstance(b, (int, float)):
-        return [[x * b for x in row] for row in a]
+        if out is not None:
+            _check_out(out, a, get_shape(a))
+        if isinstance(out, FlatStorage):
+            return get_backend().scale(a, b, out)
+        if _use_engine(a):
+            result = _from_engine(get_backend().scale(_to_engine(a), b), a)
+            return result if out is None else _store(result, out)
+        rows = ([x * b for x in row] for row in a)
+        return list(rows) if out is None else _store(rows, out)
 
     # Вариант 2: Умножение матриц
+    a, b = _common(a, b)
     rows_a, cols_a = get_shape(a)
     rows_b, cols_b = get_shape(b)
 
     if cols_a != rows_b:
         raise ValueError(f"Ошибка размерности: {cols_a} != {rows_b}")
+    if out is not None:
+        _check_out(out, a, (rows_a, cols_b))
+
+    if executor is not None:
+        result = executor.matmul(_to_engine(a), _to_engine(b))
+        if isinstance(out, FlatStorage):
+            out.copy_from(result)
+            return out
+        result = _from_engine(result, a)
+        return result if out is None else _store(result, out)
+
+    if isinstance(out, FlatStorage):
+        return get_backend().matmul(a, b, out)
+    if _use_engine(a):
+        result = _from_engine(get_backend().matmul(_to_engine(a), _to_engine(b)), a)
+        return result if out is None else _store(result, out)
 
     # Транспонируем B заранее, чтобы удобно идти по строкам
     b_t = mat_transpose(b)
 
-    return [
-        [sum(x * y for x, y in zip(row_a, row_b_t)) for row_b_t in b_t]
-        for row_a in a
-    ]
+    # Строка i результата зависит только от строки i из A, поэтому out может быть самой A
+    rows = ([sum(x * y for x, y in zip(row_a, row_b_t)) for row_b_t in b_t] for row_a in a)
+    return list(rows) if out is None else _store(rows, out)
+
+
+def batch_mul(pairs: Sequence[Tuple[MatrixLike, MatrixLike]],
+              executor: Optional[ParallelExecutor] = None) -> List[MatrixLike]:
+    """Пакет произведений [A1 * B1, A2 * B2, ...].
+
+    С executor пары раздаются процессам пула (операнды - через разделяемую память),
+    без него считаются по очереди.
+    """
+    for a, b in pairs:
+        if get_shape(a)[1] != get_shape(b)[0]:
+            raise ValueError(f"Ошибка размерности: {get_shape(a)[1]} != {get_shape(b)[0]}")
+    if executor is None:
+        return [mat_mul(a, b) for a, b in pairs]
+    results = executor.batch_mul([(_to_engine(a), _to_engine(b)) for a, b in pairs])
+    return [_from_engine(result, a) for result, (a, _) in zip(results, pairs)]
+
+
+def mat_det(m: MatrixLike, exact: bool = False) -> Union[float, Exact]:
+    """Вычисление определителя (Determinant).
+
+    По умолчанию - LU-разложение за O(n^3). exact=True - точный алгоритм Барейса
+    (int для целочисленных матриц, Fraction для дробных).
+    """
+    rows, cols = get_shape(m)
+    if rows != cols:
+        raise ValueError("Нужна квадратная матрица")
+    if exact:
+        return linalg.determinant_bareiss(m.to_rows() if isinstance(m, FlatStorage) else m)
+    return get_backend().determinant(_to_engine(m))
 
 
-def mat_det(m: MatrixData) -> float:
-    """Вычисление определителя (Determinant)"""
+def mat_lu(m: MatrixLike) -> tuple[MatrixLike, MatrixLike, MatrixLike]:
+    """LU-разложение с выбором ведущего элемента: возвращает (P, L, U), где P * A = L * U"""
     rows, cols = get_shape(m)
     if rows != cols:
         raise ValueError("Нужна квадратная матрица")
+    lu = linalg.lu_decompose(_to_engine(m))
+    return (_from_engine(lu.permutation(), m), _from_engine(lu.lower(), m),
+            _from_engine(lu.upper(), m))
 
-    # Простые случаи
-    if rows == 1: return m[0][0]
-    if rows == 2: return m[0][0] * m[1][1] - m[0][1] * m[1][0]
 
-    # Общий случай (рекурсия)
-    det = 0.0
-    first_row = m[0]
-    for i, val in enumerate(first_row):
-        # Формируем минор без 0-й строки и i-го столбца
-        minor = [row[:i] + row[i + 1:] for row in m[1:]]
-        sign = 1 if i % 2 == 0 else -1
-        det += sign * val * mat_det(minor)
+def mat_qr(m: MatrixLike) -> tuple[MatrixLike, MatrixLike]:
+    """QR-разложение (Хаусхолдер): возвращает (Q, R), где A = Q * R"""
+    q, r = linalg.qr_decompose(_to_engine(m))
+    return _from_engine(q, m), _from_engine(r, m)
 
-    return det
+
+def mat_solve(a: MatrixLike, b: MatrixLike) -> MatrixLike:
+    """Решает A * X = B (каждый столбец B - своя правая часть).
+
+    Без состояния: разложение каждый раз новое. Для многих решений с одной A
+    удобнее Matrix.solve, который хранит LU на объекте.
+    """
+    rows, cols = get_shape(a)
+    if rows != cols:
+        raise ValueError("Нужна квадратная матрица")
+    if get_shape(b)[0] != rows:
+        raise ValueError(f"Ошибка размерности: {get_shape(b)[0]} != {rows}")
+    return _from_engine(linalg.lu_decompose(_to_engine(a)).solve(_to_engine(b)), a)
+
+
+def mat_inverse(m: MatrixLike) -> MatrixLike:
+    """Обратная матрица"""
+    rows, cols = get_shape(m)
+    if rows != cols:
+        raise ValueError("Нужна квадратная матрица")
+    return _from_engine(linalg.lu_decompose(_to_engine(m)).inverse(), m)
 
 
 if __name__ == "__main__":
@@ -92,3 +244,13 @@ if __name__ == "__main__":
     print("Умнож (Матрица):", mat_mul(mx1, mx2))
     print("Умнож (Скаляр):", mat_mul(mx1, 10))
     print("Дет:", mat_det(mx1))
+    print("Дет (точно):", mat_det([[2, 7, 1], [3, -4, 5], [6, 0, 8]], exact=True))
+    print("LU (P, L, U):", mat_lu(mx1))
+    print("Решение A * X = B:", mat_solve(mx1, [[5.0], [8.0]]))
+    print("Обратная:", mat_inverse(mx1))
+
+    fx1 = create_flat([[1.0, 2.0], [2.0, 3.0]])
+    fx2 = create_flat([[2.0, 5.0], [7.0, 9.0]])
+    print("Плоское хранилище:", fx1)
+    print("Сумма (flat):", flat_to_data(mat_add(fx1, fx2)))
+    print("Умнож (flat):", flat_to_data(mat_mul(fx1, fx2)))
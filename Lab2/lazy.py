@@ -0,0 +1,188 @@
+import operator
+from array import array
+from itertools import repeat
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+from Lab2.backends import get_backend
+from Lab2.flat_storage import FlatStorage
+
+Num = Union[int, float]
+# Слагаемое линейной комбинации: [коэффициент, представление хранилища]
+Term = List[Any]
+# Сколько слагаемых сливается в одну цепочку итераторов (глубина вложенных map)
+MAX_FUSED = 64
+
+
+def _fused_row(coefs: Tuple[float, ...], rows: List[Sequence[float]]) -> Iterator[float]:
+    """Строка линейной комбинации c0 * x0 + c1 * x1 + ... одним проходом.
+
+    Итераторы map вложены друг в друга, поэтому элементы текут по цепочке
+    по одному: промежуточных строк и матриц нет, а весь цикл идет в C.
+    Умножение на 1 опускается. Больше MAX_FUSED слагаемых считаются частями,
+    чтобы цепочка не становилась слишком глубокой.
+    """
+    result: Optional[Iterator[float]] = None
+    for idx, (coef, row) in enumerate(zip(coefs, rows)):
+        if idx and idx % MAX_FUSED == 0:
+            result = iter(list(result))
+        term = iter(row) if coef == 1 else map(operator.mul, row, repeat(coef))
+        result = term if result is None else map(operator.add, result, term)
+    return result
+
+
+class LazyMatrix:
+    """Отложенное матричное выражение.
+
+    Операторы +, -, умножение на число и transpose() не считают, а строят дерево;
+    evaluate() считает его один раз. Любая поэлементная цепочка из этих
+    операций - линейная комбинация исходных матриц, поэтому она вычисляется
+    одним проходом без промежуточных матриц, а транспонирование сводится к
+    шагам обхода буфера. Умножение матриц - граница слияния: его операнды
+    вычисляются отдельно.
+
+    Листья ссылаются на данные матриц без копирования: если матрицу изменить
+    до evaluate(), в результат попадут новые значения.
+    """
+
+    __slots__ = ('op', 'args', 'shape')
+
+    def __init__(self, op: str, args: tuple, shape: Tuple[int, int]) -> None:
+        self.op = op
+        self.args = args
+        self.shape = shape
+
+    @classmethod
+    def leaf(cls, storage: FlatStorage) -> 'LazyMatrix':
+        return cls('leaf', (storage,), storage.shape)
+
+    @staticmethod
+    def _wrap(other: Any) -> Any:
+        """Matrix -> лист дерева; остальное без изменений"""
+        from Lab2.oop_matrix import Matrix
+        return LazyMatrix.leaf(other._data) if isinstance(other, Matrix) else other
+
+    def __add__(self, other: Any) -> 'LazyMatrix':
+        other = self._wrap(other)
+        if not isinstance(other, LazyMatrix):
+            return NotImplemented
+        if self.shape != other.shape:
+            raise ValueError(f"Размерности не совпадают: {self.shape} != {other.shape}")
+        return LazyMatrix('add', (self, other), self.shape)
+
+    __radd__ = __add__
+
+    def __neg__(self) -> 'LazyMatrix':
+        return LazyMatrix('scale', (self, -1), self.shape)
+
+    def __sub__(self, other: Any) -> 'LazyMatrix':
+        other = self._wrap(other)
+        if not isinstance(other, LazyMatrix):
+            return NotImplemented
+        return self + (-other)
+
+    def __rsub__(self, other: Any) -> 'LazyMatrix':
+        return (-self).__add__(other)
+
+    def __mul__(self, other: Any) -> 'LazyMatrix':
+        if isinstance(other, (int, float)):
+            return LazyMatrix('scale', (self, other), self.shape)
+        other = self._wrap(other)
+        if not isinstance(other, LazyMatrix):
+            return NotImplemented
+        if self.shape[1] != other.shape[0]:
+            raise ValueError(f"Нельзя умножить: столбцов в A ({self.shape[1]}) != строк в B ({other.shape[0]})")
+        return LazyMatrix('matmul', (self, other), (self.shape[0], other.shape[1]))
+
+    def __rmul__(self, other: Any) -> 'LazyMatrix':
+        if isinstance(other, (int, float)):
+            return LazyMatrix('scale', (self, other), self.shape)
+        other = self._wrap(other)
+        if not isinstance(other, LazyMatrix):
+            return NotImplemented
+        return other * self
+
+    def transpose(self) -> 'LazyMatrix':
+        return LazyMatrix('transpose', (self,), (self.shape[1], self.shape[0]))
+
+    def _terms(self) -> List[Term]:
+        """Раскладывает поэлементную часть дерева в линейную комбинацию представлений.
+
+        Обход явным стеком (длинные цепочки не упираются в предел рекурсии).
+        Одинаковые представления одного буфера объединяются: A + A -> 2 * A.
+        """
+        terms: Dict[Tuple[int, int, int, int], Term] = {}
+        stack: List[Tuple[LazyMatrix, float, bool]] = [(self, 1.0, False)]
+        while stack:
+            node, coef, transposed = stack.pop()
+            if node.op == 'add':
+                # Правый кладется первым, чтобы слагаемые шли слева направо
+                stack.append((node.args[1], coef, transposed))
+                stack.append((node.args[0], coef, transposed))
+            elif node.op == 'scale':
+                stack.append((node.args[0], coef * node.args[1], transposed))
+            elif node.op == 'transpose':
+                stack.append((node.args[0], coef, not transposed))
+            else:
+                storage = node.args[0] if node.op == 'leaf' else node._product()
+                view = storage.transpose() if transposed else storage
+                key = (id(view.data), view.offset, view.row_stride, view.col_stride)
+                if key in terms:
+                    terms[key][0] += coef
+                else:
+                    terms[key] = [coef, view]
+        return [term for term in terms.values() if term[0]]
+
+    def _product(self) -> FlatStorage:
+        """Узел умножения матриц: операнды вычисляются (со слиянием), затем бэкенд"""
+        left, right = self.args
+        return get_backend().matmul(left._evaluate(), right._evaluate())
+
+    def _evaluate(self) -> FlatStorage:
+        if self.op == 'leaf':
+            return self.args[0]
+        if self.op == 'matmul':
+            return self._product()
+        rows, cols = self.shape
+        terms = self._terms()
+        if not terms or not rows or not cols:
+            return FlatStorage.zeros(rows, cols)
+        coefs = tuple(coef for coef, _ in terms)
+        views = [view for _, view in terms]
+        data = array('d')
+        for i in range(rows):
+            data.extend(_fused_row(coefs, [view.row_values(i) for view in views]))
+        return FlatStorage(data, rows, cols)
+
+    def evaluate(self) -> 'Matrix':
+        """Вычисляет выражение в новую матрицу Matrix"""
+        from Lab2.oop_matrix import Matrix
+        result = self._evaluate()
+        # Лист не копируется при вычислении - результат не должен делить с ним буфер
+        return Matrix._from_storage(result.copy() if self.op == 'leaf' else result)
+
+    def to_list(self) -> List[List[float]]:
+        return self._evaluate().to_rows()
+
+    def __repr__(self) -> str:
+        if self.op == 'leaf':
+            return f"M{self.shape[0]}x{self.shape[1]}"
+        if self.op == 'transpose':
+            return f"{self.args[0]!r}.T"
+        if self.op == 'scale':
+            return f"({self.args[0]!r} * {self.args[1]})"
+        sign = '+' if self.op == 'add' else '@'
+        return f"({self.args[0]!r} {sign} {self.args[1]!r})"
+
+
+if __name__ == "__main__":
+    from Lab2.oop_matrix import Matrix
+
+    a = Matrix([[1, 2], [3, 4]])
+    b = Matrix([[5, 6], [7, 8]])
+    c = Matrix([[1, 0], [0, 1]])
+    expr = (a.lazy() + b) * 2 + c.transpose().lazy()
+    print(f"Выражение: {expr!r}")
+    print(f"Результат:\n{expr.evaluate()}")
+    print(f"Совпадает с обычным: {expr.to_list() == ((a + b) * 2 + c.transpose()).to_list()}")
+    print(f"A - A.T.T: {(a.lazy() - a.lazy().transpose().transpose()).to_list()}")
+    print(f"(A + B) * C: {((a.lazy() + b) * c).to_list()}")
@@ -0,0 +1,212 @@
+import math
+import operator
+from fractions import Fraction
+from typing import List, Union, Tuple
+
+from Lab2.flat_storage import FlatStorage
+
+# Точный результат: int для целочисленных матриц, Fraction - для дробных
+Exact = Union[int, Fraction]
+
+
+class LUDecomposition:
+    """Разложение P * A = L * U с частичным выбором ведущего элемента.
+
+    L (нижняя, с единицами на диагонали) и U (верхняя) хранятся упакованными
+    в одной матрице factors; perm[i] - номер строки A, ставшей i-й строкой.
+    Стоит O(n^3) один раз, дальше определитель - O(n), решение системы - O(n^2).
+    """
+
+    __slots__ = ('factors', 'perm', 'sign', '_rows')
+
+    def __init__(self, factors: FlatStorage, perm: List[int], sign: int) -> None:
+        self.factors = factors
+        self.perm = perm
+        self.sign = sign
+        # Строки factors в виде списков - для подстановок (заполняется при первом solve)
+        self._rows: List[List[float]] = []
+
+    @property
+    def size(self) -> int:
+        return self.factors.rows
+
+    def determinant(self) -> float:
+        """Произведение диагонали U с учетом знака перестановки"""
+        det = float(self.sign)
+        for i in range(self.size):
+            det *= self.factors.get(i, i)
+        return det
+
+    def is_singular(self) -> bool:
+        return any(self.factors.get(i, i) == 0 for i in range(self.size))
+
+    def solve(self, b: FlatStorage) -> FlatStorage:
+        """Решает A * X = B для каждого столбца B прямой и обратной подстановкой (O(n^2) на столбец)"""
+        if self.is_singular():
+            raise ValueError("Матрица вырождена: система не имеет единственного решения")
+        if not self._rows:
+            self._rows = self.factors.to_rows()
+        rows, n = self._rows, self.size
+        result = FlatStorage.zeros(n, b.cols)
+        for j in range(b.cols):
+            # L * y = P * b
+            y: List[float] = []
+            for i in range(n):
+                y.append(b.get(self.perm[i], j) - sum(map(operator.mul, rows[i][:i], y)))
+            # U * x = y (снизу вверх; x копится в обратном порядке)
+            x_rev: List[float] = []
+            for i in range(n - 1, -1, -1):
+                row = rows[i]
+                acc = sum(map(operator.mul, reversed(row[i + 1:]), x_rev))
+                x_rev.append((y[i] - acc) / row[i])
+            for i, value in enumerate(reversed(x_rev)):
+                result.set(i, j, value)
+        return result
+
+    def inverse(self) -> FlatStorage:
+        """Обратная матрица: решение A * X = E"""
+        n = self.size
+        identity = FlatStorage.zeros(n, n)
+        for i in range(n):
+            identity.set(i, i, 1.0)
+        return self.solve(identity)
+
+    def lower(self) -> FlatStorage:
+        """Матрица L"""
+        n = self.size
+        result = FlatStorage.zeros(n, n)
+        for i in range(n):
+            for j in range(i):
+                result.set(i, j, self.factors.get(i, j))
+            result.set(i, i, 1.0)
+        return result
+
+    def upper(self) -> FlatStorage:
+        """Матрица U"""
+        n = self.size
+        result = FlatStorage.zeros(n, n)
+        for i in range(n):
+            for j in range(i, n):
+                result.set(i, j, self.factors.get(i, j))
+        return result
+
+    def permutation(self) -> FlatStorage:
+        """Матрица перестановки P (P * A = L * U)"""
+        n = self.size
+        result = FlatStorage.zeros(n, n)
+        for i, source in enumerate(self.perm):
+            result.set(i, source, 1.0)
+        return result
+
+
+def lu_decompose(a: FlatStorage) -> LUDecomposition:
+    """LU-разложение квадратной матрицы (квадратность проверяет вызывающий).
+
+    Вырожденная матрица не ошибка: на диагонали U появится ноль.
+    """
+    n = a.rows
+    rows = a.to_rows()
+    perm = list(range(n))
+    sign = 1
+    for k in range(n):
+        # Ведущий элемент - максимальный по модулю в столбце (устойчивость)
+        pivot = max(range(k, n), key=lambda r: abs(rows[r][k]))
+        if pivot != k:
+            rows[k], rows[pivot] = rows[pivot], rows[k]
+            perm[k], perm[pivot] = perm[pivot], perm[k]
+            sign = -sign
+        head = rows[k]
+        lead = head[k]
+        if lead == 0:
+            continue
+        tail = head[k + 1:]
+        for r in range(k + 1, n):
+            row = rows[r]
+            factor = row[k] / lead
+            if factor:
+                # Вычитание строк срезом: один проход comprehension вместо индексов
+                row[k + 1:] = [x - factor * y for x, y in zip(row[k + 1:], tail)]
+            row[k] = factor
+    return LUDecomposition(FlatStorage.from_rows(rows), perm, sign)
+
+
+def determinant(a: FlatStorage) -> float:
+    """Определитель через LU-разложение за O(n^3)"""
+    if not a.rows:
+        return 1.0
+    return lu_decompose(a).determinant()
+
+
+def qr_decompose(a: FlatStorage) -> Tuple[FlatStorage, FlatStorage]:
+    """QR-разложение отражениями Хаусхолдера: A = Q * R, Q ортогональная (m x m), R верхняя (m x n)"""
+    m, n = a.shape
+    r = a.to_rows()
+    q = [[1.0 if i == j else 0.0 for j in range(m)] for i in range(m)]
+    for k in range(min(m - 1, n)):
+        x = [r[i][k] for i in range(k, m)]
+        norm = math.sqrt(sum(v * v for v in x))
+        if norm == 0:
+            continue
+        # Знак выбираем противоположным x[0], чтобы не вычитать близкие числа
+        v = x[:]
+        v[0] += math.copysign(norm, x[0])
+        beta = 2.0 / sum(t * t for t in v)
+        # R = H * R (только строки k.. и столбцы k..)
+        for j in range(k, n):
+            s = beta * sum(v[i] * r[k + i][j] for i in range(len(v)))
+            for i in range(len(v)):
+                r[k + i][j] -= s * v[i]
+        # Q = Q * H
+        for row in q:
+            s = beta * sum(row[k + i] * v[i] for i in range(len(v)))
+            for i in range(len(v)):
+                row[k + i] -= s * v[i]
+        for i in range(k + 1, m):
+            r[i][k] = 0.0
+    return FlatStorage.from_rows(q), FlatStorage.from_rows(r)
+
+
+def _exact(x: Union[int, float, Fraction]) -> Exact:
+    if isinstance(x, float):
+        return int(x) if x.is_integer() else Fraction(x)
+    return x
+
+
+def determinant_bareiss(grid: List[List[Union[int, float, Fraction]]]) -> Exact:
+    """Точный определитель алгоритмом Барейса (без дробей для целых матриц).
+
+    Все деления в алгоритме нацело, поэтому для целых чисел промежуточные
+    значения остаются целыми и результат точный. float переводятся в int или Fraction.
+    """
+    n = len(grid)
+    if not n:
+        return 1
+    m = [[_exact(x) for x in row] for row in grid]
+    # Для целых деление нацело точное; иначе считаем в дробях
+    integral = all(isinstance(x, int) for row in m for x in row)
+    if not integral:
+        m = [[Fraction(x) for x in row] for row in m]
+    divide = operator.floordiv if integral else operator.truediv
+    sign = 1
+    prev: Exact = 1
+    for k in range(n - 1):
+        if m[k][k] == 0:
+            # Ищем ниже ненулевой элемент и меняем строки
+            swap = next((r for r in range(k + 1, n) if m[r][k] != 0), None)
+            if swap is None:
+                return 0
+            m[k], m[swap] = m[swap], m[k]
+            sign = -sign
+        lead = m[k][k]
+        head = m[k]
+        for r in range(k + 1, n):
+            row = m[r]
+            below = row[k]
+            for c in range(k + 1, n):
+                row[c] = divide(row[c] * lead - below * head[c], prev)
+            row[k] = 0
+        prev = lead
+    result = sign * m[n - 1][n - 1]
+    if isinstance(result, Fraction) and result.denominator == 1:
+        return result.numerator
+    return result
@@ -0,0 +1,237 @@
+import math
+import mmap
+import os
+import struct
+import sys
+from array import array
+from typing import List, Optional, Union
+
+from Lab2 import flat_storage
+from Lab2.backends import get_backend
+from Lab2.flat_storage import FlatStorage
+from Lab2.oop_matrix import Matrix
+
+# Формат файла матрицы:
+#   заголовок 32 байта (little-endian): магия b'LMAT', версия (uint8), тип элемента
+#   ('d' - float64, 'f' - float32), порядок байт данных (b'<' или b'>'), 1 байт
+#   выравнивания, rows (uint64), cols (uint64), нули до 32 байт;
+#   дальше данные построчно (row-major) в порядке байт машины, которая создала файл:
+#   так mmap отдает их без преобразования. Файлы без отметки порядка (нулевой байт) - little-endian.
+MAGIC = b'LMAT'
+VERSION = 1
+_HEADER = struct.Struct('<4sBcc1xQQ')
+NATIVE_ORDER = b'<' if sys.byteorder == 'little' else b'>'
+DATA_OFFSET = 32
+DTYPES = {'d': 8, 'f': 4}
+
+# Лимит памяти по умолчанию для вычислений вне памяти
+DEFAULT_MEMORY_LIMIT = 64 * 2 ** 20
+# Оценка байт на элемент плитки при счете в чистом Python:
+# float в списке - указатель (8) плюс объект (24)
+BYTES_PER_ELEMENT = 32
+
+MatrixSource = Union[Matrix, FlatStorage, List[List[float]]]
+
+
+class MatrixFile:
+    """Матрица в бинарном файле, отображенном в память через mmap.
+
+    Данные не читаются целиком: storage - FlatStorage поверх memoryview файла,
+    страницы подгружает ОС по мере обращения. matrix() дает Matrix, который
+    работает прямо с файлом (в режиме записи изменения попадают в файл).
+    После close() представления над файлом становятся недействительными.
+    Файл с чужим порядком байт открывается только на чтение, и данные
+    переставляются в памяти (копия вместо отображения).
+    """
+
+    def __init__(self, path: str, writable: bool = False) -> None:
+        self.path = path
+        self.writable = writable
+        self._file = open(path, 'r+b' if writable else 'rb')
+        try:
+            header = self._file.read(DATA_OFFSET)
+            if len(header) < DATA_OFFSET:
+                raise ValueError(f"{path}: файл короче заголовка")
+            magic, version, dtype, order, rows, cols = _HEADER.unpack_from(header)
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f"{path}: не файл матрицы (магия {magic!r}, версия {version})")
+            self.dtype = dtype.decode()
+            if self.dtype not in DTYPES:
+                raise ValueError(f"{path}: неизвестный тип элемента {self.dtype!r}")
+            order = order if order != b'\0' else b'<'
+            if order not in (b'<', b'>'):
+                raise ValueError(f"{path}: неизвестный порядок байт {order!r}")
+            self.byteorder = order.decode()
+            if order != NATIVE_ORDER and writable:
+                raise ValueError(f"{path}: порядок байт файла ({self.byteorder}) не совпадает с машиной, "
+                                 f"запись через mmap невозможна - откройте на чтение")
+            self.rows, self.cols = rows, cols
+            expected = DATA_OFFSET + rows * cols * DTYPES[self.dtype]
+            if os.fstat(self._file.fileno()).st_size < expected:
+                raise ValueError(f"{path}: данных меньше, чем {rows}x{cols}")
+            self._mmap = mmap.mmap(self._file.fileno(), expected,
+                                   access=mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ)
+        except BaseException:
+            self._file.close()
+            raise
+        if order == NATIVE_ORDER:
+            self._view = memoryview(self._mmap)[DATA_OFFSET:].cast(self.dtype)
+        else:
+            # Чужой порядок байт: без копии не прочитать - данные переставляются в памяти
+            data = array(self.dtype)
+            data.frombytes(self._mmap[DATA_OFFSET:])
+            data.byteswap()
+            self._view = memoryview(data)
+        self.storage = FlatStorage(self._view, rows, cols)
+
+    @classmethod
+    def create(cls, path: str, rows: int, cols: int, dtype: str = 'd') -> 'MatrixFile':
+        """Новый нулевой файл rows x cols (место выделяется без записи нулей) и открывает его на запись"""
+        if dtype not in DTYPES:
+            raise ValueError(f"Неизвестный тип элемента {dtype!r}, есть: {list(DTYPES)}")
+        with open(path, 'wb') as f:
+            f.write(_HEADER.pack(MAGIC, VERSION, dtype.encode(), NATIVE_ORDER, rows, cols).ljust(DATA_OFFSET, b'\0'))
+            f.truncate(DATA_OFFSET + rows * cols * DTYPES[dtype])
+        return cls(path, writable=True)
+
+    @classmethod
+    def save(cls, path: str, source: MatrixSource, dtype: str = 'd') -> 'MatrixFile':
+        """Записывает матрицу в файл построчно и открывает его на запись"""
+        if isinstance(source, Matrix):
+            source = source._data
+        if not isinstance(source, FlatStorage):
+            source = FlatStorage.from_rows(source)
+        result = cls.create(path, source.rows, source.cols, dtype)
+        for i, row in enumerate(source.iter_rows()):
+            result.write_block(i, 0, [row])
+        return result
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return self.rows, self.cols
+
+    @property
+    def nbytes(self) -> int:
+        """Размер данных (без заголовка)"""
+        return self.rows * self.cols * DTYPES[self.dtype]
+
+    def matrix(self) -> Matrix:
+        """Matrix поверх файла без чтения в память"""
+        return Matrix._from_storage(self.storage)
+
+    def read_block(self, r0: int, r1: int, c0: int, c1: int) -> FlatStorage:
+        """Копия подматрицы [r0:r1, c0:c1] в памяти (float64)"""
+        block = array('d')
+        for row in self.storage.block(r0, r1, c0, c1).iter_rows():
+            block.extend(row)
+        return FlatStorage(block, r1 - r0, c1 - c0)
+
+    def write_block(self, r0: int, c0: int, rows: Union[FlatStorage, List]) -> None:
+        """Записывает строки (FlatStorage или список строк) начиная с позиции (r0, c0)"""
+        if isinstance(rows, FlatStorage):
+            rows = rows.iter_rows()
+        view, cols, dtype = self._view, self.cols, self.dtype
+        for i, row in enumerate(rows):
+            start = (r0 + i) * cols + c0
+            values = row if isinstance(row, array) and row.typecode == dtype else array(dtype, row)
+            view[start:start + len(values)] = values
+        self.storage.mark_modified()
+
+    def flush(self) -> None:
+        if self.writable:
+            self._mmap.flush()
+
+    def close(self) -> None:
+        """Сбрасывает изменения на диск и закрывает отображение"""
+        if self._mmap.closed:
+            return
+        self.flush()
+        self._view.release()
+        self._mmap.close()
+        self._file.close()
+
+    def __enter__(self) -> 'MatrixFile':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"<MatrixFile {self.path}: {self.rows}x{self.cols} {self.byteorder}{self.dtype}>"
+
+
+def load(path: str, writable: bool = False) -> MatrixFile:
+    """Открывает файл матрицы через mmap"""
+    return MatrixFile(path, writable)
+
+
+def _tile_size(memory_limit: int, tiles: int) -> int:
+    """Сторона квадратной плитки, чтобы tiles плиток помещались в memory_limit"""
+    return max(1, math.isqrt(memory_limit // (tiles * BYTES_PER_ELEMENT)))
+
+
+def ooc_add(a: MatrixFile, b: MatrixFile, out_path: str,
+            memory_limit: int = DEFAULT_MEMORY_LIMIT) -> MatrixFile:
+    """A + B вне памяти: блоки строк читаются с диска, складываются и сразу пишутся в out_path"""
+    if a.shape != b.shape:
+        raise ValueError(f"Размерности не совпадают: {a.shape} != {b.shape}")
+    rows, cols = a.shape
+    # В памяти одновременно блок A, блок B и их сумма
+    step = max(1, memory_limit // (3 * BYTES_PER_ELEMENT * max(cols, 1)))
+    out = MatrixFile.create(out_path, rows, cols)
+    for r0 in range(0, rows, step):
+        r1 = min(rows, r0 + step)
+        out.write_block(r0, 0, flat_storage.add(a.read_block(r0, r1, 0, cols), b.read_block(r0, r1, 0, cols)))
+    out.flush()
+    return out
+
+
+def ooc_matmul(a: MatrixFile, b: MatrixFile, out_path: str,
+               memory_limit: int = DEFAULT_MEMORY_LIMIT, tile: Optional[int] = None) -> MatrixFile:
+    """A * B вне памяти: блочное умножение плитками tile x tile.
+
+    Для каждой плитки результата C[i, j] с диска по очереди читаются пары
+    A[i, k] и B[k, j], их произведение копится в памяти, готовая плитка пишется
+    в out_path. В памяти одновременно около шести плиток (две исходные,
+    произведение, сумма и распакованные строки/столбцы внутри умножения),
+    по ним и выбирается размер плитки.
+    """
+    if a.cols != b.rows:
+        raise ValueError(f"Нельзя умножить: столбцов в A ({a.cols}) != строк в B ({b.rows})")
+    m, k, n = a.rows, a.cols, b.cols
+    tile = tile or _tile_size(memory_limit, 6)
+    backend = get_backend()
+    out = MatrixFile.create(out_path, m, n)
+    for i0 in range(0, m, tile):
+        i1 = min(m, i0 + tile)
+        for j0 in range(0, n, tile):
+            j1 = min(n, j0 + tile)
+            acc: Optional[FlatStorage] = None
+            for k0 in range(0, k, tile):
+                k1 = min(k, k0 + tile)
+                product = backend.matmul(a.read_block(i0, i1, k0, k1), b.read_block(k0, k1, j0, j1))
+                acc = product if acc is None else flat_storage.add(acc, product)
+            if acc is not None:
+                out.write_block(i0, j0, acc)
+    out.flush()
+    return out
+
+
+if __name__ == "__main__":
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as tmp:
+        a = MatrixFile.save(os.path.join(tmp, 'a.lmat'), [[1, 2], [3, 4]])
+        b = MatrixFile.save(os.path.join(tmp, 'b.lmat'), [[5, 6], [7, 8]])
+        print(a, f"- заголовок {DATA_OFFSET} байт, данные {a.nbytes} байт")
+        print(f"Matrix поверх файла:\n{a.matrix()}")
+        with ooc_add(a, b, os.path.join(tmp, 'sum.lmat')) as s:
+            print(f"Сумма (вне памяти): {s.matrix().to_list()}")
+        with ooc_matmul(a, b, os.path.join(tmp, 'mul.lmat'), tile=1) as p:
+            print(f"Произведение (плитки 1x1): {p.matrix().to_list()}")
+        m = a.matrix()
+        m[0, 0] = 10
+        a.close()
+        with load(os.path.join(tmp, 'a.lmat')) as again:
+            print(f"После записи через Matrix и повторного открытия: {again.matrix().to_list()}")
+        b.close()
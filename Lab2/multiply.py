@@ -0,0 +1,149 @@
+import operator
+import time
+from array import array
+from random import random
+from typing import Any, Callable, Iterable, Optional
+
+from Lab2 import flat_storage
+from Lab2.flat_storage import FlatStorage
+
+# Алгоритмы умножения для чистого Python.
+# Размер плитки (столбцов B) для блочного умножения
+BLOCK_SIZE = 64
+# До какого размера (минимальная из сторон) хватает наивного умножения
+NAIVE_THRESHOLD = 32
+# Начиная с какого размера (минимальная из сторон) включается Штрассен.
+# Значение по умолчанию замерено на CPython 3.11 (один уровень Штрассена выигрывает
+# у блочного умножения с 512); tune_crossover() подбирает его на текущей машине
+STRASSEN_THRESHOLD = 512
+
+
+def matmul_naive(a: FlatStorage, b: FlatStorage, out: Optional[FlatStorage] = None) -> FlatStorage:
+    """Обычное умножение: скалярное произведение строки A на столбец B"""
+    return flat_storage.matmul(a, b, out)
+
+
+def matmul_blocked(a: FlatStorage, b: FlatStorage, block: Optional[int] = None,
+                   out: Optional[FlatStorage] = None) -> FlatStorage:
+    """Блочное умножение.
+
+    Столбцы B обрабатываются плитками по block штук: плитка остается в кэше,
+    пока над ней проходят все строки A. Строки A и столбцы B один раз
+    распаковываются в списки float, чтобы внутренний цикл sum(map(mul, ...))
+    не создавал объект float на каждое чтение из буфера.
+    Результат пишется в out, если он задан: операнды к этому моменту уже
+    распакованы, поэтому out может делить буфер с A или B.
+    """
+    block = block or BLOCK_SIZE
+    a_rows = [row.tolist() for row in a.iter_rows()]
+    b_cols = [col.tolist() for col in b.transpose().iter_rows()]
+    if out is None:
+        out = FlatStorage.zeros(a.rows, b.cols)
+    mul, store_row = operator.mul, flat_storage.store_row
+    for j0 in range(0, b.cols, block):
+        tile = b_cols[j0:j0 + block]
+        for i, row in enumerate(a_rows):
+            store_row(out, i, [sum(map(mul, row, col)) for col in tile], j0)
+    out.mark_modified()
+    return out
+
+
+def _padded(a: FlatStorage, rows: int, cols: int) -> FlatStorage:
+    """Копия a, дополненная нулями до rows x cols"""
+    if a.shape == (rows, cols):
+        return a
+    result = FlatStorage.zeros(rows, cols)
+    result.block(0, a.rows, 0, a.cols).copy_from(a)
+    return result
+
+
+def matmul_strassen(a: FlatStorage, b: FlatStorage, threshold: Optional[int] = None) -> FlatStorage:
+    """Алгоритм Штрассена: 7 умножений половинного размера вместо 8.
+
+    Работает и с прямоугольными матрицами: нечетные стороны дополняются нулями.
+    Четверти берутся представлениями без копирования. Когда наименьшая сторона
+    становится меньше threshold, рекурсия передает работу блочному умножению.
+    threshold должен быть не меньше 2: сторона 1 дополняется до 2 и снова делится пополам.
+    """
+    if threshold is None:
+        threshold = STRASSEN_THRESHOLD
+    if threshold < 2:
+        raise ValueError(f"Порог Штрассена должен быть не меньше 2, а не {threshold}")
+    m, k, n = a.rows, a.cols, b.cols
+    if min(m, k, n) < threshold:
+        return matmul_blocked(a, b)
+
+    # Дополняем до четных размеров
+    m2, k2, n2 = m + m % 2, k + k % 2, n + n % 2
+    pa, pb = _padded(a, m2, k2), _padded(b, k2, n2)
+    hm, hk, hn = m2 // 2, k2 // 2, n2 // 2
+    a11, a12 = pa.block(0, hm, 0, hk), pa.block(0, hm, hk, k2)
+    a21, a22 = pa.block(hm, m2, 0, hk), pa.block(hm, m2, hk, k2)
+    b11, b12 = pb.block(0, hk, 0, hn), pb.block(0, hk, hn, n2)
+    b21, b22 = pb.block(hk, k2, 0, hn), pb.block(hk, k2, hn, n2)
+
+    add, sub = flat_storage.add, flat_storage.sub
+    m1 = matmul_strassen(add(a11, a22), add(b11, b22), threshold)
+    m2_ = matmul_strassen(add(a21, a22), b11, threshold)
+    m3 = matmul_strassen(a11, sub(b12, b22), threshold)
+    m4 = matmul_strassen(a22, sub(b21, b11), threshold)
+    m5 = matmul_strassen(add(a11, a12), b22, threshold)
+    m6 = matmul_strassen(sub(a21, a11), add(b11, b12), threshold)
+    m7 = matmul_strassen(sub(a12, a22), add(b21, b22), threshold)
+
+    out = FlatStorage.zeros(m2, n2)
+    out.block(0, hm, 0, hn).copy_from(add(sub(add(m1, m4), m5), m7))
+    out.block(0, hm, hn, n2).copy_from(add(m3, m5))
+    out.block(hm, m2, 0, hn).copy_from(add(m2_, m4))
+    out.block(hm, m2, hn, n2).copy_from(add(add(sub(m1, m2_), m3), m6))
+    if (m2, n2) != (m, n):
+        out = out.block(0, m, 0, n).copy()
+    return out
+
+
+def matmul_auto(a: FlatStorage, b: FlatStorage, out: Optional[FlatStorage] = None) -> FlatStorage:
+    """Выбирает алгоритм по размеру: наивный, блочный или Штрассен (с out= - запись в готовое хранилище)"""
+    smallest = min(a.rows, a.cols, b.cols)
+    if smallest >= STRASSEN_THRESHOLD:
+        result = matmul_strassen(a, b)
+        if out is None:
+            return result
+        # Штрассену нужны промежуточные матрицы в любом случае
+        out.copy_from(result)
+        return out
+    if smallest > NAIVE_THRESHOLD:
+        return matmul_blocked(a, b, out=out)
+    return matmul_naive(a, b, out)
+
+
+def _random_square(n: int) -> FlatStorage:
+    return FlatStorage(array('d', (random() for _ in range(n * n))), n, n)
+
+
+def _time(action: Callable[..., Any], *args: Any) -> float:
+    start = time.perf_counter()
+    action(*args)
+    return time.perf_counter() - start
+
+
+def tune_crossover(sizes: Iterable[int] = (64, 128, 256, 384, 512)) -> int:
+    """Подбирает STRASSEN_THRESHOLD на текущей машине.
+
+    Для каждого размера сравнивает один уровень Штрассена с блочным умножением;
+    порог - первый размер, на котором Штрассен выиграл.
+    Если не выиграл нигде, порог остается за пределами проверенных размеров.
+    Размеры - не меньше 2 (как и порог matmul_strassen).
+    """
+    global STRASSEN_THRESHOLD
+    sizes = sorted(sizes)
+    if not sizes or sizes[0] < 2:
+        raise ValueError(f"Нужны размеры не меньше 2, а не {sizes}")
+    threshold = sizes[-1] + 1
+    for n in sizes:
+        a, b = _random_square(n), _random_square(n)
+        # Порог n - ровно один уровень рекурсии (четверти n / 2 < n), дальше блочное умножение
+        if _time(matmul_strassen, a, b, n) < _time(matmul_blocked, a, b):
+            threshold = n
+            break
+    STRASSEN_THRESHOLD = threshold
+    return threshold
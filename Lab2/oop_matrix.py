@@ -1,24 +1,116 @@
-from typing import List, Union, Optional
+from typing import List, Union, Optional, Callable, Any, Dict, Sequence, Tuple
+
+from Lab2 import linalg
+from Lab2.backends import get_backend
+from Lab2.flat_storage import FlatStorage
+from Lab2.lazy import LazyMatrix
+from Lab2.linalg import Exact
+from Lab2.parallel import ParallelExecutor
 
 # Определяем тип для содержимого матрицы (числа)
 Num = Union[int, float]
 
 
+def _lossy(grid: List[List[Num]]) -> bool:
+    """Есть ли значения, которые float64 хранит неточно (целые больше 2^53, Fraction вроде 1/3)"""
+    for row in grid:
+        for x in row:
+            if isinstance(x, float):
+                continue
+            try:
+                if float(x) != x:
+                    return True
+            except OverflowError:
+                return True
+    return False
+
+
 class Matrix:
     """Класс Matrix с реализацией основных математических операций"""
 
     def __init__(self, grid: List[List[Num]]) -> None:
         # Проверяем валидность при создании
         self._check_consistency(grid)
-        # Создаем глубокую копию данных, чтобы изменения извне не ломали матрицу
-        self._values = [row[:] for row in grid]
+        # Копируем данные в плоский буфер, чтобы изменения извне не ломали матрицу
+        self._attach(FlatStorage.from_rows(grid))
+        # Буфер хранит float64; если значения в нем округлились, исходные держим для exact=True
+        # в том же порядке, что и буфер: по ним читают и представления (row, column, transpose)
+        if _lossy(grid):
+            self._exact_values = [x for row in grid for x in row]
+            self._exact_stamp = self._data.stamp[0]
+
+    @classmethod
+    def _from_storage(cls, storage: FlatStorage) -> 'Matrix':
+        """Внутренний конструктор: оборачивает готовое хранилище без проверки и копирования"""
+        matrix = cls.__new__(cls)
+        matrix._attach(storage)
+        return matrix
+
+    def _attach(self, storage: FlatStorage) -> None:
+        self._data = storage
+        # Кэш разложений (LU, QR) и счетчик изменений буфера, при котором он построен
+        self._cache: Dict[str, Any] = {}
+        self._cache_stamp = storage.stamp[0]
+        # Исходные значения (int/Fraction) по позициям буфера, если float64 их округлил; иначе None
+        self._exact_values: Optional[List[Num]] = None
+        self._exact_stamp = self._cache_stamp
+
+    def _view(self, storage: FlatStorage) -> 'Matrix':
+        """Матрица-представление над буфером этой матрицы; точные значения общие с ней"""
+        view = Matrix._from_storage(storage)
+        if storage.data is self._data.data:
+            view._exact_values = self._exact_values
+            view._exact_stamp = self._exact_stamp
+        return view
+
+    def _cached(self, key: str, compute: Callable[[], Any]) -> Any:
+        """Мемоизация на экземпляре: сбрасывается, только если данные матрицы изменились"""
+        stamp = self._data.stamp[0]
+        if stamp != self._cache_stamp:
+            self._cache.clear()
+            self._cache_stamp = stamp
+        if key not in self._cache:
+            self._cache[key] = compute()
+        return self._cache[key]
+
+    def _lu_factors(self) -> linalg.LUDecomposition:
+        rows, cols = self.shape
+        if rows != cols:
+            raise ValueError("Разложение существует только для квадратных матриц")
+        return self._cached('lu', lambda: linalg.lu_decompose(self._data))
 
     @property
     def shape(self) -> tuple[int, int]:
         """Возвращает размерность матрицы (строки, столбцы)"""
-        if not self._values:
-            return 0, 0
-        return len(self._values), len(self._values[0])
+        return self._data.shape
+
+    def to_list(self) -> List[List[float]]:
+        """Данные матрицы в виде списка строк (копия)"""
+        return self._data.to_rows()
+
+    def __getitem__(self, index: tuple[int, int]) -> float:
+        """Элемент m[i, j]"""
+        i, j = index
+        rows, cols = self.shape
+        if not (0 <= i < rows and 0 <= j < cols):
+            raise IndexError(f"Индекс {index} вне матрицы {self.shape}")
+        return self._data.get(i, j)
+
+    def __setitem__(self, index: tuple[int, int], value: Num) -> None:
+        """Запись элемента m[i, j] = value (сбрасывает кэш разложений)"""
+        i, j = index
+        rows, cols = self.shape
+        if not (0 <= i < rows and 0 <= j < cols):
+            raise IndexError(f"Индекс {index} вне матрицы {self.shape}")
+        self._data.set(i, j, value)
+
+    def row(self, i: int) -> 'Matrix':
+        """i-я строка как матрица 1 x n (представление без копирования)"""
+        return self._view(self._data.row(i))
+
+    def column(self, j: int) -> 'Matrix':
+        """j-й столбец как матрица n x 1 (представление без копирования)"""
+        return self._view(self._data.column(j))
 
     @staticmethod
     def _check_consistency(grid: List[List[Num]]) -> None:
@@ -30,27 +122,25 @@ class Matrix:
             raise ValueError("Матрица должна иметь строки одинаковой длины")
 
     def __str__(self) -> str:
-        return '\n'.join([' '.join(f"{x:5.1f}" for x in row) for row in self._values])
+        return '\n'.join([' '.join(f"{x:5.1f}" for x in row) for row in self._data.iter_rows()])
 
     def __add__(self, other: 'Matrix') -> 'Matrix':
         """Оператор сложения (+)"""
+        # Другие типы (например, SparseMatrix) складываются своим __radd__
+        if not isinstance(other, Matrix):
+            return NotImplemented
         if self.shape != other.shape:
             raise ValueError(f"Размерности не совпадают: {self.shape} != {other.shape}")
 
-        # Складываем поэлементно, используя zip
-        new_grid = [
-            [a + b for a, b in zip(row_a, row_b)]
-            for row_a, row_b in zip(self._values, other._values)
-        ]
-        return Matrix(new_grid)
+        # Складываем поэлементно через текущий бэкенд, результат не перепроверяется
+        return Matrix._from_storage(get_backend().add(self._data, other._data))
 
     def __mul__(self, other: Union['Matrix', Num]) -> 'Matrix':
         """Оператор умножения (*). Работает и со скаляром, и с матрицей"""
 
         # 1. Умножение на число (Скаляр)
         if isinstance(other, (int, float)):
-            new_grid = [[x * other for x in row] for row in self._values]
-            return Matrix(new_grid)
+            return Matrix._from_storage(get_backend().scale(self._data, other))
 
         # 2. Умножение на матрицу
         elif isinstance(other, Matrix):
@@ -60,44 +150,156 @@ class Matrix:
             if cols_a != rows_b:
                 raise ValueError(f"Нельзя умножить: столбцов в A ({cols_a}) != строк в B ({rows_b})")
 
-            other_t = list(zip(*other._values))
-
-            result = [
-                [sum(a * b for a, b in zip(row, col)) for col in other_t]
-                for row in self._values
-            ]
-            return Matrix(result)
+            return Matrix._from_storage(get_backend().matmul(self._data, other._data))
 
         return NotImplemented
 
-    def transpose(self) -> 'Matrix':
-        """Возвращает транспонированную матрицу"""
-        transposed_data = [list(col) for col in zip(*self._values)]
-        return Matrix(transposed_data)
+    # Операции без новых матриц. Результат пишется в готовую матрицу out (или в саму матрицу
+    # для += и *=). Если матрица - представление (row, column, transpose), запись идет
+    # в общий с исходной матрицей буфер; кэш разложений у всех, кто делит буфер, сбрасывается
+
+    @staticmethod
+    def _check_out(out: 'Matrix', shape: tuple[int, int]) -> None:
+        if out.shape != shape:
+            raise ValueError(f"Форма out {out.shape} не совпадает с формой результата {shape}")
 
-    def determinant(self) -> float:
-        """Рекурсивное вычисление определителя"""
+    def add(self, other: 'Matrix', out: Optional['Matrix'] = None) -> 'Matrix':
+        """Сложение; с out результат пишется в out и out возвращается"""
+        if out is None:
+            return self + other
+        if self.shape != other.shape:
+            raise ValueError(f"Размерности не совпадают: {self.shape} != {other.shape}")
+        self._check_out(out, self.shape)
+        get_backend().add(self._data, other._data, out._data)
+        return out
+
+    def mul(self, other: Union['Matrix', Num], out: Optional['Matrix'] = None) -> 'Matrix':
+        """Умножение на число или матрицу; с out результат пишется в out (может быть self или other)"""
+        if out is None:
+            return self * other
+        if isinstance(other, (int, float)):
+            self._check_out(out, self.shape)
+            get_backend().scale(self._data, other, out._data)
+            return out
+        if self.shape[1] != other.shape[0]:
+            raise ValueError(f"Нельзя умножить: столбцов в A ({self.shape[1]}) != строк в B ({other.shape[0]})")
+        self._check_out(out, (self.shape[0], other.shape[1]))
+        get_backend().matmul(self._data, other._data, out._data)
+        return out
+
+    def __iadd__(self, other: 'Matrix') -> 'Matrix':
+        """A += B без новой матрицы"""
+        if not isinstance(other, Matrix):
+            return NotImplemented
+        return self.add(other, out=self)
+
+    def __imul__(self, other: Union['Matrix', Num]) -> 'Matrix':
+        """A *= k или A *= B (B квадратная) без новой матрицы"""
+        if not isinstance(other, (int, float, Matrix)):
+            return NotImplemented
+        return self.mul(other, out=self)
+
+    def matmul(self, other: 'Matrix', executor: Optional[ParallelExecutor] = None) -> 'Matrix':
+        """Произведение матриц; с executor строки делятся между процессами пула"""
+        if self.shape[1] != other.shape[0]:
+            raise ValueError(f"Нельзя умножить: столбцов в A ({self.shape[1]}) != строк в B ({other.shape[0]})")
+        if executor is None:
+            return self * other
+        return Matrix._from_storage(executor.matmul(self._data, other._data))
+
+    @staticmethod
+    def batch_mul(pairs: Sequence[Tuple['Matrix', 'Matrix']],
+                  executor: Optional[ParallelExecutor] = None) -> List['Matrix']:
+        """Пакет произведений [A1 * B1, A2 * B2, ...], с executor - параллельно"""
+        for a, b in pairs:
+            if a.shape[1] != b.shape[0]:
+                raise ValueError(f"Нельзя умножить: {a.shape} и {b.shape}")
+        if executor is None:
+            return [a * b for a, b in pairs]
+        results = executor.batch_mul([(a._data, b._data) for a, b in pairs])
+        return [Matrix._from_storage(result) for result in results]
+
+    def lazy(self) -> LazyMatrix:
+        """Отложенный режим: +, * на число и transpose() строят выражение,
+        которое вычисляется одним проходом в evaluate()"""
+        return LazyMatrix.leaf(self._data)
+
+    def transpose(self, out: Optional['Matrix'] = None) -> 'Matrix':
+        """Возвращает транспонированную матрицу (представление без копирования).
+
+        С out значения копируются в out (cols x rows) - независимую от исходной матрицу.
+        """
+        if out is None:
+            return self._view(get_backend().transpose(self._data))
+        rows, cols = self.shape
+        self._check_out(out, (cols, rows))
+        get_backend().transpose(self._data, out._data)
+        return out
+
+    def _exact_rows(self) -> List[List[Num]]:
+        """Значения для точных вычислений: исходные, если float64 их округлил"""
+        if self._exact_values is None:
+            return self.to_list()
+        if self._data.stamp[0] != self._exact_stamp:
+            raise ValueError("Матрица создана из значений, не представимых в float64, и затем изменена: "
+                             "точные значения потеряны")
+        values, storage = self._exact_values, self._data
+        return [[values[storage.index(i, j)] for j in range(storage.cols)] for i in range(storage.rows)]
+
+    def determinant(self, exact: bool = False) -> Union[float, Exact]:
+        """Вычисление определителя.
+
+        По умолчанию - через текущий бэкенд (LU-разложение, O(n^3)); если LU уже
+        посчитано и данные не менялись, берется из кэша за O(n).
+        exact=True - точный алгоритм Барейса: int для целочисленной матрицы, иначе Fraction.
+        Данные матрицы хранятся в float64, поэтому точными считаются значения, которые
+        в нем представимы (целые до 2^53). Если конструктору переданы большие int или
+        Fraction, для exact=True берутся исходные значения (и у представлений row, column,
+        transpose); после изменения такой матрицы они потеряны, и exact=True выдает ValueError.
+        """
         rows, cols = self.shape
         if rows != cols:
             raise ValueError("Определитель существует только для квадратных матриц")
 
-        # Базовые случаи
-        if rows == 1:
-            return self._values[0][0]
-        if rows == 2:
-            return self._values[0][0] * self._values[1][1] - self._values[0][1] * self._values[1][0]
+        if exact:
+            return self._cached('det_exact', lambda: linalg.determinant_bareiss(self._exact_rows()))
+        if self._data.stamp[0] == self._cache_stamp and 'lu' in self._cache:
+            return self._cache['lu'].determinant()
+        return get_backend().determinant(self._data)
+
+    def lu(self) -> tuple['Matrix', 'Matrix', 'Matrix']:
+        """LU-разложение с выбором ведущего элемента: (P, L, U), где P * A = L * U"""
+        lu = self._lu_factors()
+        return (Matrix._from_storage(lu.permutation()), Matrix._from_storage(lu.lower()),
+                Matrix._from_storage(lu.upper()))
+
+    def qr(self) -> tuple['Matrix', 'Matrix']:
+        """QR-разложение (Хаусхолдер): (Q, R), где A = Q * R"""
+        q, r = self._cached('qr', lambda: linalg.qr_decompose(self._data))
+        return Matrix._from_storage(q.copy()), Matrix._from_storage(r.copy())
+
+    def solve(self, b: Union['Matrix', List[Num]]) -> Union['Matrix', List[float]]:
+        """Решение системы A * x = b.
 
-        # Рекурсия (разложение по первой строке)
-        det = 0.0
-        for idx, element in enumerate(self._values[0]):
-            # Вырезаем минор (подматрицу)
-            sub_grid = [row[:idx] + row[idx + 1:] for row in self._values[1:]]
+        b - матрица (каждый столбец - своя правая часть) или список чисел.
+        LU-разложение считается один раз и хранится на матрице, поэтому
+        повторные решения с той же A стоят O(n^2).
+        """
+        lu = self._lu_factors()
+        if isinstance(b, Matrix):
+            if b.shape[0] != self.shape[0]:
+                raise ValueError(f"Правая часть {b.shape} не подходит к матрице {self.shape}")
+            return Matrix._from_storage(lu.solve(b._data))
 
-            # Знак чередуется: + - + -
-            sign = 1 if idx % 2 == 0 else -1
-            det += sign * element * Matrix(sub_grid).determinant()
+        if len(b) != self.shape[0]:
+            raise ValueError(f"Длина правой части {len(b)} != {self.shape[0]}")
+        column = FlatStorage.from_rows([[x] for x in b])
+        return list(lu.solve(column).flat_values())
 
-        return det
+    def inverse(self) -> 'Matrix':
+        """Обратная матрица (через закэшированное LU-разложение)"""
+        inverse = self._cached('inverse', lambda: self._lu_factors().inverse())
+        return Matrix._from_storage(inverse.copy())
 
 
 if __name__ == "__main__":
@@ -110,3 +312,13 @@ if __name__ == "__main__":
     print(f"Умножение матриц:\n{m1 * m2}")
     print(f"Транспонирование:\n{m1.transpose()}")
     print(f"Определитель m1: {m1.determinant()}")
+    print(f"Точный определитель m1: {m1.determinant(exact=True)}")
+    p, l, u = m1.lu()
+    print(f"LU: P * A == L * U -> {(p * m1).to_list() == (l * u).to_list()}")
+    print(f"Решение m1 * x = [5, 8]: {m1.solve([5, 8])}")
+    print(f"Обратная m1:\n{m1.inverse()}")
+    acc = Matrix([[0, 0], [0, 0]])
+    acc += m1
+    acc *= 2
+    print(f"На месте (acc += m1; acc *= 2):\n{acc}")
+    print(f"m1 * m2 в готовую матрицу:\n{m1.mul(m2, out=acc)}")
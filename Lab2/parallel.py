@@ -0,0 +1,159 @@
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import resource_tracker, shared_memory
+from typing import List, Optional, Sequence, Tuple
+
+from Lab2.backends import get_backend
+from Lab2.flat_storage import FlatStorage
+
+# Меньше этого числа умножений (m * k * n) пул не окупает запуск задач:
+# произведение считается в текущем процессе
+PARALLEL_THRESHOLD = 64 ** 3
+
+# Задача пакета: (смещение A, m, k, смещение B, n, смещение результата) - в элементах float64
+BatchItem = Tuple[int, int, int, int, int, int]
+
+
+def _create_shared(count: int) -> shared_memory.SharedMemory:
+    """Разделяемый блок под count чисел float64 (SharedMemory не бывает нулевого размера)"""
+    return shared_memory.SharedMemory(create=True, size=max(8, 8 * count))
+
+
+def _read(buf: memoryview, start: int, count: int) -> array:
+    """Копия count чисел из разделяемого буфера в локальный array('d') (memcpy, без pickle)"""
+    values = array('d')
+    values.frombytes(buf[8 * start:8 * (start + count)])
+    return values
+
+
+def _write(buf: memoryview, start: int, values: Sequence[float]) -> None:
+    doubles = buf.cast('d')
+    doubles[start:start + len(values)] = values if isinstance(values, array) else array('d', values)
+    doubles.release()
+
+
+def _multiply_items(in_name: str, out_name: str, items: List[BatchItem]) -> None:
+    """Рабочий процесс: считает свои произведения и пишет их прямо в разделяемый результат"""
+    src = shared_memory.SharedMemory(name=in_name)
+    dst = shared_memory.SharedMemory(name=out_name)
+    try:
+        backend = get_backend()
+        for a_off, m, k, b_off, n, out_off in items:
+            a = FlatStorage(_read(src.buf, a_off, m * k), m, k)
+            b = FlatStorage(_read(src.buf, b_off, k * n), k, n)
+            _write(dst.buf, out_off, backend.matmul(a, b).flat_values())
+    finally:
+        src.close()
+        dst.close()
+
+
+class ParallelExecutor:
+    """Пул процессов для умножения матриц.
+
+    Операнды один раз копируются в разделяемую память (multiprocessing.shared_memory),
+    задачи передают только имя блока и смещения, поэтому данные не сериализуются
+    на каждую задачу. Рабочие процессы пишут результат в общий выходной блок.
+    Одно большое произведение режется на блоки строк A, пакет мелких -
+    на группы пар с примерно равным числом умножений.
+    """
+
+    def __init__(self, workers: Optional[int] = None, threshold: int = PARALLEL_THRESHOLD) -> None:
+        self.workers = workers or os.cpu_count() or 1
+        self.threshold = threshold
+        # resource_tracker запускается до рабочих процессов, чтобы они делили его с родителем.
+        # Иначе у каждого свой трекер, и при выходе он пытается удалить чужие (уже удаленные) блоки
+        resource_tracker.ensure_running()
+        self._pool = ProcessPoolExecutor(max_workers=self.workers)
+
+    def matmul(self, a: FlatStorage, b: FlatStorage) -> FlatStorage:
+        """A * B с разбиением строк A между процессами (размеры проверяет вызывающий)"""
+        m, k, n = a.rows, a.cols, b.cols
+        if m * k * n < self.threshold or m < 2:
+            return get_backend().matmul(a, b)
+        parts = min(self.workers, m)
+        bounds = [m * p // parts for p in range(parts + 1)]
+        # A и B лежат в одном блоке подряд: A (m x k), затем B (k x n)
+        items = [[(bounds[p] * k, bounds[p + 1] - bounds[p], k, m * k, n, bounds[p] * n)]
+                 for p in range(parts)]
+        return self._run([a, b], m * n, items)[0]
+
+    def batch_mul(self, pairs: Sequence[Tuple[FlatStorage, FlatStorage]]) -> List[FlatStorage]:
+        """Много независимых произведений: каждое считается целиком в одном процессе"""
+        if sum(a.rows * a.cols * b.cols for a, b in pairs) < self.threshold:
+            backend = get_backend()
+            return [backend.matmul(a, b) for a, b in pairs]
+
+        items: List[BatchItem] = []
+        offset = out_offset = 0
+        for a, b in pairs:
+            items.append((offset, a.rows, a.cols, offset + a.size, b.cols, out_offset))
+            offset += a.size + b.size
+            out_offset += a.rows * b.cols
+
+        # Жадно раскладываем пары по группам, начиная с самых тяжелых
+        groups: List[List[BatchItem]] = [[] for _ in range(min(self.workers, len(items)))]
+        loads = [0] * len(groups)
+        for item in sorted(items, key=lambda it: -it[1] * it[2] * it[4]):
+            lightest = loads.index(min(loads))
+            groups[lightest].append(item)
+            loads[lightest] += item[1] * item[2] * item[4]
+
+        operands = [m for pair in pairs for m in pair]
+        return self._run(operands, out_offset, groups,
+                         [(item[5], item[1], item[4]) for item in items])
+
+    def _run(self, operands: List[FlatStorage], out_size: int, groups: List[List[BatchItem]],
+             outputs: Optional[List[Tuple[int, int, int]]] = None) -> List[FlatStorage]:
+        """Кладет операнды в разделяемую память, раздает группы задач и собирает результаты"""
+        src = _create_shared(sum(m.size for m in operands))
+        dst = _create_shared(out_size)
+        try:
+            offset = 0
+            for m in operands:
+                _write(src.buf, offset, m.flat_values())
+                offset += m.size
+            futures = [self._pool.submit(_multiply_items, src.name, dst.name, group)
+                       for group in groups if group]
+            for future in futures:
+                future.result()
+            if outputs is None:
+                # Одно произведение: форма - строки A на столбцы B
+                outputs = [(0, operands[0].rows, operands[1].cols)]
+            return [FlatStorage(_read(dst.buf, start, rows * cols), rows, cols)
+                    for start, rows, cols in outputs]
+        finally:
+            for shm in (src, dst):
+                shm.close()
+                shm.unlink()
+
+    def start(self) -> None:
+        """Заранее запускает рабочие процессы (иначе они стартуют с первой задачей)"""
+        for future in [self._pool.submit(os.getpid) for _ in range(self.workers)]:
+            future.result()
+
+    def close(self) -> None:
+        """Останавливает рабочие процессы"""
+        self._pool.shutdown()
+
+    def __enter__(self) -> 'ParallelExecutor':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"<ParallelExecutor: {self.workers} процессов>"
+
+
+if __name__ == "__main__":
+    from Lab2.multiply import _random_square
+
+    with ParallelExecutor(workers=2, threshold=0) as executor:
+        x, y = _random_square(50), _random_square(50)
+        expected = get_backend().matmul(x, y).to_rows()
+        got = executor.matmul(x, y).to_rows()
+        print(executor, "- совпадает с последовательным:",
+              all(abs(p - q) < 1e-9 for r1, r2 in zip(expected, got) for p, q in zip(r1, r2)))
+        small = [(_random_square(4), _random_square(4)) for _ in range(10)]
+        print("Пакет из", len(small), "произведений:", len(executor.batch_mul(small)), "результатов")
@@ -0,0 +1,131 @@
+import functools
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional
+
+from Lab2.oop_matrix import Matrix
+
+# Профилирование включается явно: пока enable_profiling() не вызван,
+# методы Matrix не обернуты и ничего не платят. После disable_profiling()
+# исходные методы возвращаются на место.
+
+# Какие операции Matrix замеряются
+PROFILED_METHODS = (
+    '__add__', '__mul__', '__iadd__', '__imul__', 'add', 'mul', 'matmul', 'transpose',
+    'determinant', 'lu', 'qr', 'solve', 'inverse', 'lazy',
+)
+
+
+class OperationStats:
+    """Число вызовов и время одной операции (секунды)"""
+
+    __slots__ = ('calls', 'total', 'min', 'max')
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.total = 0.0
+        self.min = float('inf')
+        self.max = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.calls += 1
+        self.total += seconds
+        if seconds < self.min:
+            self.min = seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def as_dict(self) -> Dict[str, float]:
+        return {
+            'calls': self.calls,
+            'total_s': self.total,
+            'mean_s': self.total / self.calls if self.calls else 0.0,
+            'min_s': self.min if self.calls else 0.0,
+            'max_s': self.max,
+        }
+
+
+class MatrixProfile:
+    """Статистика по операциям Matrix, собранная за время профилирования"""
+
+    def __init__(self) -> None:
+        self.operations: Dict[str, OperationStats] = {}
+
+    def observe(self, name: str, seconds: float) -> None:
+        stats = self.operations.get(name)
+        if stats is None:
+            stats = self.operations[name] = OperationStats()
+        stats.observe(seconds)
+
+    def as_dict(self) -> Dict[str, Dict[str, float]]:
+        return {name: stats.as_dict() for name, stats in self.operations.items()}
+
+    def report(self) -> str:
+        """Таблица: операции по убыванию суммарного времени"""
+        lines = [f"{'операция':<14} | {'вызовов':>8} | {'всего, с':>10} | {'среднее, мс':>11} | {'макс, мс':>9}"]
+        for name, stats in sorted(self.operations.items(), key=lambda item: -item[1].total):
+            lines.append(f"{name:<14} | {stats.calls:>8} | {stats.total:10.4f} | "
+                         f"{stats.total / stats.calls * 1000:11.3f} | {stats.max * 1000:9.3f}")
+        return '\n'.join(lines)
+
+
+_originals: Dict[str, Callable[..., Any]] = {}
+_profile: Optional[MatrixProfile] = None
+
+
+def _timed(name: str, method: Callable[..., Any]) -> Callable[..., Any]:
+    @functools.wraps(method)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        # Вложенные вызовы (например, __iadd__ -> add) учитываются каждый отдельно
+        start = time.perf_counter()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            if _profile is not None:
+                _profile.observe(name, time.perf_counter() - start)
+    return wrapper
+
+
+def enable_profiling() -> MatrixProfile:
+    """Оборачивает методы Matrix замером времени и возвращает новую статистику"""
+    global _profile
+    if not _originals:
+        for name in PROFILED_METHODS:
+            _originals[name] = getattr(Matrix, name)
+            setattr(Matrix, name, _timed(name, _originals[name]))
+    _profile = MatrixProfile()
+    return _profile
+
+
+def disable_profiling() -> Optional[MatrixProfile]:
+    """Возвращает исходные методы Matrix; результат - собранная статистика"""
+    global _profile
+    for name, method in _originals.items():
+        setattr(Matrix, name, method)
+    _originals.clear()
+    profile, _profile = _profile, None
+    return profile
+
+
+@contextmanager
+def profiling() -> Iterator[MatrixProfile]:
+    """with profiling() as profile: ... - профилирование на время блока"""
+    profile = enable_profiling()
+    try:
+        yield profile
+    finally:
+        disable_profiling()
+
+
+if __name__ == "__main__":
+    a = Matrix([[4, 1], [2, 3]])
+    b = Matrix([[1, 2], [3, 4]])
+    with profiling() as prof:
+        for _ in range(100):
+            c = a * b + a
+            c *= 0.5
+            c.transpose()
+        a.determinant()
+        a.solve([1, 2])
+    print(prof.report())
+    print(f"После выключения методы исходные: {not hasattr(Matrix.__add__, '__wrapped__')}")
@@ -0,0 +1,322 @@
+import operator
+from array import array
+from bisect import bisect_left
+from itertools import repeat
+from typing import List, Union, Iterable, Iterator, Tuple, Dict
+
+from Lab2.flat_storage import FlatStorage
+from Lab2.oop_matrix import Matrix
+
+Num = Union[int, float]
+MatrixData = List[List[float]]
+# Тройка COO: (строка, столбец, значение)
+Entry = Tuple[int, int, Num]
+# Сжатый формат: (указатели начала строк, номера столбцов, значения).
+# Для CSC то же самое, только по столбцам
+Compressed = Tuple[array, array, array]
+
+
+class SparseMatrix:
+    """Разреженная матрица: хранятся только ненулевые элементы.
+
+    Строится из троек COO (строка, столбец, значение), внутри хранится в CSR:
+    indptr[i]:indptr[i + 1] - срез indices/data с ненулями i-й строки,
+    столбцы в строке упорядочены. CSC (по столбцам) строится по запросу
+    и кэшируется. Все операции стоят O(nnz), а не O(rows * cols).
+    """
+
+    __slots__ = ('rows', 'cols', 'indptr', 'indices', 'data', '_csc')
+
+    def __init__(self, shape: Tuple[int, int], entries: Iterable[Entry] = ()) -> None:
+        rows, cols = shape
+        if rows < 0 or cols < 0:
+            raise ValueError(f"Некорректная размерность {shape}")
+        # Повторяющиеся позиции складываются, как в COO
+        acc: Dict[Tuple[int, int], float] = {}
+        for i, j, value in entries:
+            if not (0 <= i < rows and 0 <= j < cols):
+                raise IndexError(f"Индекс {(i, j)} вне матрицы {shape}")
+            acc[i, j] = acc.get((i, j), 0.0) + value
+        indptr = array('q', bytes(8 * (rows + 1)))
+        indices, data = array('i'), array('d')
+        for (i, j) in sorted(acc):
+            value = acc[i, j]
+            if value:
+                indptr[i + 1] += 1
+                indices.append(j)
+                data.append(value)
+        for i in range(rows):
+            indptr[i + 1] += indptr[i]
+        self._set_csr(rows, cols, indptr, indices, data)
+
+    def _set_csr(self, rows: int, cols: int, indptr: array, indices: array, data: array) -> None:
+        self.rows = rows
+        self.cols = cols
+        self.indptr = indptr
+        self.indices = indices
+        self.data = data
+        self._csc: Tuple = ()
+
+    @classmethod
+    def _from_csr(cls, rows: int, cols: int, indptr: array, indices: array, data: array) -> 'SparseMatrix':
+        """Внутренний конструктор: готовые массивы CSR без проверки"""
+        matrix = cls.__new__(cls)
+        matrix._set_csr(rows, cols, indptr, indices, data)
+        return matrix
+
+    @classmethod
+    def _from_row_dicts(cls, rows: int, cols: int, row_dicts: Iterable[Dict[int, float]]) -> 'SparseMatrix':
+        """CSR из словарей {столбец: значение} по строкам (нули отбрасываются)"""
+        indptr, indices, data = array('q', [0]), array('i'), array('d')
+        for acc in row_dicts:
+            for j in sorted(acc):
+                value = acc[j]
+                if value:
+                    indices.append(j)
+                    data.append(value)
+            indptr.append(len(indices))
+        return cls._from_csr(rows, cols, indptr, indices, data)
+
+    @classmethod
+    def from_coo(cls, shape: Tuple[int, int], row_idx: Iterable[int], col_idx: Iterable[int],
+                 values: Iterable[Num]) -> 'SparseMatrix':
+        """Из трех параллельных последовательностей COO"""
+        return cls(shape, zip(row_idx, col_idx, values))
+
+    @classmethod
+    def from_dense(cls, m: Union[Matrix, MatrixData, FlatStorage]) -> 'SparseMatrix':
+        """Из плотной матрицы: Matrix, список списков или FlatStorage (нули пропускаются)"""
+        if isinstance(m, Matrix):
+            m = m._data
+        grid = m.iter_rows() if isinstance(m, FlatStorage) else m
+        rows = m.rows if isinstance(m, FlatStorage) else len(m)
+        cols = m.cols if isinstance(m, FlatStorage) else (len(m[0]) if m else 0)
+        indptr, indices, data = array('q', [0]), array('i'), array('d')
+        for row in grid:
+            if len(row) != cols:
+                raise ValueError("Матрица должна иметь строки одинаковой длины")
+            for j, value in enumerate(row):
+                if value:
+                    indices.append(j)
+                    data.append(value)
+            indptr.append(len(indices))
+        return cls._from_csr(rows, cols, indptr, indices, data)
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return self.rows, self.cols
+
+    @property
+    def nnz(self) -> int:
+        """Число хранимых ненулевых элементов"""
+        return len(self.data)
+
+    def density(self) -> float:
+        """Доля ненулевых элементов"""
+        total = self.rows * self.cols
+        return self.nnz / total if total else 0.0
+
+    def row_entries(self, i: int) -> Tuple[array, array]:
+        """(столбцы, значения) ненулей i-й строки"""
+        start, end = self.indptr[i], self.indptr[i + 1]
+        return self.indices[start:end], self.data[start:end]
+
+    def __getitem__(self, index: tuple[int, int]) -> float:
+        """Элемент m[i, j]: двоичный поиск в строке, O(log nnz строки)"""
+        i, j = index
+        if not (0 <= i < self.rows and 0 <= j < self.cols):
+            raise IndexError(f"Индекс {index} вне матрицы {self.shape}")
+        start, end = self.indptr[i], self.indptr[i + 1]
+        pos = bisect_left(self.indices, j, start, end)
+        if pos < end and self.indices[pos] == j:
+            return self.data[pos]
+        return 0.0
+
+    def __iter__(self) -> Iterator[Tuple[int, int, float]]:
+        """Тройки COO (строка, столбец, значение) по строкам"""
+        indptr, indices, data = self.indptr, self.indices, self.data
+        for i in range(self.rows):
+            for pos in range(indptr[i], indptr[i + 1]):
+                yield i, indices[pos], data[pos]
+
+    def to_coo(self) -> Tuple[List[int], List[int], List[float]]:
+        """Три параллельных списка COO"""
+        row_idx: List[int] = []
+        for i in range(self.rows):
+            row_idx.extend(repeat(i, self.indptr[i + 1] - self.indptr[i]))
+        return row_idx, self.indices.tolist(), self.data.tolist()
+
+    def to_csr(self) -> Compressed:
+        """Массивы CSR (без копирования - не изменять)"""
+        return self.indptr, self.indices, self.data
+
+    def to_csc(self) -> Compressed:
+        """Массивы CSC (столбцы сжаты): считаются один раз за O(nnz + cols)"""
+        if not self._csc:
+            self._csc = self.transpose().to_csr()
+        return self._csc
+
+    def to_list(self) -> MatrixData:
+        """Плотный список списков"""
+        result = [[0.0] * self.cols for _ in range(self.rows)]
+        for i, j, value in self:
+            result[i][j] = value
+        return result
+
+    def to_dense(self) -> Matrix:
+        """Плотная матрица Matrix"""
+        storage = FlatStorage.zeros(self.rows, self.cols)
+        data, cols = storage.data, self.cols
+        for i, j, value in self:
+            data[i * cols + j] = value
+        return Matrix._from_storage(storage)
+
+    def __repr__(self) -> str:
+        return f"SparseMatrix({self.rows}x{self.cols}, nnz={self.nnz})"
+
+    def __str__(self) -> str:
+        return '\n'.join([' '.join(f"{x:5.1f}" for x in row) for row in self.to_list()])
+
+    def transpose(self) -> 'SparseMatrix':
+        """Транспонирование подсчетом: O(nnz + cols), строки результата сразу упорядочены"""
+        rows, cols = self.rows, self.cols
+        indptr, indices, data = self.indptr, self.indices, self.data
+        counts = array('q', bytes(8 * (cols + 1)))
+        for j in indices:
+            counts[j + 1] += 1
+        for j in range(cols):
+            counts[j + 1] += counts[j]
+        t_indptr = array('q', counts)
+        t_indices = array('i', bytes(4 * len(indices)))
+        t_data = array('d', bytes(8 * len(data)))
+        # counts теперь - позиция записи для каждого столбца
+        for i in range(rows):
+            for pos in range(indptr[i], indptr[i + 1]):
+                j = indices[pos]
+                dest = counts[j]
+                t_indices[dest] = i
+                t_data[dest] = data[pos]
+                counts[j] = dest + 1
+        result = SparseMatrix._from_csr(cols, rows, t_indptr, t_indices, t_data)
+        # CSC транспонированной - это CSR исходной
+        result._csc = (indptr, indices, data)
+        return result
+
+    def __add__(self, other: Union['SparseMatrix', Matrix]) -> Union['SparseMatrix', Matrix]:
+        """Сложение. Разреженная + разреженная = разреженная (слияние строк), с Matrix - плотная"""
+        if not isinstance(other, (SparseMatrix, Matrix)):
+            return NotImplemented
+        if self.shape != other.shape:
+            raise ValueError(f"Размерности не совпадают: {self.shape} != {other.shape}")
+
+        if isinstance(other, Matrix):
+            result = other._data.copy()
+            data, cols = result.data, self.cols
+            for i, j, value in self:
+                data[i * cols + j] += value
+            return Matrix._from_storage(result)
+
+        def merged_rows() -> Iterator[Dict[int, float]]:
+            for i in range(self.rows):
+                acc = dict(zip(*self.row_entries(i)))
+                for j, value in zip(*other.row_entries(i)):
+                    acc[j] = acc.get(j, 0.0) + value
+                yield acc
+
+        return SparseMatrix._from_row_dicts(self.rows, self.cols, merged_rows())
+
+    __radd__ = __add__
+
+    def __mul__(self, other: Union['SparseMatrix', Matrix, MatrixData, Num]) \
+            -> Union['SparseMatrix', Matrix, MatrixData]:
+        """Умножение на число, на разреженную (результат разреженный) или плотную матрицу (плотный)"""
+        if isinstance(other, (int, float)):
+            if not other:
+                return SparseMatrix(self.shape)
+            data = array('d', map(operator.mul, self.data, repeat(other)))
+            return SparseMatrix._from_csr(self.rows, self.cols, array('q', self.indptr),
+                                          array('i', self.indices), data)
+
+        if isinstance(other, SparseMatrix):
+            self._check_mul(other.shape)
+            return self._mul_sparse(other)
+
+        if isinstance(other, (Matrix, list)):
+            dense = other._data if isinstance(other, Matrix) else FlatStorage.from_rows(other)
+            self._check_mul(dense.shape)
+            result = self._mul_dense(dense)
+            return Matrix._from_storage(FlatStorage.from_rows(result)) if isinstance(other, Matrix) else result
+
+        return NotImplemented
+
+    def __rmul__(self, other: Union[Matrix, MatrixData, Num]) -> Union['SparseMatrix', Matrix, MatrixData]:
+        """Число * разреженная и плотная * разреженная"""
+        if isinstance(other, (int, float)):
+            return self * other
+        if isinstance(other, (Matrix, list)):
+            dense = other._data if isinstance(other, Matrix) else FlatStorage.from_rows(other)
+            if dense.cols != self.rows:
+                raise ValueError(f"Нельзя умножить: столбцов в A ({dense.cols}) != строк в B ({self.rows})")
+            result = self._rmul_dense(dense)
+            return Matrix._from_storage(FlatStorage.from_rows(result)) if isinstance(other, Matrix) else result
+        return NotImplemented
+
+    def _check_mul(self, other_shape: Tuple[int, int]) -> None:
+        if self.cols != other_shape[0]:
+            raise ValueError(f"Нельзя умножить: столбцов в A ({self.cols}) != строк в B ({other_shape[0]})")
+
+    def _mul_sparse(self, other: 'SparseMatrix') -> 'SparseMatrix':
+        """Алгоритм Густавсона: строка результата копится в словаре, O(числа произведений ненулей)"""
+        b_rows = [(idx.tolist(), vals.tolist()) for idx, vals in map(other.row_entries, range(other.rows))]
+
+        def product_rows() -> Iterator[Dict[int, float]]:
+            for i in range(self.rows):
+                acc: Dict[int, float] = {}
+                get = acc.get
+                for k, a_val in zip(*self.row_entries(i)):
+                    b_idx, b_vals = b_rows[k]
+                    for j, b_val in zip(b_idx, b_vals):
+                        acc[j] = get(j, 0.0) + a_val * b_val
+                yield acc
+
+        return SparseMatrix._from_row_dicts(self.rows, other.cols, product_rows())
+
+    def _mul_dense(self, dense: FlatStorage) -> MatrixData:
+        """Разреженная * плотная: каждый ненуль A[i, k] добавляет строку B[k] с весом, O(nnz * cols B)"""
+        b_rows = [row.tolist() for row in dense.iter_rows()]
+        width = dense.cols
+        result: MatrixData = []
+        for i in range(self.rows):
+            out = [0.0] * width
+            for k, a_val in zip(*self.row_entries(i)):
+                out = [o + a_val * x for o, x in zip(out, b_rows[k])]
+            result.append(out)
+        return result
+
+    def _rmul_dense(self, dense: FlatStorage) -> MatrixData:
+        """Плотная * разреженная: строка A проходит по ненулям строк B, O(rows A * nnz)"""
+        b_rows = [(idx.tolist(), vals.tolist()) for idx, vals in map(self.row_entries, range(self.rows))]
+        result: MatrixData = []
+        for a_row in dense.iter_rows():
+            out = [0.0] * self.cols
+            for a_val, (b_idx, b_vals) in zip(a_row, b_rows):
+                if a_val:
+                    for j, b_val in zip(b_idx, b_vals):
+                        out[j] += a_val * b_val
+            result.append(out)
+        return result
+
+
+if __name__ == "__main__":
+    print("Тест разреженных матриц")
+    s1 = SparseMatrix((3, 3), [(0, 0, 1), (1, 2, 2), (2, 1, 3), (1, 2, 1)])
+    s2 = SparseMatrix.from_dense([[0, 0, 4], [5, 0, 0], [0, 0, 6]])
+    print(f"{s1!r}, CSR: {s1.to_csr()}")
+    print(f"Матрица 1:\n{s1}")
+    print(f"Сложение:\n{s1 + s2}")
+    print(f"Умножение разреженных:\n{s1 * s2}")
+    print(f"Транспонирование:\n{s1.transpose()}")
+    dense = Matrix([[1, 2], [3, 4], [5, 6]])
+    print(f"Разреженная * Matrix:\n{s1 * dense}")
+    print(f"Matrix * разреженная:\n{dense.transpose() * s1}")
+    print(f"Обратно в Matrix: {s1.to_dense().to_list()}")
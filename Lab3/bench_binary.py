@@ -0,0 +1,48 @@
+import random
+import sys
+import time
+from typing import Any, Callable, Tuple
+
+from Lab3 import oop_private, oop_public, functional_private, functional_public
+from Lab3.bench_traversal import random_graph
+
+# JSON против двоичного формата (binary_format) на связном случайном графе:
+# размер данных, время кодирования и декодирования для всех четырех сериализаторов.
+# Размеры - аргументы командной строки (по умолчанию 10^5; 10^6 - около минуты на формат и ~ГБ памяти).
+
+SERIALIZERS = (
+    ("SafeSerializer", oop_private.Person,
+     lambda root, fmt: oop_private.SafeSerializer(fmt).encode(root), oop_private.SafeSerializer().decode),
+    ("Intruder", oop_public.Person,
+     lambda root, fmt: oop_public.IntruderSerializer(fmt).encode(root), oop_public.IntruderSerializer().decode),
+    ("serialize_safe", functional_private.Person,
+     lambda root, fmt: functional_private.serialize_safe(root, fmt), functional_private.deserialize_safe),
+    ("serialize_broken", functional_public.Person,
+     lambda root, fmt: functional_public.serialize_broken(root, fmt), functional_public.deserialize_broken),
+)
+
+
+def timed(action: Callable[[], Any]) -> Tuple[Any, float]:
+    start = time.perf_counter()
+    result = action()
+    return result, time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    sizes = [int(float(arg)) for arg in sys.argv[1:]] or [10 ** 5]
+    print(f"{'сериализатор':<16} | {'n':>8} | {'формат':<6} | {'размер, МБ':>10} | {'байт/узел':>9} | "
+          f"{'кодир., с':>9} | {'декод., с':>9}")
+    for n in sizes:
+        for name, person_cls, encode, decode in SERIALIZERS:
+            people = random_graph(person_cls, n, random.Random(0))
+            root = people[0]
+            del people
+            sizes_by_format = {}
+            for fmt in ('json', 'binary'):
+                data, encode_s = timed(lambda: encode(root, fmt))
+                decoded, decode_s = timed(lambda: decode(data))
+                sizes_by_format[fmt] = len(data)
+                print(f"{name:<16} | {n:>8} | {fmt:<6} | {len(data) / 2 ** 20:10.2f} | {len(data) / n:9.1f} | "
+                      f"{encode_s:9.3f} | {decode_s:9.3f}")
+                del data, decoded
+            print(f"{'':<16} | {'':>8} | двоичный меньше в {sizes_by_format['json'] / sizes_by_format['binary']:.1f} раза")
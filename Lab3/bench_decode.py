@@ -0,0 +1,82 @@
+import argparse
+import datetime as dt
+import json
+import time
+from typing import Any, Callable, Dict, List
+
+from Lab3 import oop_private, functional_private
+from Lab3.bench_traversal import BIRTH, link
+
+# Декодирование звездных графов: несколько центров (связаны цепочкой), у каждого
+# k друзей-листьев. Прежние декодеры (поиск друга в списке на каждое ребро) против
+# массового add_friends с проверкой повторов по множеству.
+# Прежние - квадратичные по степени центра, поэтому запускаются только до --legacy-limit.
+
+
+def hubs_graph(person_cls: type, hubs: int, k: int) -> List[Any]:
+    centers = [person_cls(f"hub{h}", BIRTH) for h in range(hubs)]
+    for a, b in zip(centers, centers[1:]):
+        link(a, b)
+    for h, center in enumerate(centers):
+        for i in range(k):
+            link(center, person_cls(f"p{h}_{i}", BIRTH))
+    return centers
+
+
+def legacy_safe_decode(data: bytes) -> Any:
+    """SafeSerializer.decode до add_friends: список имен друзей на каждое ребро"""
+    nodes = json.loads(data.decode('utf-8'))["nodes"]
+    cache = {uid: oop_private.Person(p["n"], dt.datetime.fromisoformat(p["d"])) for uid, p in nodes.items()}
+    for uid, props in nodes.items():
+        person = cache[uid]
+        for friend_id in props["f"]:
+            friend = cache[friend_id]
+            if friend.name not in [f.name for f in person.friends]:
+                person.add_friend(friend)
+    return cache
+
+
+def legacy_deserialize_safe(data: bytes) -> Any:
+    """deserialize_safe до add_friends: копия friends и поиск в ней на каждое ребро"""
+    registry = json.loads(data.decode('utf-8'))["data"]
+    instances = {pid: functional_private.Person(i["name"], dt.datetime.fromisoformat(i["born_in"]))
+                 for pid, i in registry.items()}
+    for pid, info in registry.items():
+        curr = instances[pid]
+        for fid in info["friends_ids"]:
+            friend = instances[fid]
+            if friend not in curr.friends:
+                curr.add_friend(friend)
+    return instances
+
+
+CASES = (
+    ("SafeSerializer", oop_private.Person, lambda root: oop_private.SafeSerializer().encode(root),
+     legacy_safe_decode, oop_private.SafeSerializer().decode),
+    ("deserialize_safe", functional_private.Person, functional_private.serialize_safe,
+     legacy_deserialize_safe, functional_private.deserialize_safe),
+)
+
+
+def timed(action: Callable[[], Any]) -> float:
+    start = time.perf_counter()
+    action()
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Декодирование звездных графов: прежний способ против add_friends")
+    parser.add_argument('--friends', type=float, nargs='+', default=[1e3, 1e4, 1e5], help="друзей у каждого центра")
+    parser.add_argument('--hubs', type=int, default=3, help="число центров")
+    parser.add_argument('--legacy-limit', type=float, default=1e4, help="больше - прежние декодеры не запускаются")
+    args = parser.parse_args()
+
+    print(f"{'декодер':<16} | {'центров':>7} | {'друзей':>8} | {'прежний, с':>11} | {'add_friends, с':>14}")
+    for k in map(int, args.friends):
+        for name, person_cls, encode, legacy, current in CASES:
+            data = encode(hubs_graph(person_cls, args.hubs, k)[0])
+            timings: Dict[str, str] = {
+                'legacy': f"{timed(lambda: legacy(data)):11.3f}" if k <= args.legacy_limit else f"{'-':>11}",
+                'current': f"{timed(lambda: current(data)):14.3f}",
+            }
+            print(f"{name:<16} | {args.hubs:>7} | {k:>8} | {timings['legacy']} | {timings['current']}")
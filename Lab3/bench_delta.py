@@ -0,0 +1,72 @@
+import datetime as dt
+import random
+import sys
+import time
+from typing import Any, Callable, List, Tuple
+
+from Lab3.bench_traversal import random_graph
+from Lab3.delta import DeltaApplier, DeltaEncoder
+from Lab3.oop_private import Person, SafeSerializer
+
+# Полное кодирование против дельты при изменении 1% графа: после снимка
+# у n / 100 случайных людей меняется что-то одно - новый друг, имя, дата
+# или новый знакомый (новый человек в графе). Размеры - аргументы командной строки
+# (по умолчанию 10^5; 10^6 - около минуты и ~ГБ памяти).
+
+CHURN = 0.01
+
+
+def churn(people: List[Person], rng: random.Random) -> None:
+    for _ in range(max(1, int(len(people) * CHURN))):
+        person = rng.choice(people)
+        kind = rng.randrange(4)
+        if kind == 0:
+            person.add_friend(rng.choice(people))
+        elif kind == 1:
+            person.name = person.name + "*"
+        elif kind == 2:
+            person.born_in = person.born_in + dt.timedelta(days=1)
+        else:
+            newcomer = Person(f"new{len(people)}", person.born_in)
+            person.add_friend(newcomer)
+            people.append(newcomer)
+
+
+def timed(action: Callable[[], Any]) -> Tuple[Any, float]:
+    start = time.perf_counter()
+    result = action()
+    return result, time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    sizes = [int(float(arg)) for arg in sys.argv[1:]] or [10 ** 5]
+    print(f"{'n':>8} | {'кодирование':<22} | {'размер, КБ':>11} | {'время, с':>9} | {'применение, с':>13}")
+    for n in sizes:
+        rng = random.Random(0)
+        people = random_graph(Person, n, rng)
+        encoder, applier = DeltaEncoder(people[0]), DeltaApplier()
+        snapshot, _ = timed(encoder.full)
+        applier.apply(snapshot)
+
+        churn(people, rng)
+        rows = []
+        data, seconds = timed(lambda: SafeSerializer().encode(people[0]))
+        rows.append(("SafeSerializer.encode", len(data), seconds, None))
+        # Дельта - до полного снимка: full() снимает флаги
+        data, seconds = timed(encoder.delta)
+        _, applied = timed(lambda: applier.apply(data))
+        delta_row = ("DeltaEncoder.delta", len(data), seconds, applied)
+        # random_graph может связать пару дважды, а декодер повторы схлопывает - сравниваются множества
+        sent = {id(p): i for i, p in enumerate(encoder._nodes)}
+        received = {id(p): i for i, p in enumerate(applier.people)}
+        same = len(sent) == len(received) and all(
+            a.name == b.name and a.born_in == b.born_in
+            and {sent[id(f)] for f in a.friends} == {received[id(f)] for f in b.friends}
+            for a, b in zip(encoder._nodes, applier.people))
+        data, seconds = timed(encoder.full)
+        rows.append(("DeltaEncoder.full", len(data), seconds, None))
+        rows.append(delta_row)
+        for name, size, seconds, applied in rows:
+            applied_s = f"{applied:13.3f}" if applied is not None else f"{'-':>13}"
+            print(f"{n:>8} | {name:<22} | {size / 1024:11.1f} | {seconds:9.3f} | {applied_s}")
+        print(f"{'':>8} | граф получателя после дельты совпадает: {same}")
@@ -0,0 +1,109 @@
+import datetime as dt
+import gc
+import random
+import sys
+import time
+import tracemalloc
+from array import array
+from typing import Any, Callable, List, Tuple
+
+from Lab3 import oop_private
+from Lab3.graph import PersonGraph
+from Lab3.traversal import preorder
+
+# Память на узел и скорость обхода для трех представлений одного случайного графа:
+#   прежний Person (__dict__, friends копирует список), Person со слотами (friends - представление)
+#   и PersonGraph (индексная смежность array('i')).
+# Размеры - аргументы командной строки (по умолчанию 10^5; 10^6 - около ГБ памяти).
+
+BIRTH = dt.datetime(1970, 1, 1)
+
+
+class LegacyPerson:
+    """Person в прежнем виде: словарь атрибутов и копия списка друзей на каждое обращение"""
+
+    def __init__(self, name: str, born_in: dt.datetime) -> None:
+        self._name = name
+        self._born_in = born_in
+        self._friends: List['LegacyPerson'] = []
+
+    @property
+    def friends(self) -> List['LegacyPerson']:
+        return self._friends[:]
+
+
+def random_edges(n: int, rng: random.Random) -> List[Tuple[int, int]]:
+    """Как bench_traversal.random_graph: дерево плюс n случайных ребер (без петель и повторов)"""
+    edges = {(i, rng.randrange(i)) for i in range(1, n)}
+    for _ in range(n):
+        a, b = rng.randrange(n), rng.randrange(n)
+        if a != b and (b, a) not in edges:
+            edges.add((a, b))
+    return sorted(edges)
+
+
+def build_objects(person_cls: type, n: int, edges: List[Tuple[int, int]]) -> List[Any]:
+    people = [person_cls(f"p{i}", BIRTH + dt.timedelta(seconds=i)) for i in range(n)]
+    for a, b in edges:
+        people[a]._friends.append(people[b])
+        people[b]._friends.append(people[a])
+    return people
+
+
+def build_graph(n: int, edges: List[Tuple[int, int]]) -> PersonGraph:
+    """CSR напрямую из списка ребер (подсчет степеней, затем раскладка)"""
+    indptr = [0] * (n + 1)
+    for a, b in edges:
+        indptr[a + 1] += 1
+        indptr[b + 1] += 1
+    for i in range(n):
+        indptr[i + 1] += indptr[i]
+    fill, indices = indptr[:-1], array('i', bytes(4 * indptr[-1]))
+    for a, b in edges:
+        indices[fill[a]] = b
+        fill[a] += 1
+        indices[fill[b]] = a
+        fill[b] += 1
+    del fill
+    return PersonGraph.from_csr([f"p{i}" for i in range(n)],
+                                [BIRTH + dt.timedelta(seconds=i) for i in range(n)], indptr, indices)
+
+
+def measured(build: Callable[[], Any]) -> Tuple[Any, int]:
+    """(построенный граф, занятая им память в байтах по tracemalloc)"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = build()
+        size = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return result, size
+
+
+def timed(action: Callable[[], Any]) -> float:
+    start = time.perf_counter()
+    action()
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    sizes = [int(float(arg)) for arg in sys.argv[1:]] or [10 ** 5]
+    print(f"{'представление':<22} | {'n':>8} | {'байт/узел':>9} | {'обход, с':>9} | {'friends у всех, с':>17}")
+    for n in sizes:
+        edges = random_edges(n, random.Random(0))
+        cases = (
+            ("Person (__dict__)", lambda: build_objects(LegacyPerson, n, edges)),
+            ("Person (__slots__)", lambda: build_objects(oop_private.Person, n, edges)),
+            ("PersonGraph", lambda: build_graph(n, edges)),
+        )
+        for name, build in cases:
+            built, size = measured(build)
+            people = list(built)
+            walk = timed(lambda: sum(1 for _ in preorder(people[0], lambda p: p.friends)))
+            access = timed(lambda: sum(len(p.friends) for p in people))
+            print(f"{name:<22} | {n:>8} | {size / n:9.1f} | {walk:9.3f} | {access:17.3f}")
+            if isinstance(built, PersonGraph):
+                walk = timed(lambda: sum(1 for _ in built.preorder()))
+                print(f"{'PersonGraph.preorder':<22} | {n:>8} | {'':>9} | {walk:9.3f} |")
+            del built, people
@@ -0,0 +1,86 @@
+import gc
+import os
+import random
+import sys
+import tempfile
+import tracemalloc
+from typing import Any, Callable, Tuple
+
+from Lab3 import oop_private, oop_public, functional_private, functional_public
+from Lab3.bench_traversal import random_graph
+
+# Пиковая память (tracemalloc) при записи графа в файл и чтении из файла:
+# обычный encode/decode (весь реестр, строка JSON и байты в памяти) против потокового.
+# Граф для кодирования построен заранее и в пик не входит; при декодировании
+# отдельно показан размер самого восстановленного графа - ниже него пик не опустится.
+# Размеры - аргументы командной строки (по умолчанию 10^5; tracemalloc замедляет работу в разы).
+
+SERIALIZERS = (
+    ("SafeSerializer", oop_private.Person,
+     oop_private.SafeSerializer().encode, oop_private.SafeSerializer().decode,
+     oop_private.SafeSerializer().encode_stream, oop_private.SafeSerializer().decode_stream),
+    ("Intruder", oop_public.Person,
+     oop_public.IntruderSerializer().encode, oop_public.IntruderSerializer().decode,
+     oop_public.IntruderSerializer().encode_stream, oop_public.IntruderSerializer().decode_stream),
+    ("serialize_safe", functional_private.Person,
+     functional_private.serialize_safe, functional_private.deserialize_safe,
+     functional_private.serialize_safe_stream, functional_private.deserialize_safe_stream),
+    ("serialize_broken", functional_public.Person,
+     functional_public.serialize_broken, functional_public.deserialize_broken,
+     functional_public.serialize_broken_stream, functional_public.deserialize_broken_stream),
+)
+
+
+def peak(action: Callable[[], Any]) -> Tuple[Any, int, int]:
+    """(результат, пик памяти за время action, память, оставшаяся занятой результатом) в байтах"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = action()
+        current, top = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, top, current
+
+
+def mb(size: int) -> str:
+    return f"{size / 2 ** 20:9.1f}"
+
+
+if __name__ == "__main__":
+    sizes = [int(float(arg)) for arg in sys.argv[1:]] or [10 ** 5]
+    print(f"{'сериализатор':<16} | {'n':>8} | {'NDJSON':>9} | {'encode':>9} | {'поток':>9} | "
+          f"{'decode':>9} | {'поток':>9} | {'граф':>9}   (МБ)")
+    with tempfile.TemporaryDirectory() as tmp:
+        plain_path, stream_path = os.path.join(tmp, 'graph.json'), os.path.join(tmp, 'graph.ndjson')
+        for n in sizes:
+            for name, person_cls, encode, decode, encode_stream, decode_stream in SERIALIZERS:
+                people = random_graph(person_cls, n, random.Random(0))
+                root = people[0]
+                del people
+
+                def write_plain() -> None:
+                    with open(plain_path, 'wb') as f:
+                        f.write(encode(root))
+
+                def write_stream() -> None:
+                    with open(stream_path, 'wb') as f:
+                        encode_stream(root, f)
+
+                def read_plain() -> Any:
+                    with open(plain_path, 'rb') as f:
+                        return decode(f.read())
+
+                def read_stream() -> Any:
+                    with open(stream_path, 'rb') as f:
+                        return decode_stream(f)
+
+                _, encode_peak, _ = peak(write_plain)
+                _, stream_encode_peak, _ = peak(write_stream)
+                del root
+                decoded, decode_peak, _ = peak(read_plain)
+                del decoded
+                decoded, stream_decode_peak, graph_size = peak(read_stream)
+                del decoded
+                print(f"{name:<16} | {n:>8} | {mb(os.path.getsize(stream_path))} | {mb(encode_peak)} | "
+                      f"{mb(stream_encode_peak)} | {mb(decode_peak)} | {mb(stream_decode_peak)} | {mb(graph_size)}")
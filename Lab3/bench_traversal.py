@@ -0,0 +1,100 @@
+import datetime as dt
+import random
+import sys
+import time
+from typing import Callable, Any, List, Iterable
+
+from Lab3 import oop_private, oop_public, functional_private, functional_public
+from Lab3.traversal import preorder
+
+# Обход графа друзей: прежний рекурсивный против явного стека (traversal.preorder),
+# и полное кодирование всеми четырьмя сериализаторами на цепочке, звезде и случайном графе.
+# Размеры - аргументы командной строки (по умолчанию 10^4 и 10^5; 10^6 - дольше и ~ГБ памяти).
+
+BIRTH = dt.datetime(2000, 1, 1)
+
+
+def link(a: Any, b: Any) -> None:
+    """Двусторонняя связь без проверки повторов: add_friend в ООП-версиях ищет
+    друга в списке за O(deg), и звезда на 10^5 друзей строилась бы минутами"""
+    a._friends.append(b)
+    b._friends.append(a)
+
+
+def chain(person_cls: type, n: int, rng: random.Random) -> List[Any]:
+    people = [person_cls(f"p{i}", BIRTH) for i in range(n)]
+    for a, b in zip(people, people[1:]):
+        link(a, b)
+    return people
+
+
+def star(person_cls: type, n: int, rng: random.Random) -> List[Any]:
+    people = [person_cls(f"p{i}", BIRTH) for i in range(n)]
+    for leaf in people[1:]:
+        link(people[0], leaf)
+    return people
+
+
+def random_graph(person_cls: type, n: int, rng: random.Random) -> List[Any]:
+    """Связный случайный граф: дерево (каждый узел к случайному предыдущему) плюс n случайных ребер"""
+    people = [person_cls(f"p{i}", BIRTH) for i in range(n)]
+    for i in range(1, n):
+        link(people[i], people[rng.randrange(i)])
+    for _ in range(n):
+        a, b = rng.randrange(n), rng.randrange(n)
+        if a != b:
+            link(people[a], people[b])
+    return people
+
+
+def recursive_preorder(root: Any, neighbours: Callable[[Any], Iterable[Any]]) -> List[Any]:
+    """Прежний способ: рекурсивный visit, как был в сериализаторах"""
+    seen, order = set(), []
+
+    def visit(p: Any) -> None:
+        if id(p) in seen:
+            return
+        seen.add(id(p))
+        order.append(p)
+        for friend in neighbours(p):
+            visit(friend)
+
+    visit(root)
+    return order
+
+
+def timed(action: Callable[[], Any]) -> str:
+    start = time.perf_counter()
+    try:
+        action()
+    except RecursionError:
+        return f"{'RecursionError':>14}"
+    return f"{time.perf_counter() - start:14.3f}"
+
+
+ENCODERS = (
+    ("SafeSerializer", oop_private.Person, lambda root: oop_private.SafeSerializer().encode(root)),
+    ("Intruder", oop_public.Person, lambda root: oop_public.IntruderSerializer().encode(root)),
+    ("serialize_safe", functional_private.Person, functional_private.serialize_safe),
+    ("serialize_broken", functional_public.Person, functional_public.serialize_broken),
+)
+
+
+if __name__ == "__main__":
+    sizes = [int(float(arg)) for arg in sys.argv[1:]] or [10 ** 4, 10 ** 5]
+    rng = random.Random(0)
+    print(f"{'граф':<9} | {'n':>8} | {'рекурсия':>14} | {'явный стек':>14}"
+          + "".join(f" | {name:>16}" for name, _, _ in ENCODERS) + "   (секунды)")
+    for n in sizes:
+        for label, build in (("цепочка", chain), ("звезда", star), ("случайный", random_graph)):
+            people = build(functional_public.Person, n, rng)
+            root = people[0]
+            friends = lambda p: p._friends
+            row = f"{label:<9} | {n:>8} | {timed(lambda: recursive_preorder(root, friends))} | " \
+                  f"{timed(lambda: sum(1 for _ in preorder(root, friends)))}"
+            del people, root
+            for _, person_cls, encode in ENCODERS:
+                graph = build(person_cls, n, rng)
+                row += f" | {timed(lambda: encode(graph[0])):>16}"
+                del graph
+            print(row)
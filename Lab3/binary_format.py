@@ -0,0 +1,148 @@
+import datetime as dt
+import struct
+import sys
+from array import array
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple
+
+from Lab3.traversal import preorder
+
+# Двоичный формат графа Person (little-endian):
+#   заголовок: магия b'LGRF', версия (u8), флаги (u8), резерв (u16),
+#              число узлов, число строк, число элементов списков смежности (u32);
+#   таблица строк: длины (u32 на строку), затем все строки в UTF-8 подряд;
+#   узлы: номер имени в таблице строк (i32), дата рождения (i64, микросекунды от 1970-01-01);
+#   ребра (CSR): начало списка друзей каждого узла (u32, узлов + 1), номера друзей (i32).
+# Номера узлов выдаются при обходе в глубину, корень всегда 0.
+MAGIC = b'LGRF'
+VERSION = 1
+_HEADER = struct.Struct('<4sBBHIII')
+# Флаг: даты с часовым поясом, сохранены в UTC
+FLAG_UTC = 1
+
+EPOCH = dt.datetime(1970, 1, 1)
+EPOCH_UTC = dt.datetime(1970, 1, 1, tzinfo=dt.timezone.utc)
+_MICROSECOND = dt.timedelta(microseconds=1)
+_MAX_U32 = 2 ** 32 - 1
+
+# Форматы, которые понимают сериализаторы Lab3 (decode определяет формат сам)
+FORMATS = ('json', 'binary')
+
+
+class GraphData(NamedTuple):
+    """Раскодированный граф: узел i - имя names[i], дата born[i],
+    друзья - indices[indptr[i]:indptr[i + 1]]. Корень - узел 0"""
+    names: List[str]
+    born: List[dt.datetime]
+    indptr: array
+    indices: array
+
+    def friends_of(self, i: int) -> array:
+        return self.indices[self.indptr[i]:self.indptr[i + 1]]
+
+
+def check_format(name: str) -> str:
+    if name not in FORMATS:
+        raise ValueError(f"Неизвестный формат {name!r}, есть: {list(FORMATS)}")
+    return name
+
+
+def is_binary(data: bytes) -> bool:
+    """Двоичный ли это граф (по магии), иначе - JSON"""
+    return data[:4] == MAGIC
+
+
+def _little_endian(values: array) -> bytes:
+    if sys.byteorder == 'big':
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _read(typecode: str, data: memoryview, offset: int, count: int) -> array:
+    values = array(typecode)
+    values.frombytes(data[offset:offset + count * values.itemsize])
+    if sys.byteorder == 'big':
+        values.byteswap()
+    return values
+
+
+def encode(root: Any, name_of: Callable[[Any], str], born_of: Callable[[Any], dt.datetime],
+           friends_of: Callable[[Any], Iterable[Any]]) -> bytes:
+    """Кодирует граф, достижимый из root. Доступ к полям - через переданные функции,
+    поэтому формат общий для сериализаторов с публичным и приватным доступом"""
+    nodes = list(preorder(root, friends_of))
+    index: Dict[int, int] = {id(p): i for i, p in enumerate(nodes)}
+
+    strings: Dict[str, int] = {}
+    name_idx = array('i', [strings.setdefault(name_of(p), len(strings)) for p in nodes])
+
+    dates = [born_of(p) for p in nodes]
+    aware = [d.tzinfo is not None for d in dates]
+    if any(aware) and not all(aware):
+        raise ValueError("Даты с часовым поясом и без него в одном графе не поддерживаются")
+    utc = bool(dates) and aware[0]
+    epoch = EPOCH_UTC if utc else EPOCH
+    born = array('q', [(d - epoch) // _MICROSECOND for d in dates])
+
+    indptr, indices = array('I', [0]), array('i')
+    for p in nodes:
+        indices.extend([index[id(f)] for f in friends_of(p)])
+        indptr.append(len(indices))
+    if len(indices) > _MAX_U32:
+        raise ValueError("Слишком много ребер для формата (больше 2^32)")
+
+    encoded = [s.encode('utf-8') for s in strings]
+    lengths = array('I', map(len, encoded))
+    header = _HEADER.pack(MAGIC, VERSION, FLAG_UTC if utc else 0, 0, len(nodes), len(encoded), len(indices))
+    return b''.join([header, _little_endian(lengths), *encoded, _little_endian(name_idx),
+                     _little_endian(born), _little_endian(indptr), _little_endian(indices)])
+
+
+def decode(data: bytes) -> GraphData:
+    """Разбирает двоичный граф в массивы (объекты Person строит сериализатор)"""
+    if len(data) < _HEADER.size:
+        raise ValueError("Данные короче заголовка")
+    magic, version, flags, _, nodes, strings, edges = _HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"Не двоичный граф (магия {magic!r}, версия {version})")
+    view = memoryview(data)
+    offset = _HEADER.size
+
+    lengths = _read('I', view, offset, strings)
+    offset += 4 * strings
+    table = []
+    for length in lengths:
+        table.append(str(view[offset:offset + length], 'utf-8'))
+        offset += length
+
+    name_idx = _read('i', view, offset, nodes)
+    offset += 4 * nodes
+    born = _read('q', view, offset, nodes)
+    offset += 8 * nodes
+    indptr = _read('I', view, offset, nodes + 1)
+    offset += 4 * (nodes + 1)
+    indices = _read('i', view, offset, edges)
+    if offset + 4 * edges != len(data):
+        raise ValueError("Размер данных не совпадает с заголовком")
+
+    epoch = EPOCH_UTC if flags & FLAG_UTC else EPOCH
+    return GraphData([table[i] for i in name_idx], [epoch + us * _MICROSECOND for us in born],
+                     indptr, indices)
+
+
+if __name__ == "__main__":
+    class Node:
+        def __init__(self, name: str, born: dt.datetime) -> None:
+            self.name, self.born, self.friends = name, born, []
+
+    a = Node("Ruslan", dt.datetime(2000, 1, 1, 12, 30, 0, 250))
+    b = Node("Ivan", dt.datetime(2002, 5, 5))
+    c = Node("Ivan", dt.datetime(1999, 9, 9))
+    for x, y in ((a, b), (b, c), (a, c)):
+        x.friends.append(y)
+        y.friends.append(x)
+    blob = encode(a, lambda p: p.name, lambda p: p.born, lambda p: p.friends)
+    print(f"{len(blob)} байт (заголовок {_HEADER.size}), двоичный: {is_binary(blob)}")
+    g = decode(blob)
+    print(f"Имена: {g.names}, даты: {[d.isoformat() for d in g.born]}")
+    print(f"CSR: indptr={g.indptr.tolist()}, indices={g.indices.tolist()}")
@@ -0,0 +1,143 @@
+import datetime as dt
+import json
+from array import array
+from typing import Dict, List, Optional
+
+from Lab3.oop_private import Person
+from Lab3.traversal import preorder
+
+# Полный снимок и изменения (дельты) графа Person из oop_private, JSON:
+#   снимок: {"version": v, "nodes": [{"n": имя, "d": дата, "f": [номера друзей]}, ...]},
+#           номер узла - позиция в списке, корень - 0;
+#   дельта: {"base": v - 1, "version": v, "nodes": {"номер": {"n", "d", "f": [новые друзья]}}}.
+# В дельту попадают только измененные люди (флаг dirty) и новые. Друзья только
+# добавляются, поэтому новые связи узла - хвост его списка после прошлого снимка.
+# Каждая связь пишется один раз - у конца с меньшим номером.
+
+
+class DeltaEncoder:
+    """Сторона отправителя: помнит нумерацию и длины списков друзей на момент
+    последнего снимка и кодирует только то, что изменилось с тех пор.
+
+    Держит ссылки на всех людей графа: номера привязаны к объектам.
+    """
+
+    def __init__(self, root: Person) -> None:
+        self.root = root
+        self.version = 0
+        self._nodes: List[Person] = []
+        self._index: Dict[int, int] = {}
+        # Сколько друзей было у узла в последнем снимке
+        self._degrees = array('q')
+
+    def full(self) -> bytes:
+        """Полный снимок; нумерация начинается заново, все флаги снимаются"""
+        self._nodes = list(preorder(self.root, lambda p: p.friends))
+        self._index = {id(p): i for i, p in enumerate(self._nodes)}
+        self._degrees = array('q', [len(p.friends) for p in self._nodes])
+        self.version += 1
+        nodes = [{"n": p.name, "d": p.born_in.isoformat(),
+                  "f": [self._index[id(f)] for f in p.friends]} for p in self._nodes]
+        for p in self._nodes:
+            p.mark_clean()
+        return json.dumps({"version": self.version, "nodes": nodes}).encode('utf-8')
+
+    def delta(self) -> bytes:
+        """Изменения с прошлого снимка или дельты. Измененные узлы ищутся по флагам
+        за O(V) без сериализации, кодируются только они - O(изменений)"""
+        if not self._nodes:
+            raise ValueError("Сначала нужен полный снимок (full)")
+        changed = [i for i, p in enumerate(self._nodes) if p.dirty]
+        records = {}
+        # Новые люди достижимы только через новые связи измененных - добавляются в конец очереди
+        position = 0
+        while position < len(changed):
+            i = changed[position]
+            position += 1
+            person = self._nodes[i]
+            new_friends = person.friends[self._degrees[i]:]
+            links, loops = [], 0
+            for friend in new_friends:
+                j = self._index.get(id(friend))
+                if j is None:
+                    j = self._index[id(friend)] = len(self._nodes)
+                    self._nodes.append(friend)
+                    self._degrees.append(0)
+                    changed.append(j)
+                if j > i:
+                    links.append(j)
+                elif j == i:
+                    # Петля записана в списке дважды - связь одна
+                    loops += 1
+                    if loops % 2:
+                        links.append(j)
+            records[str(i)] = {"n": person.name, "d": person.born_in.isoformat(), "f": links}
+        for i in changed:
+            self._degrees[i] = len(self._nodes[i].friends)
+            self._nodes[i].mark_clean()
+        self.version += 1
+        return json.dumps({"base": self.version - 1, "version": self.version, "nodes": records}).encode('utf-8')
+
+
+class DeltaApplier:
+    """Сторона получателя: собирает граф из снимка и правит его на месте по дельтам.
+    Люди создаются конструктором, связи и поля меняются через публичный интерфейс"""
+
+    def __init__(self) -> None:
+        self.version: Optional[int] = None
+        self.people: List[Person] = []
+
+    @property
+    def root(self) -> Person:
+        return self.people[0]
+
+    def apply(self, data: bytes) -> Person:
+        """Применяет снимок или дельту; возвращает корень"""
+        raw = json.loads(data.decode('utf-8'))
+        if "base" not in raw:
+            nodes = raw["nodes"]
+            self.people = [Person(node["n"], dt.datetime.fromisoformat(node["d"])) for node in nodes]
+            for person, node in zip(self.people, nodes):
+                person.add_friends([self.people[j] for j in node["f"]])
+        else:
+            if raw["base"] != self.version:
+                raise ValueError(f"Дельта к версии {raw['base']}, а у графа версия {self.version}")
+            records = {int(i): node for i, node in raw["nodes"].items()}
+            # 1. Новые люди (номера сразу за уже известными)
+            for i in range(len(self.people), len(self.people) + sum(i >= len(self.people) for i in records)):
+                node = records[i]
+                self.people.append(Person(node["n"], dt.datetime.fromisoformat(node["d"])))
+            # 2. Поля и новые связи
+            for i, node in records.items():
+                person = self.people[i]
+                if person.name != node["n"]:
+                    person.name = node["n"]
+                born = dt.datetime.fromisoformat(node["d"])
+                if person.born_in != born:
+                    person.born_in = born
+                if node["f"]:
+                    person.add_friends([self.people[j] for j in node["f"]])
+        for person in self.people:
+            person.mark_clean()
+        self.version = raw["version"]
+        return self.root
+
+
+if __name__ == "__main__":
+    ruslan = Person("Ruslan", dt.datetime(2000, 1, 1))
+    ivan = Person("Ivan", dt.datetime(2002, 5, 5))
+    ruslan.add_friend(ivan)
+
+    encoder, applier = DeltaEncoder(ruslan), DeltaApplier()
+    snapshot = encoder.full()
+    copy = applier.apply(snapshot)
+    print(f"Снимок: {len(snapshot)} байт, друзья {copy.name}: {[f.name for f in copy.friends]}")
+
+    anna = Person("Anna", dt.datetime(2001, 3, 3))
+    ivan.add_friend(anna)
+    ruslan.name = "Ruslan M."
+    change = encoder.delta()
+    print(f"Дельта: {change.decode('utf-8')}")
+    applier.apply(change)
+    print(f"После дельты: {copy.name}, друзья Ivan: {[f.name for f in copy.friends[0].friends]}")
+    print(f"Пустая дельта: {encoder.delta().decode('utf-8')}")
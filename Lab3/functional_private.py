@@ -1,9 +1,15 @@
 import json
 import datetime as dt
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable, BinaryIO
+
+from Lab3 import binary_format, streaming
+from Lab3.graph import FriendsView
+from Lab3.traversal import preorder
 
 
 class Person:
+    __slots__ = ('_name', '_born_in', '_friends')
+
     def __init__(self, name: str, born_in: dt.datetime) -> None:
         self._name = name
         self._born_in = born_in
@@ -13,6 +19,16 @@ class Person:
         self._friends.append(friend)
         friend._friends.append(self)
 
+    def add_friends(self, friends: Iterable['Person']) -> None:
+        """Массовое двустороннее добавление; уже добавленные друзья пропускаются
+        (проверка по множеству - O(deg + len(friends)) на вызов)"""
+        known = {id(f) for f in self._friends}
+        for friend in friends:
+            if id(friend) not in known:
+                known.add(id(friend))
+                self._friends.append(friend)
+                friend._friends.append(self)
+
     # Геттеры для функционального подхода
     @property
     def name(self) -> str: return self._name
@@ -21,32 +37,31 @@ class Person:
     def born_in(self) -> dt.datetime: return self._born_in
 
     @property
-    def friends(self) -> List['Person']: return self._friends[:]
+    def friends(self) -> FriendsView: return FriendsView(self._friends)
 
 
-def serialize_safe(obj: Person) -> bytes:
-    """Функция сериализации (Safe Mode)"""
+def serialize_safe(obj: Person, format: str = 'json') -> bytes:
+    """Функция сериализации (Safe Mode). format - 'json' или 'binary'"""
+    if binary_format.check_format(format) == 'binary':
+        return binary_format.encode(obj, lambda p: p.name, lambda p: p.born_in, lambda p: p.friends)
     registry = {}
 
-    def visit(p: Person):
-        p_id = str(id(p))
-        if p_id in registry: return
-
+    # Обход явным стеком вместо рекурсивной visit: глубина графа не ограничена
+    for p in preorder(obj, lambda person: person.friends):
         # Только публичные поля
-        registry[p_id] = {
+        registry[str(id(p))] = {
             "name": p.name,
             "born_in": p.born_in.isoformat(),
             "friends_ids": [str(id(f)) for f in p.friends]
         }
-        for friend in p.friends:
-            visit(friend)
 
-    visit(obj)
     return json.dumps({"root": str(id(obj)), "data": registry}, indent=2).encode('utf-8')
 
 
 def deserialize_safe(data: bytes) -> Person:
-    """Функция десериализации (Safe Mode)"""
+    """Функция десериализации (Safe Mode); формат определяется по данным"""
+    if binary_format.is_binary(data):
+        return _deserialize_safe_binary(data)
     payload = json.loads(data.decode('utf-8'))
     registry = payload["data"]
     instances = {}
@@ -56,21 +71,44 @@ def deserialize_safe(data: bytes) -> Person:
         born = dt.datetime.fromisoformat(info["born_in"])
         instances[pid] = Person(info["name"], born)
 
-    # 2. Связывание
+    # 2. Связывание одним вызовом на узел; add_friends избегает дублирования
     for pid, info in registry.items():
-        curr = instances[pid]
-        for fid in info["friends_ids"]:
-            friend = instances[fid]
-            # Избегаем дублирования
-            if friend not in curr.friends:
-                curr.add_friend(friend)
+        instances[pid].add_friends([instances[fid] for fid in info["friends_ids"]])
 
     return instances[payload["root"]]
 
 
+def _deserialize_safe_binary(data: bytes) -> Person:
+    graph = binary_format.decode(data)
+    people = [Person(name, born) for name, born in zip(graph.names, graph.born)]
+    for i, person in enumerate(people):
+        person.add_friends([people[j] for j in graph.friends_of(i)])
+    return people[0]
+
+
+def serialize_safe_stream(obj: Person, stream: BinaryIO) -> int:
+    """Потоковая сериализация (Safe Mode): узлы пишутся в stream по мере обхода"""
+    return streaming.write_graph(obj, stream, lambda p: p.name, lambda p: p.born_in, lambda p: p.friends)
+
+
+def deserialize_safe_stream(source: streaming.Source) -> Person:
+    """Потоковая десериализация (Safe Mode): файл или куски байт; связь - когда пришли оба конца"""
+    instances: Dict[int, Person] = {}
+    for record in streaming.read_graph(source):
+        curr = instances[record.index] = Person(record.name, record.born)
+        curr.add_friends([instances[j] for j in record.friends if j in instances])
+    return instances[0]
+
+
 if __name__ == "__main__":
     print("Соблюдение инкапсуляции")
     p1 = Person("FuncUser", dt.datetime(2005, 5, 5))
     encoded = serialize_safe(p1)
     decoded = deserialize_safe(encoded)
     print(f"Результат: {decoded.name}")
+    print(f"Двоичный формат: {deserialize_safe(serialize_safe(p1, format='binary')).name}")
+
+    import io
+    stream = io.BytesIO()
+    serialize_safe_stream(p1, stream)
+    print(f"Из потока: {deserialize_safe_stream([stream.getvalue()]).name}")
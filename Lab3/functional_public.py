@@ -1,9 +1,13 @@
 import json
 import datetime as dt
-from typing import List, Dict
+from typing import List, Dict, BinaryIO
+
+from Lab3 import binary_format, streaming
+from Lab3.traversal import preorder
 
 
 class Person:
+    # Без __slots__: serialize_broken снимает состояние через __dict__
     def __init__(self, name: str, born_in: dt.datetime) -> None:
         self._name = name
         self._born_in = born_in
@@ -14,31 +18,33 @@ class Person:
         friend._friends.append(self)
 
 
-def serialize_broken(obj: Person) -> bytes:
-    """Сериализация через интроспекцию __dict__ (Unsafe)"""
-    registry = {}
+def serialize_broken(obj: Person, format: str = 'json') -> bytes:
+    """Сериализация через интроспекцию __dict__ (Unsafe).
 
-    def visit(p: Person):
-        p_id = str(id(p))
-        if p_id in registry: return
+    format='binary' - двоичный формат с фиксированным набором полей
+    (_name, _born_in, _friends); прочие атрибуты из __dict__ в нем не сохраняются.
+    """
+    if binary_format.check_format(format) == 'binary':
+        return binary_format.encode(obj, lambda p: p._name, lambda p: p._born_in, lambda p: p._friends)
+    registry = {}
 
+    # Обход явным стеком вместо рекурсивной visit: глубина графа не ограничена
+    for p in preorder(obj, lambda person: person._friends):
         state = p.__dict__.copy()
 
         # Адаптируем данные для JSON
         state['_born_in'] = state['_born_in'].isoformat()
         state['_friends'] = [str(id(f)) for f in state['_friends']]
 
-        registry[p_id] = state
-
-        for friend in p._friends:
-            visit(friend)
+        registry[str(id(p))] = state
 
-    visit(obj)
     return json.dumps({"root": str(id(obj)), "data": registry}, indent=2).encode('utf-8')
 
 
 def deserialize_broken(data: bytes) -> Person:
-    """Десериализация в обход конструктора"""
+    """Десериализация в обход конструктора; формат определяется по данным"""
+    if binary_format.is_binary(data):
+        return _deserialize_broken_binary(data)
     payload = json.loads(data.decode('utf-8'))
     registry = payload["data"]
     instances = {}
@@ -58,6 +64,40 @@ def deserialize_broken(data: bytes) -> Person:
     return instances[payload["root"]]
 
 
+def _deserialize_broken_binary(data: bytes) -> Person:
+    graph = binary_format.decode(data)
+    instances = [object.__new__(Person) for _ in graph.names]
+    for i, obj in enumerate(instances):
+        obj._name = graph.names[i]
+        obj._born_in = graph.born[i]
+        obj._friends = [instances[j] for j in graph.friends_of(i)]
+    return instances[0]
+
+
+def serialize_broken_stream(obj: Person, stream: BinaryIO) -> int:
+    """Потоковая сериализация (Unsafe): поля _name, _born_in, _friends, узлы - по мере обхода"""
+    return streaming.write_graph(obj, stream, lambda p: p._name, lambda p: p._born_in, lambda p: p._friends)
+
+
+def deserialize_broken_stream(source: streaming.Source) -> Person:
+    """Потоковая десериализация в обход конструктора: объекты под еще не пришедших
+    друзей выделяются заранее, данные впрыскиваются, когда придет их строка"""
+    instances: Dict[int, Person] = {}
+
+    def allocate(index: int) -> Person:
+        obj = instances.get(index)
+        if obj is None:
+            obj = instances[index] = object.__new__(Person)
+        return obj
+
+    for record in streaming.read_graph(source):
+        obj = allocate(record.index)
+        obj._name = record.name
+        obj._born_in = record.born
+        obj._friends = [allocate(j) for j in record.friends]
+    return instances[0]
+
+
 if __name__ == "__main__":
     print("Нарушение инкапсуляции")
     p1 = Person("FuncHacker", dt.datetime(2010, 10, 10))
@@ -70,3 +110,10 @@ if __name__ == "__main__":
     # Доказываем, что данные на месте
     print(f"Имя: {decoded._name}")  # Прямой доступ
     print(f"Друг: {decoded._friends[0]._name}")
+    binary = serialize_broken(p1, format='binary')
+    print(f"Двоичный формат: {len(binary)} байт против {len(encoded)}")
+
+    import io
+    stream = io.BytesIO()
+    serialize_broken_stream(p1, stream)
+    print(f"Поток:\n{stream.getvalue().decode('utf-8')}", end='')
@@ -0,0 +1,295 @@
+import datetime as dt
+from array import array
+from collections.abc import Sequence
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+from Lab3.traversal import preorder
+
+
+class BaseFriendsView(Sequence):
+    """Общая часть представлений списка друзей: ведут себя как список только для чтения.
+
+    Сравнение поэлементное с любой последовательностью (view == [b] работает, как
+    раньше со списком), view + [...] и [...] + view дают новый список.
+    Представление живое: после add_friend в нем сразу виден новый друг, в том числе
+    во время обхода. Если в цикле по friends добавляются друзья, обходить нужно
+    копию: for f in list(p.friends).
+    """
+
+    __slots__ = ()
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, Sequence) or isinstance(other, (str, bytes)):
+            return NotImplemented
+        return len(self) == len(other) and all(a is b or a == b for a, b in zip(self, other))
+
+    __hash__ = None
+
+    def __add__(self, other: Any) -> list:
+        if not isinstance(other, Sequence) or isinstance(other, (str, bytes)):
+            return NotImplemented
+        return list(self) + list(other)
+
+    def __radd__(self, other: Any) -> list:
+        if not isinstance(other, Sequence) or isinstance(other, (str, bytes)):
+            return NotImplemented
+        return list(other) + list(self)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self)!r})"
+
+
+class FriendsView(BaseFriendsView):
+    """Список друзей только для чтения и без копирования (поверх списка объекта).
+    Нужна независимая копия - list(view)"""
+
+    __slots__ = ('_items',)
+
+    def __init__(self, items: Sequence) -> None:
+        self._items = items
+
+    def __getitem__(self, index):
+        return self._items[index]
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator:
+        return iter(self._items)
+
+    def __contains__(self, item: Any) -> bool:
+        return item in self._items
+
+
+class IndexedFriendsView(BaseFriendsView):
+    """Друзья узла PersonGraph: номера соседей превращаются в людей при обращении.
+
+    Хранит граф и номер узла, а не сам массив, поэтому остается живым
+    и после того, как список друзей узла вынесен из общего CSR-массива.
+    """
+
+    __slots__ = ('_graph', '_index')
+
+    def __init__(self, graph: 'PersonGraph', index: int) -> None:
+        self._graph = graph
+        self._index = index
+
+    def __getitem__(self, index):
+        indices = self._graph._neighbours(self._index)
+        if isinstance(index, slice):
+            return [self._graph[i] for i in indices[index]]
+        return self._graph[indices[index]]
+
+    def __len__(self) -> int:
+        return len(self._graph._neighbours(self._index))
+
+    def __iter__(self) -> Iterator['GraphPerson']:
+        return map(self._graph.__getitem__, self._graph._neighbours(self._index))
+
+    def __contains__(self, person: Any) -> bool:
+        return isinstance(person, GraphPerson) and person._graph is self._graph \
+            and person._index in self._graph._neighbours(self._index)
+
+
+class GraphPerson:
+    """Человек внутри PersonGraph: только ссылка на граф и номер узла.
+
+    Публичный интерфейс тот же, что у Person (name, born_in, friends, add_friend,
+    add_friends), поэтому SafeSerializer и serialize_safe работают и с ним.
+    """
+
+    __slots__ = ('_graph', '_index')
+
+    def __init__(self, graph: 'PersonGraph', index: int) -> None:
+        self._graph = graph
+        self._index = index
+
+    @property
+    def index(self) -> int:
+        return self._index
+
+    @property
+    def name(self) -> str:
+        return self._graph._names[self._index]
+
+    @property
+    def born_in(self) -> dt.datetime:
+        return self._graph._born[self._index]
+
+    @property
+    def friends(self) -> IndexedFriendsView:
+        return IndexedFriendsView(self._graph, self._index)
+
+    def add_friend(self, friend: 'GraphPerson') -> None:
+        self._graph.link(self._index, self._graph._index_of(friend))
+
+    def add_friends(self, friends: Iterable['GraphPerson']) -> None:
+        self._graph.link_many(self._index, [self._graph._index_of(f) for f in friends])
+
+    def __repr__(self) -> str:
+        return f"<GraphPerson #{self._index} {self.name}>"
+
+
+class PersonGraph:
+    """Граф людей с индексной смежностью.
+
+    Имена и даты - в списках по номеру узла. Друзья хранятся как в CSR:
+    номера соседей всех узлов подряд в одном array('i') (4 байта на связь),
+    границы списков - в array('q'). Узел, которому добавили друга, получает
+    собственный массив (копия при записи); compact() снова упаковывает все в CSR.
+    Объекты GraphPerson создаются при первом обращении и дальше не меняются,
+    так что сравнение по id (traversal.preorder) работает.
+    """
+
+    __slots__ = ('_names', '_born', '_indptr', '_indices', '_packed', '_changed', '_people')
+
+    def __init__(self) -> None:
+        self._names: List[str] = []
+        self._born: List[dt.datetime] = []
+        self._changed: Dict[int, array] = {}
+        self._people: List[Optional[GraphPerson]] = []
+        self._set_csr(array('q', [0]), array('i'))
+
+    def _set_csr(self, indptr: array, indices: array) -> None:
+        self._indptr = indptr
+        self._indices = indices
+        # Срезы memoryview не копируют данные (массив после этого не растет - только заменяется)
+        self._packed = memoryview(indices)
+
+    @classmethod
+    def from_csr(cls, names: List[str], born: List[dt.datetime],
+                 indptr: Iterable[int], indices: Iterable[int]) -> 'PersonGraph':
+        """Граф из готовых массивов: друзья узла i - indices[indptr[i]:indptr[i + 1]]
+        (например, из binary_format.decode)"""
+        graph = cls()
+        graph._names = list(names)
+        graph._born = list(born)
+        graph._people = [None] * len(graph._names)
+        graph._set_csr(array('q', indptr), array('i', indices))
+        if len(graph._indptr) != len(graph._names) + 1:
+            raise ValueError(f"indptr: ожидалось {len(graph._names) + 1} границ, есть {len(graph._indptr)}")
+        return graph
+
+    @classmethod
+    def from_person(cls, root: Any, name_of: Callable[[Any], str] = lambda p: p.name,
+                    born_of: Callable[[Any], dt.datetime] = lambda p: p.born_in,
+                    friends_of: Callable[[Any], Iterable[Any]] = lambda p: p.friends) -> 'PersonGraph':
+        """Копия графа объектов Person, достижимого из root (корень получает номер 0).
+        По умолчанию поля читаются через публичный интерфейс"""
+        nodes = list(preorder(root, friends_of))
+        index = {id(p): i for i, p in enumerate(nodes)}
+        indptr, indices = array('q', [0]), array('i')
+        for p in nodes:
+            indices.extend([index[id(f)] for f in friends_of(p)])
+            indptr.append(len(indices))
+        return cls.from_csr([name_of(p) for p in nodes], [born_of(p) for p in nodes], indptr, indices)
+
+    def add_person(self, name: str, born_in: dt.datetime) -> GraphPerson:
+        index = len(self._names)
+        self._names.append(name)
+        self._born.append(born_in)
+        self._changed[index] = array('i')
+        self._people.append(None)
+        return self[index]
+
+    def _index_of(self, person: GraphPerson) -> int:
+        if not isinstance(person, GraphPerson) or person._graph is not self:
+            raise ValueError("Связывать можно только людей из одного графа")
+        return person._index
+
+    def _neighbours(self, i: int) -> Sequence:
+        """Номера друзей узла i без копирования: свой массив или срез CSR"""
+        changed = self._changed.get(i)
+        if changed is not None:
+            return changed
+        return self._packed[self._indptr[i]:self._indptr[i + 1]]
+
+    def _writable(self, i: int) -> array:
+        """Собственный массив друзей узла i (при первой записи копируется из CSR)"""
+        changed = self._changed.get(i)
+        if changed is None:
+            changed = self._changed[i] = self._indices[self._indptr[i]:self._indptr[i + 1]]
+        return changed
+
+    def link(self, i: int, j: int) -> None:
+        """Двусторонняя дружба i - j (как add_friend: повтор не добавляется)"""
+        if j not in self._neighbours(i):
+            self._writable(i).append(j)
+            self._writable(j).append(i)
+
+    def link_many(self, i: int, friends: Iterable[int]) -> None:
+        """Массовое link: повторы отсеиваются по множеству за O(deg + len(friends))"""
+        known = set(self._neighbours(i))
+        for j in friends:
+            if j not in known:
+                known.add(j)
+                self._writable(i).append(j)
+                self._writable(j).append(i)
+
+    def compact(self) -> None:
+        """Упаковывает измененные списки друзей обратно в CSR (O(V + E))"""
+        if not self._changed:
+            return
+        indptr, indices = array('q', [0]), array('i')
+        for i in range(len(self._names)):
+            indices.extend(self._neighbours(i))
+            indptr.append(len(indices))
+        self._changed.clear()
+        self._set_csr(indptr, indices)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __getitem__(self, index: int) -> GraphPerson:
+        person = self._people[index]
+        if person is None:
+            person = self._people[index] = GraphPerson(self, index)
+        return person
+
+    def __iter__(self) -> Iterator[GraphPerson]:
+        return map(self.__getitem__, range(len(self._names)))
+
+    def friend_indices(self, index: int) -> FriendsView:
+        """Номера друзей узла (только чтение, без копирования)"""
+        return FriendsView(self._neighbours(index))
+
+    def preorder(self, root: int = 0) -> Iterator[int]:
+        """Номера узлов в порядке обхода в глубину (тот же порядок, что traversal.preorder),
+        отметки посещения - bytearray, а не множество id"""
+        neighbours = self._neighbours
+        seen = bytearray(len(self._names))
+        seen[root] = 1
+        yield root
+        stack = [iter(neighbours(root))]
+        while stack:
+            for j in stack[-1]:
+                if not seen[j]:
+                    seen[j] = 1
+                    yield j
+                    stack.append(iter(neighbours(j)))
+                    break
+            else:
+                stack.pop()
+
+
+if __name__ == "__main__":
+    g = PersonGraph()
+    ruslan = g.add_person("Ruslan", dt.datetime(2000, 1, 1))
+    ivan = g.add_person("Ivan", dt.datetime(2002, 5, 5))
+    anna = g.add_person("Anna", dt.datetime(2001, 3, 3))
+    ruslan.add_friends([ivan, anna, ivan])
+    ivan.add_friend(anna)
+    g.compact()
+    print(f"Друзья {ruslan.name}: {[f.name for f in ruslan.friends]}, номера: {list(g.friend_indices(0))}")
+    print(f"CSR: indptr={g._indptr.tolist()}, indices={g._indices.tolist()}")
+    print(f"Обход: {[g[i].name for i in g.preorder()]}")
+    view = ruslan.friends
+    try:
+        view.append(ruslan)
+    except AttributeError:
+        print("Представление friends только для чтения")
+
+    from Lab3.oop_private import SafeSerializer
+    restored = SafeSerializer().decode(SafeSerializer().encode(ruslan))
+    copy = PersonGraph.from_person(restored)
+    print(f"Через SafeSerializer и обратно в граф: {[copy[i].name for i in copy.preorder()]}")
@@ -1,56 +1,104 @@
 import json
 import datetime as dt
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable, BinaryIO
+
+from Lab3 import binary_format, streaming
+from Lab3.graph import FriendsView
+from Lab3.traversal import preorder
 
 
 class Person:
+    # Без __dict__: слоты вместо словаря атрибутов на каждого человека
+    __slots__ = ('_name', '_born_in', '_friends', '_dirty')
+
     def __init__(self, name: str, born_in: dt.datetime) -> None:
         self._name = name
         self._born_in = born_in
         self._friends: List['Person'] = []
+        # Изменен ли с последнего снимка (delta.DeltaEncoder); новый - еще ни в одном снимке
+        self._dirty = True
 
     def add_friend(self, friend: 'Person') -> None:
         if friend not in self._friends:
             self._friends.append(friend)
             friend._friends.append(self)
+            self._dirty = friend._dirty = True
+
+    def add_friends(self, friends: Iterable['Person']) -> None:
+        """Массовое добавление: то же, что add_friend для каждого, но за O(deg + len(friends)) -
+        повторы отсеиваются по множеству, а не поиском в списке"""
+        known = {id(f) for f in self._friends}
+        for friend in friends:
+            if id(friend) not in known:
+                known.add(id(friend))
+                self._friends.append(friend)
+                friend._friends.append(self)
+                self._dirty = friend._dirty = True
 
     # Публичный интерфейс
     @property
     def name(self) -> str:
         return self._name
 
+    @name.setter
+    def name(self, value: str) -> None:
+        self._name = value
+        self._dirty = True
+
     @property
     def born_in(self) -> dt.datetime:
         return self._born_in
 
+    @born_in.setter
+    def born_in(self, value: dt.datetime) -> None:
+        self._born_in = value
+        self._dirty = True
+
     @property
-    def friends(self) -> List['Person']:
-        return self._friends[:]
+    def dirty(self) -> bool:
+        """Менялся ли человек (поля или друзья) с последнего mark_clean"""
+        return self._dirty
+
+    def mark_clean(self) -> None:
+        self._dirty = False
+
+    @property
+    def friends(self) -> FriendsView:
+        # Представление только для чтения: список не копируется при каждом обращении
+        return FriendsView(self._friends)
 
 
 class SafeSerializer:
-    """Сериализатор, уважающий приватность"""
+    """Сериализатор, уважающий приватность.
+
+    format='json' - читаемый JSON, format='binary' - компактный двоичный
+    формат (binary_format). decode определяет формат по данным.
+    """
+
+    def __init__(self, format: str = 'json') -> None:
+        self.format = binary_format.check_format(format)
 
     def encode(self, obj: Person) -> bytes:
-        graph = {}
-        self._scan(obj, graph)
+        if self.format == 'binary':
+            return binary_format.encode(obj, lambda p: p.name, lambda p: p.born_in, lambda p: p.friends)
+        graph = self._scan(obj)
         # Сохраняем корневой ID, чтобы знать, с кого начинать распаковку
         return json.dumps({"root": str(id(obj)), "nodes": graph}, indent=2).encode('utf-8')
 
-    def _scan(self, p: Person, graph: Dict) -> None:
-        p_id = str(id(p))
-        if p_id in graph:
-            return
-
-        graph[p_id] = {
-            "n": p.name,
-            "d": p.born_in.isoformat(),
-            "f": [str(id(friend)) for friend in p.friends]
-        }
-        for friend in p.friends:
-            self._scan(friend, graph)
+    def _scan(self, root: Person) -> Dict:
+        # Обход явным стеком: глубокие цепочки друзей не упираются в предел рекурсии
+        graph = {}
+        for p in preorder(root, lambda person: person.friends):
+            graph[str(id(p))] = {
+                "n": p.name,
+                "d": p.born_in.isoformat(),
+                "f": [str(id(friend)) for friend in p.friends]
+            }
+        return graph
 
     def decode(self, data: bytes) -> Person:
+        if binary_format.is_binary(data):
+            return self._decode_binary(data)
         raw = json.loads(data.decode('utf-8'))
         nodes = raw["nodes"]
         cache = {}
@@ -60,17 +108,34 @@ class SafeSerializer:
             dt_obj = dt.datetime.fromisoformat(props["d"])
             cache[uid] = Person(props["n"], dt_obj)
 
-        # 2. Восстанавливаем связи через публичный метод
+        # 2. Восстанавливаем связи через публичный метод. add_friends двусторонний
+        # и пропускает уже добавленных, поэтому ребро из списка второго конца не задвоится
         for uid, props in nodes.items():
-            person = cache[uid]
-            for friend_id in props["f"]:
-                friend = cache[friend_id]
-                # Проверка, чтобы не добавлять дважды т.к. add_friend двусторонний
-                if friend.name not in [f.name for f in person.friends]:
-                    person.add_friend(friend)
+            cache[uid].add_friends([cache[friend_id] for friend_id in props["f"]])
 
         return cache[raw["root"]]
 
+    def _decode_binary(self, data: bytes) -> Person:
+        graph = binary_format.decode(data)
+        # Те же правила: конструктор и публичный add_friends
+        people = [Person(name, born) for name, born in zip(graph.names, graph.born)]
+        for i, person in enumerate(people):
+            person.add_friends([people[j] for j in graph.friends_of(i)])
+        return people[0]
+
+    def encode_stream(self, obj: Person, stream: BinaryIO) -> int:
+        """Потоковая запись (streaming): узлы пишутся в stream по мере обхода, возвращает их число"""
+        return streaming.write_graph(obj, stream, lambda p: p.name, lambda p: p.born_in, lambda p: p.friends)
+
+    def decode_stream(self, source: streaming.Source) -> Person:
+        """Восстановление из потока по кускам. Связь добавляется, когда пришел
+        второй ее конец, поэтому в памяти только уже собранная часть графа"""
+        people: Dict[int, Person] = {}
+        for record in streaming.read_graph(source):
+            person = people[record.index] = Person(record.name, record.born)
+            person.add_friends([people[j] for j in record.friends if j in people])
+        return people[0]
+
 
 if __name__ == "__main__":
     print("ООП: Соблюдение инкапсуляции")
@@ -85,3 +150,12 @@ if __name__ == "__main__":
     new_p1 = serializer.decode(data)
     print(f"Восстановлен: {new_p1.name}, Друзей: {len(new_p1.friends)}")
     print(f"Имя друга: {new_p1.friends[0].name}")
+
+    binary = SafeSerializer(format='binary').encode(p1)
+    print(f"Двоичный формат: {len(binary)} байт, друг: {serializer.decode(binary).friends[0].name}")
+
+    import io
+    stream = io.BytesIO()
+    serializer.encode_stream(p1, stream)
+    chunks = [stream.getvalue()[i:i + 16] for i in range(0, len(stream.getvalue()), 16)]
+    print(f"Поток: {len(chunks)} кусков по 16 байт, друг: {serializer.decode_stream(chunks).friends[0].name}")
@@ -1,9 +1,14 @@
 import json
 import datetime as dt
-from typing import List, Dict
+from typing import List, Dict, BinaryIO
+
+from Lab3 import binary_format, streaming
+from Lab3.traversal import preorder
 
 
 class Person:
+    __slots__ = ('_name', '_born_in', '_friends')
+
     def __init__(self, name: str, born_in: dt.datetime) -> None:
         self._name = name
         self._born_in = born_in
@@ -16,30 +21,36 @@ class Person:
 
 
 class IntruderSerializer:
-    """Сериализатор-взломщик. Игнорирует правила приличия."""
+    """Сериализатор-взломщик. Игнорирует правила приличия.
 
-    def encode(self, obj: Person) -> bytes:
-        graph = {}
-        self._deep_scan(obj, graph)
-        return json.dumps({"root": str(id(obj)), "nodes": graph}, indent=2).encode('utf-8')
+    format='json' или 'binary' (binary_format); decode определяет формат по данным.
+    """
 
-    def _deep_scan(self, p: Person, graph: Dict) -> None:
-        p_id = str(id(p))
-        if p_id in graph:
-            return
+    def __init__(self, format: str = 'json') -> None:
+        self.format = binary_format.check_format(format)
 
-        # Нарушение: Прямой доступ к protected members
-        graph[p_id] = {
-            "_name": p._name,
-            "_born_in": p._born_in.isoformat(),
-            "_friends": [str(id(f)) for f in p._friends]
-        }
+    def encode(self, obj: Person) -> bytes:
+        if self.format == 'binary':
+            # Нарушение: чтение protected members
+            return binary_format.encode(obj, lambda p: p._name, lambda p: p._born_in, lambda p: p._friends)
+        graph = self._deep_scan(obj)
+        return json.dumps({"root": str(id(obj)), "nodes": graph}, indent=2).encode('utf-8')
 
-        # Нарушение: итерация по приватному списку
-        for friend in p._friends:
-            self._deep_scan(friend, graph)
+    def _deep_scan(self, root: Person) -> Dict:
+        graph = {}
+        # Нарушение: итерация по приватному списку (обход явным стеком, без рекурсии)
+        for p in preorder(root, lambda person: person._friends):
+            # Нарушение: Прямой доступ к protected members
+            graph[str(id(p))] = {
+                "_name": p._name,
+                "_born_in": p._born_in.isoformat(),
+                "_friends": [str(id(f)) for f in p._friends]
+            }
+        return graph
 
     def decode(self, data: bytes) -> Person:
+        if binary_format.is_binary(data):
+            return self._decode_binary(data)
         raw = json.loads(data.decode('utf-8'))
         nodes = raw["nodes"]
         cache = {}
@@ -59,6 +70,38 @@ class IntruderSerializer:
 
         return cache[raw["root"]]
 
+    def _decode_binary(self, data: bytes) -> Person:
+        graph = binary_format.decode(data)
+        people = [Person.__new__(Person) for _ in graph.names]
+        # Списки друзей вживляются целиком, в сохраненном порядке
+        for i, person in enumerate(people):
+            person._name = graph.names[i]
+            person._born_in = graph.born[i]
+            person._friends = [people[j] for j in graph.friends_of(i)]
+        return people[0]
+
+    def encode_stream(self, obj: Person, stream: BinaryIO) -> int:
+        """Потоковая запись: узлы пишутся в stream по мере обхода, возвращает их число"""
+        return streaming.write_graph(obj, stream, lambda p: p._name, lambda p: p._born_in, lambda p: p._friends)
+
+    def decode_stream(self, source: streaming.Source) -> Person:
+        """Восстановление из потока по кускам: на друзей, которые еще не пришли,
+        заводятся "болванки", данные вживляются, когда придет их строка"""
+        people: Dict[int, Person] = {}
+
+        def blank(index: int) -> Person:
+            person = people.get(index)
+            if person is None:
+                person = people[index] = Person.__new__(Person)
+            return person
+
+        for record in streaming.read_graph(source):
+            person = blank(record.index)
+            person._name = record.name
+            person._born_in = record.born
+            person._friends = [blank(j) for j in record.friends]
+        return people[0]
+
 
 if __name__ == "__main__":
     print("ООП: Нарушение инкапсуляции")
@@ -72,3 +115,12 @@ if __name__ == "__main__":
     new_p1 = serializer.decode(data)
     print(f"Восстановлен (через взлом): {new_p1._name}")
     print(f"Друг (приватное поле): {new_p1._friends[0]._name}")
+
+    binary = IntruderSerializer(format='binary').encode(p1)
+    print(f"Двоичный формат: {len(binary)} байт против {len(data)} в JSON")
+
+    import io
+    stream = io.BytesIO()
+    serializer.encode_stream(p1, stream)
+    stream.seek(0)
+    print(f"Из потока: {serializer.decode_stream(stream)._friends[0]._name}")
@@ -0,0 +1,83 @@
+import datetime as dt
+import json
+from typing import Any, BinaryIO, Callable, Dict, Iterable, Iterator, List, NamedTuple, Union
+
+from Lab3.traversal import preorder
+
+# Потоковый формат графа Person (NDJSON, UTF-8): одна JSON-строка на строку файла.
+#   первая строка - заголовок {"graph": "lab3", "version": 1};
+#   дальше по строке на узел в порядке обхода: {"i": номер, "n": имя, "d": дата ISO, "f": [номера друзей]}.
+# Номер узлу выдается при первом упоминании (корень - 0), поэтому друзья могут
+# ссылаться на узлы, которые придут позже. Ни весь реестр, ни вся строка JSON
+# в памяти не собираются: узел пишется, как только обход до него дошел.
+HEADER = {"graph": "lab3", "version": 1}
+# Размер куска при чтении из файла
+CHUNK_SIZE = 1 << 16
+
+# Источник для декодера: двоичный файл (есть read) или любые куски байт (генератор, список)
+Source = Union[BinaryIO, Iterable[bytes]]
+
+
+class NodeRecord(NamedTuple):
+    """Один узел из потока: номер, имя, дата рождения, номера друзей"""
+    index: int
+    name: str
+    born: dt.datetime
+    friends: List[int]
+
+
+def write_graph(root: Any, stream: BinaryIO, name_of: Callable[[Any], str],
+                born_of: Callable[[Any], dt.datetime], friends_of: Callable[[Any], Iterable[Any]]) -> int:
+    """Пишет граф, достижимый из root, в двоичный файловый объект; возвращает число узлов.
+
+    Доступ к полям - через переданные функции, как в binary_format.
+    """
+    index: Dict[int, int] = {id(root): 0}
+    stream.write(json.dumps(HEADER).encode('utf-8') + b'\n')
+    count = 0
+    for p in preorder(root, friends_of):
+        friends = [index.setdefault(id(f), len(index)) for f in friends_of(p)]
+        record = {"i": index[id(p)], "n": name_of(p), "d": born_of(p).isoformat(), "f": friends}
+        stream.write(json.dumps(record, ensure_ascii=False).encode('utf-8') + b'\n')
+        count += 1
+    return count
+
+
+def _chunks(source: Source) -> Iterator[bytes]:
+    if hasattr(source, 'read'):
+        while chunk := source.read(CHUNK_SIZE):
+            yield chunk
+    else:
+        yield from source
+
+
+def _lines(source: Source) -> Iterator[bytes]:
+    """Строки потока по мере поступления кусков (куски могут резать строки где угодно)"""
+    tail = b''
+    for chunk in _chunks(source):
+        lines = (tail + chunk).split(b'\n')
+        tail = lines.pop()
+        yield from lines
+    if tail:
+        yield tail
+
+
+def read_graph(source: Source) -> Iterator[NodeRecord]:
+    """Генератор узлов из потока: в памяти только текущая строка и недочитанный кусок.
+
+    Проверяет заголовок и то, что все упомянутые узлы пришли (иначе поток оборван).
+    """
+    lines = (line for line in _lines(source) if line.strip())
+    header = next(lines, None)
+    if header is None or json.loads(header) != HEADER:
+        raise ValueError("Не поток графа (нет заголовка или другая версия)")
+    count = referenced = 0
+    for line in lines:
+        raw = json.loads(line)
+        friends = raw["f"]
+        if friends:
+            referenced = max(referenced, max(friends) + 1)
+        count += 1
+        yield NodeRecord(raw["i"], raw["n"], dt.datetime.fromisoformat(raw["d"]), friends)
+    if count < referenced or not count:
+        raise ValueError(f"Поток оборван: узлов {count}, упомянуто {max(referenced, 1)}")
@@ -0,0 +1,26 @@
+from typing import Callable, Iterable, Iterator, List, Set, TypeVar
+
+T = TypeVar('T')
+
+
+def preorder(root: T, neighbours: Callable[[T], Iterable[T]]) -> Iterator[T]:
+    """Обход графа в глубину без рекурсии: каждый узел - один раз, при первом посещении.
+
+    Порядок тот же, что у рекурсивного visit(p): сначала сам узел, затем по очереди
+    его соседи со всеми их потомками. Вместо стека вызовов - список итераторов
+    по соседям, поэтому глубина графа (цепочка из миллиона друзей) ограничена
+    только памятью, а не пределом рекурсии. Узлы различаются по id().
+    """
+    seen: Set[int] = {id(root)}
+    yield root
+    stack: List[Iterator[T]] = [iter(neighbours(root))]
+    while stack:
+        for node in stack[-1]:
+            if id(node) not in seen:
+                seen.add(id(node))
+                yield node
+                stack.append(iter(neighbours(node)))
+                break
+        else:
+            # Соседи узла на вершине стека закончились - возвращаемся к родителю
+            stack.pop()